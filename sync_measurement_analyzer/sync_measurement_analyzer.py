@@ -1869,10 +1869,11 @@ def reload_original_data(n_clicks, store_data, unsaved_data):
      Output('action-feedback-store', 'data', allow_duplicate=True),
      Output('unsaved-changes-store', 'data', allow_duplicate=True)],
     Input('reload-compare-button', 'n_clicks'),
-    State('compare-data-store', 'data'),
+    [State('compare-data-store', 'data'),
+     State('unsaved-changes-store', 'data')],
     prevent_initial_call=True
 )
-def reload_compare_data(n_clicks, store_data):
+def reload_compare_data(n_clicks, store_data, unsaved_data):
     if not n_clicks or not store_data or not store_data.get('filename'):
         raise dash.exceptions.PreventUpdate
     
@@ -1892,10 +1893,9 @@ def reload_compare_data(n_clicks, store_data):
     if new_store_data:
         new_store_data['filename'] = filepath
         # Since we are reloading, this file is now considered "saved"
-        # We need to read the current state of unsaved changes and update it.
-        current_unsaved = dash.callback_context.states['unsaved-changes-store.data']
-        current_unsaved['Comparison'] = False
-        return new_store_data, feedback, current_unsaved
+        new_unsaved_data = unsaved_data.copy()
+        new_unsaved_data['Comparison'] = False
+        return new_store_data, feedback, new_unsaved_data
     else:
         return dash.no_update, feedback, dash.no_update
 
@@ -2140,8 +2140,8 @@ def update_progress_graph_and_time(sort_state, window_index, original_data, comp
         if not df.empty:
             min_block = df['Block_height'].min()
             max_block = df['Block_height'].max()
-            # Use unique and sorted values for dropdowns
-            unique_heights = sorted(df['Block_height'].unique())
+            # Use unique and sorted values for dropdowns (np.unique sorts in C; tolist() unboxes in one pass)
+            unique_heights = np.unique(df['Block_height'].to_numpy()).tolist()
             info['options'] = [{'label': f"{int(h):,}", 'value': h} for h in unique_heights]
             
             current_start = start_block_inputs.get(prefix)
@@ -51,7 +51,7 @@ if (-not (Test-Path $PipExe)) {
 
 # 3. Install required packages
 Write-Host "Installing/updating required Python packages..."
-$Packages = @("pandas", "dash", "dash-bootstrap-components", "plotly")
+$Packages = @("pandas", "dash", "dash-bootstrap-components", "plotly", "flask-caching", "pyarrow", "orjson")
 foreach ($pkg in $Packages) {
     Write-Host " - Installing $pkg..."
     & $PythonExe -m pip install --upgrade $pkg
@@ -7,8 +7,11 @@ def upgrade_dependencies():
     try:
         # Using a single call to pip is more efficient. Add scipy for KDE plot.
         # Kaleido is added for robust static image export and figure generation.
+        # Flask-Caching keeps parsed DataFrames on the server instead of in the browser store.
+        # PyArrow provides a multithreaded CSV reader for large sync_progress.csv files.
+        # orjson is used by Plotly to serialize figures (including NumPy arrays) much faster than the json module.
         subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--upgrade", "dash", "dash-bootstrap-components", "pandas", "plotly", "scipy", "kaleido"],
+            [sys.executable, "-m", "pip", "install", "--upgrade", "dash", "dash-bootstrap-components", "pandas", "plotly", "scipy", "kaleido", "flask-caching", "pyarrow", "orjson"],
             check=True, capture_output=True, text=True, timeout=300 # 5 minute timeout
         )
         print("Dependencies are up to date.")
@@ -22,22 +25,65 @@ upgrade_dependencies()
 
 import pandas as pd
 import dash
-from dash import dcc, html
+from dash import dcc, html, Patch
 from dash.dependencies import Input, Output, State, ClientsideFunction
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import base64
 import io
 from datetime import timedelta
+from functools import lru_cache
 import datetime
 import numpy as np
 from scipy.stats import gaussian_kde
 from plotly.subplots import make_subplots
+from flask import request, jsonify, send_from_directory
+from flask_caching import Cache
+import hashlib
 import os
-import webbrowser
+import threading
 import traceback
+import uuid
 import re
 
+# --- Optional fast CSV reader and columnar serialization ---
+# PyArrow's CSV reader is multithreaded and its IPC format is used for cached DataFrames.
+# If it is missing, pandas' C engine is used and DataFrames are cached as-is.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# --- Optional JIT compilation ---
+# Numba is optional. If it is installed, the per-row speed kernel is JIT-compiled;
+# otherwise the equivalent vectorized NumPy implementation is used.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# --- Optional fast JSON serialization ---
+# With orjson installed, Plotly serializes figures with it instead of the standard json module.
+try:
+    import orjson  # noqa: F401 (Plotly imports it lazily; imported here to check availability)
+    import plotly.io as pio
+    pio.json.config.default_engine = 'orjson'
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# --- Optional moving-window functions ---
+# Bottleneck's move_mean is a C implementation of the rolling mean used for the MA traces.
+# If it is missing, pandas' rolling mean is used.
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
 # --- Monkey-patching for older Dash versions ---
 # This is a workaround for older Dash versions where 'loading_state' might not be
 # a registered property on all components, causing validation errors.
@@ -63,12 +109,18 @@ except Exception as e:
 # --- SCRIPT DIRECTORY ---
 # Use the real path to resolve any symlinks and get the directory of the script
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+REPORTS_DIR = os.path.join(SCRIPT_DIR, "reports")
 
 # --- JavaScript for Report Generation ---
 REPORT_GENERATOR_JS = """
 window.dash_clientside = window.dash_clientside || {};
 window.dash_clientside.clientside = window.dash_clientside.clientside || {};
 
+// Native structured cloning copies figures in a single pass; older browsers fall back to a JSON round-trip.
+const deepCopy = (typeof structuredClone === 'function')
+    ? (obj => structuredClone(obj))
+    : (obj => JSON.parse(JSON.stringify(obj)));
+
 window.dash_clientside.clientside.reset_upload_component = function(upload_id, n_clicks) {
     if (!upload_id) {
         return window.dash_clientside.no_update;
@@ -78,8 +130,12 @@ window.dash_clientside.clientside.reset_upload_component = function(upload_id, n
     // This is more reliable than trying to set `contents` to null from the server.
     const uploadElement = document.getElementById(upload_id);
     if (uploadElement) {
-        // The actual clickable element is often a div or span inside the main component
-        const removeButton = uploadElement.querySelector('div > div > span');
+        // The actual clickable element is often a div or span inside the main component.
+        // Remember it on the upload node and only search again once Dash has re-rendered it away.
+        let removeButton = uploadElement.__removeButton;
+        if (!removeButton || !uploadElement.contains(removeButton)) {
+            removeButton = uploadElement.__removeButton = uploadElement.querySelector('div > div > span');
+        }
         if (removeButton) {
             removeButton.click();
         }
@@ -95,7 +151,7 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
     try {
         const rootElement = document.documentElement;
         if (!rootElement) {
-            return 'CLIENTSIDE_ERROR: root element (html) not found.';
+            return [{ title: 'Error Saving Reports', body: 'A client-side error occurred: root element (html) not found.' }, null];
         }
         // Clone the container to avoid modifying the live DOM
         const clone = rootElement.cloneNode(true);
@@ -122,7 +178,7 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
         });
 
         // 2. Metadata Inputs
-        clone.querySelectorAll('input[id*="metadata-input"]').forEach(input => {
+        clone.querySelectorAll('input[name^="metadata-input:"]').forEach(input => {
             if (input.parentElement) {
                 const valueText = input.value || 'N/A';
                 const staticEl = document.createElement('div');
@@ -137,7 +193,7 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
         const selectorsToRemove = [
             // General UI controls
             '#save-button', '#theme-switch', '.bi-sun-fill', '.bi-moon-stars-fill',
-            '#show-data-table-switch-container', '#original-upload-container', '#compare-upload-container', 'span[id*="info-icon"]',
+            '#show-data-table-switch-container', '#raw-table-pagination-container', '#original-upload-container', '#compare-upload-container', 'span[data-metric]',
             'script', '#loading-overlay',
             '#_dash-dev-tools-ui-container', // Dash Dev Tools main container
             // Dash developer/debug panels and error overlays (Dash 3.x)
@@ -168,7 +224,7 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
             '#reload-original-button', '#reload-compare-button',
             '#discard-original-button', '#discard-compare-button',
             // Individual metadata controls
-            'span[id*="delete-metadata-button"]',
+            'span[data-delete]',
             'span[id*="unsaved-changes-badge"]'
         ];
         // Remove any undefined or empty selectors to avoid JS errors
@@ -188,10 +244,15 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
             'button[id*="reset-view-button"]', // The entire bar with Reset, Clear, and Save buttons
             'button[id*="save-overwrite-button"]'
         ];
-        clone.querySelectorAll(rowSelectorsToRemove.join(', ')).forEach(el => {
-            const parentRow = el.closest('.list-group-item');
-            if (parentRow) parentRow.remove();
-        });
+        if (CSS.supports('selector(:has(*))')) {
+            // Let the selector engine match the rows directly
+            clone.querySelectorAll(rowSelectorsToRemove.map(sel => `.list-group-item:has(${sel})`).join(', ')).forEach(el => el.remove());
+        } else {
+            clone.querySelectorAll(rowSelectorsToRemove.join(', ')).forEach(el => {
+                const parentRow = el.closest('.list-group-item');
+                if (parentRow) parentRow.remove();
+            });
+        }
 
         // --- Convert all Plotly graphs to static images ---
         const graphsToConvert = [
@@ -203,111 +264,133 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
             { id: 'distribution-graph-time-delta-count', figure: distribution_figure_time_delta_count }
         ];
 
-        for (const graphInfo of graphsToConvert) {
-            const graphDiv = clone.querySelector(`#${graphInfo.id}`);
-            const originalGraphDiv = document.getElementById(graphInfo.id);
-
-            if (graphDiv && originalGraphDiv && window.Plotly && graphInfo.figure) {
-                const tempDiv = document.createElement('div');
-                // Position it off-screen
-                tempDiv.style.position = 'absolute';
-                tempDiv.style.left = '-9999px';
-                tempDiv.style.width = originalGraphDiv.offsetWidth + 'px';
-                tempDiv.style.height = originalGraphDiv.offsetHeight + 'px';
-                document.body.appendChild(tempDiv);
-
-                try {
-                    // Deep copy the figure object for this iteration to prevent race conditions.
-                    // This ensures that modifications to layout for one graph don't affect
-                    // the rendering of another graph that might be processing asynchronously.
-                    const figureCopy = JSON.parse(JSON.stringify(graphInfo.figure));
-                    const data = figureCopy.data;
-                    const layout = figureCopy.layout;
-
-                    if (isDarkTheme) {
-                        layout.paper_bgcolor = '#222529'; // Darkly theme background
-                        layout.plot_bgcolor = '#222529';
-                    }
+        // One off-screen host holds the temporary plot divs, so the document body is only touched
+        // once on the way in and once on the way out instead of for every graph.
+        const offscreenHost = document.createElement('div');
+        offscreenHost.style.cssText = 'position:absolute;left:-9999px;top:0';
+        document.body.appendChild(offscreenHost);
+
+        // Rasterize all graphs concurrently; each works on its own div and figure copy.
+        try {
+            await Promise.all(graphsToConvert.map(async graphInfo => {
+                const graphDiv = clone.querySelector(`#${graphInfo.id}`);
+                const originalGraphDiv = document.getElementById(graphInfo.id);
+
+                if (graphDiv && originalGraphDiv && window.Plotly && graphInfo.figure) {
+                    const tempDiv = document.createElement('div');
+                    tempDiv.style.width = originalGraphDiv.offsetWidth + 'px';
+                    tempDiv.style.height = originalGraphDiv.offsetHeight + 'px';
+                    offscreenHost.appendChild(tempDiv);
+
+                    try {
+                        // Deep copy the figure object so that the layout tweaks below never touch the
+                        // live figure or another graph being converted concurrently.
+                        const figureCopy = deepCopy(graphInfo.figure);
+                        const data = figureCopy.data;
+                        const layout = figureCopy.layout;
+
+                        if (isDarkTheme) {
+                            layout.paper_bgcolor = '#222529'; // Darkly theme background
+                            layout.plot_bgcolor = '#222529';
+                        }
 
-                    // Increase font sizes for better readability in the saved image
-                    const fontSizeIncrease = 6; // Increase font size by 6 points
+                        // Increase font sizes for better readability in the saved image
+                        const fontSizeIncrease = 6; // Increase font size by 6 points
 
-                    if (layout.title) { // Ensure title object exists
-                        layout.title = (typeof layout.title === 'string') ? { text: layout.title } : layout.title;
-                    } else {
-                        layout.title = {};
-                    }
-                    layout.title.font = layout.title.font || {};
-                    layout.title.font.size = (layout.title.font.size || 16) + fontSizeIncrease;
-                    ['xaxis', 'yaxis', 'xaxis2', 'yaxis2'].forEach(axis => {
-                        if (layout[axis]) {
-                            layout[axis].title = layout[axis].title || {};
-                            layout[axis].title.font = layout[axis].title.font || {};
-                            layout[axis].title.font.size = (layout[axis].title.font.size || 12) + fontSizeIncrease + 2;
-                            layout[axis].tickfont = layout[axis].tickfont || {};
-                            layout[axis].tickfont.size = (layout[axis].tickfont.size || 12) + fontSizeIncrease;
+                        if (layout.title) { // Ensure title object exists
+                            layout.title = (typeof layout.title === 'string') ? { text: layout.title } : layout.title;
+                        } else {
+                            layout.title = {};
                         }
-                    });
-                    // Handle single or multiple legends
-                    const legends = ['legend', 'legend1', 'legend2'];
-                    for (const legendName of legends) {
-                        if (layout[legendName]) {
-                            layout[legendName].font = layout[legendName].font || {};
-                                layout[legendName].font.size = (layout[legendName].font.size || 10) + fontSizeIncrease;
+                        layout.title.font = layout.title.font || {};
+                        layout.title.font.size = (layout.title.font.size || 16) + fontSizeIncrease;
+                        ['xaxis', 'yaxis', 'xaxis2', 'yaxis2'].forEach(axis => {
+                            if (layout[axis]) {
+                                layout[axis].title = layout[axis].title || {};
+                                layout[axis].title.font = layout[axis].title.font || {};
+                                layout[axis].title.font.size = (layout[axis].title.font.size || 12) + fontSizeIncrease + 2;
+                                layout[axis].tickfont = layout[axis].tickfont || {};
+                                layout[axis].tickfont.size = (layout[axis].tickfont.size || 12) + fontSizeIncrease;
+                            }
+                        });
+                        // Handle single or multiple legends
+                        const legends = ['legend', 'legend1', 'legend2'];
+                        for (const legendName of legends) {
+                            if (layout[legendName]) {
+                                layout[legendName].font = layout[legendName].font || {};
+                                    layout[legendName].font.size = (layout[legendName].font.size || 10) + fontSizeIncrease;
+                            }
                         }
-                    }
-
-                    await window.Plotly.newPlot(tempDiv, data, layout, {displayModeBar: false});
 
-                    const dataUrl = await window.Plotly.toImage(tempDiv, {
-                        format: 'png',
-                        height: originalGraphDiv.offsetHeight * 1.5,
-                        width: originalGraphDiv.offsetWidth * 1.5,
-                        scale: 2
-                    });
-
-                    const img = document.createElement('img');
-                    img.src = dataUrl;
-                    img.style.width = '100%';
-                    img.style.height = 'auto';
-                    graphDiv.parentNode.replaceChild(img, graphDiv);
-                } catch (e) {
-                    console.error(`Plotly.toImage failed for ${graphInfo.id}:`, e);
+                        await window.Plotly.react(tempDiv, data, layout, {displayModeBar: false});
+
+                        // The 1.5x dimensions already give a sharper image; no extra scale factor needed
+                        const dataUrl = await window.Plotly.toImage(tempDiv, {
+                            format: 'png',
+                            height: originalGraphDiv.offsetHeight * 1.5,
+                            width: originalGraphDiv.offsetWidth * 1.5
+                        });
+
+                        const img = document.createElement('img');
+                        img.src = dataUrl;
+                        img.style.width = '100%';
+                        img.style.height = 'auto';
+                        graphDiv.parentNode.replaceChild(img, graphDiv);
+                    } catch (e) {
+                        console.error(`Plotly.toImage failed for ${graphInfo.id}:`, e);
+                        const p = document.createElement('p');
+                        p.innerText = '[Error converting chart to image]';
+                        p.style.color = 'red';
+                        graphDiv.parentNode.replaceChild(p, graphDiv);
+                    } finally {
+                        window.Plotly.purge(tempDiv);
+                    }
+                } else if (graphDiv && graphDiv.parentNode) {
                     const p = document.createElement('p');
-                    p.innerText = '[Error converting chart to image]';
-                    p.style.color = 'red';
+                    p.innerText = '[Chart not included in this report version.]';
                     graphDiv.parentNode.replaceChild(p, graphDiv);
-                } finally {
-                    document.body.removeChild(tempDiv);
                 }
-            } else if (graphDiv && graphDiv.parentNode) {
-                const p = document.createElement('p');
-                p.innerText = '[Chart not included in this report version.]';
-                graphDiv.parentNode.replaceChild(p, graphDiv);
-            }
+            }));
+        } finally {
+            document.body.removeChild(offscreenHost);
         }
 
         // --- Fetch and embed CSS ---
-        let cssText = '';
+        // The aggregated CSS is kept in sessionStorage, keyed by the loaded stylesheets (a theme switch
+        // changes the key), so only the first save of a session fetches and joins them.
         const styleSheets = Array.from(document.styleSheets);
-        const cssPromises = styleSheets.map(sheet => {
-            try {
-                // For external stylesheets, fetch the content
-                if (sheet.href) {
-                    return fetch(sheet.href)
-                        .then(response => response.ok ? response.text() : '')
-                        .catch(() => '');
-                } else if (sheet.cssRules) {
-                    return Promise.resolve(Array.from(sheet.cssRules).map(rule => rule.cssText).join('\\n'));
+        const cssCacheKey = 'cssCache:' + styleSheets.map(sheet => sheet.href || '').join('|');
+        let cssText = null;
+        try {
+            cssText = sessionStorage.getItem(cssCacheKey);
+        } catch (e) {
+            // sessionStorage may be unavailable; fall back to fetching
+        }
+        if (cssText === null) {
+            const cssPromises = styleSheets.map(sheet => {
+                try {
+                    // For external stylesheets, fetch the content
+                    if (sheet.href) {
+                        return fetch(sheet.href)
+                            .then(response => response.ok ? response.text() : '')
+                            .catch(() => '');
+                    } else if (sheet.cssRules) {
+                        return Promise.resolve(Array.from(sheet.cssRules).map(rule => rule.cssText).join('\\n'));
+                    }
+                } catch (e) {
+                    // Silently fail on security errors for cross-origin stylesheets
                 }
+                return undefined; // Return undefined for sheets that can't be processed
+            }).filter(p => p); // Filter out undefined promises
+
+            const cssContents = await Promise.all(cssPromises);
+            cssText = cssContents.join('\\n'); // Use '\\n' for JS newlines
+            try {
+                sessionStorage.setItem(cssCacheKey, cssText);
             } catch (e) {
-                // Silently fail on security errors for cross-origin stylesheets
+                // e.g. QuotaExceededError: the CSS is simply collected again on the next save
             }
-            return undefined; // Return undefined for sheets that can't be processed
-        }).filter(p => p); // Filter out undefined promises
-
-        const cssContents = await Promise.all(cssPromises);
-        cssText = cssContents.join('\\n'); // Use '\\n' for JS newlines
+        }
 
         // --- Escape backticks and other problematic characters ---
         const cleanCssText = cssText.replace(/`/g, '\\`');
@@ -319,12 +402,21 @@ window.dash_clientside.clientside.report_generator = async function(n_clicks, ma
             <body>${clone.querySelector('body').innerHTML}</body>
             </html>
         `;
-        console.log("Returning fullHtml:", typeof fullHtml, fullHtml ? fullHtml.length : 0);
-        return { content: fullHtml };
+
+        // Post the document straight to the server instead of passing it through a Dash store
+        const response = await fetch('/_save_report', {
+            method: 'POST',
+            headers: { 'Content-Type': 'text/html; charset=utf-8' },
+            body: fullHtml
+        });
+        const result = await response.json();
+        if (!response.ok) {
+            return [{ title: 'Error Saving Reports', body: `An error occurred while saving the file on the server: ${result.error}` }, null];
+        }
+        return [{ title: 'Reports Saved', body: `Reports are being saved to: ${result.filepath}` }, result.filepath];
     } catch (e) {
             console.error("⚠️ CLIENTSIDE CALLBACK ERROR:", e);
-            alert('Caught an error in callback: ' + e.message);
-            return { content: 'CLIENTSIDE_ERROR: ' + e.message + '\\n' + e.stack };
+            return [{ title: 'Error Saving Reports', body: 'A client-side error occurred during report generation: ' + e.message }, null];
     }
 }
 
@@ -347,6 +439,133 @@ window.dash_clientside.clientside.sync_sliders = function(...slider_values) {
     const outputs = Array(ctx.outputs_list.length).fill(changed_value);
     return outputs;
 };
+
+// --- Metadata rows ---
+// Dash component specs built in the browser, so the server only has to send the metadata dict.
+const htmlComponent = (type, props) => ({namespace: 'dash_html_components', type: type, props: props});
+const dbcComponent = (type, props) => ({namespace: 'dash_bootstrap_components', type: type, props: props});
+
+// Props shared by every row
+const metadataIconStyle = {fontSize: '1.1em'};
+const metadataInfoIconStyle = {cursor: 'pointer', marginLeft: '5px', fontSize: '1.1em'};
+const metadataDeleteStyle = {cursor: 'pointer'};
+const metadataKeyStyle = {whiteSpace: 'nowrap', marginRight: '10px'};
+const metadataValueStyle = {flexGrow: 1, minWidth: 0};
+const metadataInputStyle = {border: 'none', backgroundColor: 'transparent', boxShadow: 'none', padding: '0', margin: '0', height: 'auto', width: '100%'};
+const metadataRowClass = 'd-flex justify-content-between align-items-center p-2';
+const metadataInputPrefix = 'metadata-input:';
+
+function metadataRow(prefix, key, value, hasTooltip) {
+    const keyWithIcon = [htmlComponent('B', {children: key + ':'})];
+    if (hasTooltip) {
+        // Make the ID unique by prefixing it with the card type (Original/Comparison)
+        keyWithIcon.push(htmlComponent('Span', {
+            'data-metric': prefix + '-' + key,
+            className: 'bi bi-info-circle-fill text-info align-middle',
+            style: metadataInfoIconStyle,
+            title: 'Click for more info'
+        }));
+    }
+    const deleteButton = htmlComponent('Span', {
+        'data-delete': '1', 'data-prefix': prefix, 'data-key': key,
+        children: [htmlComponent('I', {className: 'bi bi-dash-circle-fill text-danger align-middle', style: metadataIconStyle})],
+        style: metadataDeleteStyle,
+        title: 'Delete item',
+        className: 'ms-2'
+    });
+    return dbcComponent('ListGroupItem', {
+        className: metadataRowClass,
+        children: [
+            // Key (label) part, prevent wrapping
+            htmlComponent('Div', {children: keyWithIcon, className: 'd-flex align-items-center', style: metadataKeyStyle}),
+            // Value (input) part, allow it to grow
+            htmlComponent('Div', {
+                className: 'd-flex align-items-center w-100',
+                style: metadataValueStyle,
+                children: [
+                    // dbc.Input does not forward data-* attributes, so the row is identified by the name attribute
+                    dbcComponent('Input', {
+                        name: metadataInputPrefix + JSON.stringify([prefix, key]),
+                        value: typeof value === 'string' ? value : String(value), type: 'text', className: 'text-end text-muted', size: 'sm',
+                        style: metadataInputStyle,
+                        debounce: true
+                    }),
+                    deleteButton
+                ]
+            })
+        ]
+    });
+}
+
+// One delegated listener handles the delete buttons of all metadata rows
+document.addEventListener('click', function(event) {
+    const deleteButton = event.target.closest('[data-delete]');
+    if (!deleteButton || !window.dash_clientside.set_props) {
+        return;
+    }
+    window.dash_clientside.set_props('delete-request-store', {
+        data: {prefix: deleteButton.dataset.prefix, key: deleteButton.dataset.key, ts: Date.now()}
+    });
+});
+
+// Committed metadata edits (Enter or blur) from all rows are buffered and sent to the server together
+let pendingMetadataEdits = {};
+let metadataEditTimer = null;
+document.addEventListener('change', function(event) {
+    const input = event.target;
+    if (!input.name || !input.name.startsWith(metadataInputPrefix) || !window.dash_clientside.set_props) {
+        return;
+    }
+    const [prefix, key] = JSON.parse(input.name.slice(metadataInputPrefix.length));
+    const edits = pendingMetadataEdits[prefix] = pendingMetadataEdits[prefix] || {};
+    edits[key] = input.value;
+    clearTimeout(metadataEditTimer);
+    metadataEditTimer = setTimeout(() => {
+        window.dash_clientside.set_props('metadata-edit-store', {data: pendingMetadataEdits});
+        pendingMetadataEdits = {};
+    }, 300);
+}, {passive: true});
+
+// One delegated listener opens the tooltip modal for every info icon
+document.addEventListener('click', function(event) {
+    const infoIcon = event.target.closest('[data-metric]');
+    if (!infoIcon || !window.dash_clientside.set_props) {
+        return;
+    }
+    window.dash_clientside.set_props('info-request-store', {
+        data: {metric: infoIcon.dataset.metric, ts: Date.now()}
+    });
+});
+
+window.dash_clientside.clientside.render_metadata_rows = function(original_metadata, compare_metadata, layout) {
+    const metadataByPrefix = {Original: original_metadata, Comparison: compare_metadata};
+    const preferredOrder = layout.preferred_order;
+    const preferredKeys = new Set(preferredOrder);
+    const tooltipKeys = new Set(layout.tooltip_keys);
+    return window.dash_clientside.callback_context.outputs_list.map(output => {
+        const prefix = output.id.prefix;
+        const metadata = metadataByPrefix[prefix] || {};
+        // Preferred keys first, in the specified order, then any other keys
+        const keys = preferredOrder.filter(key => key in metadata)
+            .concat(Object.keys(metadata).filter(key => !preferredKeys.has(key)));
+        return keys.map(key => metadataRow(prefix, key, metadata[key], tooltipKeys.has(key)));
+    });
+};
+
+window.dash_clientside.clientside.open_report = function(n_clicks, filepath) {
+    // Opened in the current browser through the server, since pages served over http may not open file:// URLs
+    if (n_clicks && filepath) {
+        window.open('/_reports/' + encodeURIComponent(filepath.split(/[\\\\/]/).pop()), '_blank');
+    }
+    return window.dash_clientside.no_update;
+};
+
+window.dash_clientside.clientside.toggle_file_buttons = function(data) {
+    // Discard is shown for any loaded file, Reload only if the file has a path to reload from.
+    const discard_style = data ? {display: 'inline-block'} : {display: 'none'};
+    const reload_style = data && data.filename ? {display: 'inline-block'} : {display: 'none'};
+    return [discard_style, reload_style];
+};
 """
 
 # --- CSS and Asset Management ---
@@ -544,14 +763,12 @@ def setup_directories():
         os.makedirs(measurements_dir)
         print(f"Info: Created 'measurements' directory at: {measurements_dir}")
 
+    # Reports directory for saved HTML reports
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+
 # --- Helper Functions ---
-def find_header_row(lines):
-    """Finds the index of the header row in a list of lines by looking for key columns."""
-    for i, line in enumerate(lines):
-        # A good heuristic for the header is the presence of 'Block_height' and multiple semicolons
-        if ('Block_height' in line or 'Block_timestamp' in line) and line.count(';') >= 2:
-            return i
-    return 0 # Fallback to the first line if no specific header is found
+# A good heuristic for the header is a line with 'Block_height' (or 'Block_timestamp') and multiple semicolons
+header_line_pattern = re.compile(rb'^(?=[^\n]*(?:Block_height|Block_timestamp))(?:[^\n;]*;){2}', re.MULTILINE)
 
 def extract_metadata(lines):
     """Extracts key-value metadata from the initial lines of the CSV."""
@@ -572,23 +789,102 @@ def extract_metadata(lines):
                 metadata[parts[0]] = parts[1]
     return metadata
 
+def decode_upload_contents(contents):
+    """Decodes the base64 payload of a dcc.Upload data URL ('data:<type>;base64,<payload>') into bytes."""
+    # Slice once after the header instead of splitting the (potentially very large) string into a list
+    payload_start = contents.index(',') + 1
+    return base64.b64decode(contents[payload_start:])
+
+def parse_progress_csv(raw_bytes):
+    """
+    Parses the raw bytes of a sync_progress.csv file and returns (df, metadata).
+    The header row is located with a single bytes-level regex search; only the metadata
+    preamble before it is decoded, and the data section is handed to pandas' C parser as
+    bytes, so the whole file is never materialized as a str.
+    """
+    header_match = header_line_pattern.search(raw_bytes)
+    header_offset = header_match.start() if header_match else 0 # Fallback to the first line if no specific header is found
+    preamble_lines = raw_bytes[:header_offset].decode('utf-8').splitlines()
+
+    metadata = extract_metadata(preamble_lines)
+    df = None
+    if PYARROW_AVAILABLE:
+        try:
+            table = pv.read_csv(
+                io.BytesIO(raw_bytes[header_offset:]),
+                read_options=pv.ReadOptions(use_threads=True),
+                parse_options=pv.ParseOptions(delimiter=';')
+            )
+            df = table.to_pandas()
+        except Exception as e:
+            # e.g. duplicate or empty column names that Arrow rejects; pandas is more lenient
+            print(f"Info: PyArrow CSV reader failed ({e}). Falling back to the pandas parser.")
+    if df is None:
+        df = pd.read_csv(io.BytesIO(raw_bytes[header_offset:]), sep=';', engine='c')
+    df.columns = df.columns.str.strip() # Sanitize column names
+    return df, metadata
+
+def cache_dataframe(df, key=None, filename=""):
+    """
+    Stores a parsed DataFrame in the server-side cache and returns its cache key.
+    The processed form used by the graphs is computed right away as well, so the first
+    graph update after a load does not have to run process_progress_df.
+    """
+    if key is None:
+        # Derive a content-based key for DataFrames that were not read from raw file bytes
+        hashed = pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+        key = hashlib.sha1(hashed + "|".join(map(str, df.columns)).encode('utf-8')).hexdigest()
+    data_cache.set(key, dataframe_to_ipc(df))
+    cache_processed_df(key, df, filename)
+    return key
+
+def load_store_df(store_data):
+    """Returns the DataFrame referenced by a data store, or an empty DataFrame if it is not cached."""
+    if not store_data or not store_data.get('cache_key'):
+        return pd.DataFrame()
+    payload = data_cache.get(store_data['cache_key'])
+    if payload is None:
+        print(f"Warning: Cached data for '{store_data.get('filename')}' is no longer available. Please reload the file.")
+        return pd.DataFrame()
+    return dataframe_from_ipc(payload)
+
+def dataframe_to_ipc(df):
+    """Serializes a DataFrame to Arrow IPC stream bytes (columnar, binary). Returns the DataFrame unchanged without PyArrow."""
+    if not PYARROW_AVAILABLE:
+        return df
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # e.g. object columns with mixed types; keep the DataFrame as-is
+        print(f"Info: Could not serialize DataFrame to Arrow IPC ({e}). Caching it directly.")
+        return df
+
+def dataframe_from_ipc(payload):
+    """Restores a DataFrame serialized by dataframe_to_ipc()."""
+    if isinstance(payload, pd.DataFrame):
+        return payload
+    # The table is private to this call, so its buffers can be released column by column during conversion
+    return pa.ipc.open_stream(payload).read_all().to_pandas(split_blocks=True, self_destruct=True)
+
 def load_csv_from_path(filepath):
     """Reads a CSV file from a given path and returns data for the store or an error feedback."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        header_row = find_header_row(lines)
-        metadata = extract_metadata(lines)
-        df = pd.read_csv(io.StringIO("".join(lines[header_row:])), sep=';')
-        df.columns = df.columns.str.strip()
+        with open(filepath, 'rb') as f:
+            raw_bytes = f.read()
+
+        df, metadata = parse_progress_csv(raw_bytes)
 
         required_cols = ['Block_height', 'Accumulated_sync_in_progress_time[s]']
         if not all(col in df.columns for col in required_cols):
             missing_cols = [col for col in required_cols if col not in df.columns]
             raise ValueError(f"The file is missing essential columns: {', '.join(missing_cols)}.")
 
-        store_data = {'filename': filepath, 'data': df.to_json(date_format='iso', orient='split'), 'metadata': metadata}
+        cache_key = cache_dataframe(df, hashlib.sha1(raw_bytes).hexdigest(), filepath)
+        store_data = {'filename': filepath, 'cache_key': cache_key, 'metadata': metadata}
         feedback = {'title': 'File Reloaded', 'body': f"Successfully reloaded '{os.path.basename(filepath)}'."}
         return store_data, feedback
     except Exception as e:
@@ -598,15 +894,13 @@ def load_csv_from_path(filepath):
         return None, feedback
 
 initial_metadata = {}
+initial_cache_key = None
 initial_csv_path = os.path.join(SCRIPT_DIR, "measurements", "sync_progress.csv")
 try:
-    with open(initial_csv_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    header_row = find_header_row(lines)
-    initial_metadata = extract_metadata(lines)
-    # Pass only the relevant lines to pandas, starting from the header
-    df_progress = pd.read_csv(io.StringIO("".join(lines[header_row:])), sep=";")
-    df_progress.columns = df_progress.columns.str.strip()
+    with open(initial_csv_path, 'rb') as f:
+        raw_bytes = f.read()
+    initial_cache_key = hashlib.sha1(raw_bytes).hexdigest()
+    df_progress, initial_metadata = parse_progress_csv(raw_bytes)
 except FileNotFoundError:
     df_progress = pd.DataFrame()
     print(f"Info: {initial_csv_path} not found. Please upload a file or place it in the 'measurements' directory to begin analysis.")
@@ -621,6 +915,19 @@ def format_seconds(seconds):
         return "N/A"
     return str(timedelta(seconds=int(seconds)))
 
+def format_seconds_array(values):
+    """Vectorized format_seconds: formats an array of seconds like str(timedelta), NaN as 'N/A'."""
+    secs = np.asarray(values, dtype=float)
+    missing = np.isnan(secs)
+    whole = np.trunc(np.where(missing, 0, secs)).astype(np.int64)
+    days, rem = np.divmod(whole, 86400)
+    hours, rem = np.divmod(rem, 3600)
+    minutes, rem = np.divmod(rem, 60)
+    return [
+        "N/A" if na else (f"{d} day{'' if abs(d) == 1 else 's'}, " if d else "") + f"{h}:{m:02d}:{s:02d}"
+        for na, d, h, m, s in zip(missing.tolist(), days.tolist(), hours.tolist(), minutes.tolist(), rem.tolist())
+    ]
+
 # --- Tooltip Content ---
 tooltip_texts = {
     'Original File': {
@@ -805,14 +1112,27 @@ tooltip_texts = {
     }
 }
 
-# --- Prepare initial data for the store if df_progress is loaded ---
-initial_original_data = None
-if not df_progress.empty:
-    initial_original_data = {
-        'filename': initial_csv_path,
-        'data': df_progress.to_json(date_format='iso', orient='split'),
-        'metadata': initial_metadata
-    }
+# --- Info Icons ---
+info_icon_class = "bi bi-info-circle-fill text-info align-middle"
+
+def info_icon(metric, spaced=True, margin_left=None):
+    """Clickable info icon that opens the tooltip modal for `metric` (see show_tooltip_modal).
+
+    The icon glyph sits on the span itself, so each icon is a single DOM node.
+    """
+    style = {'cursor': 'pointer', 'fontSize': '1.1em'}
+    if margin_left:
+        style['marginLeft'] = margin_left
+    return html.Span(className=f"{info_icon_class} ps-1" if spaced else info_icon_class,
+                     style=style, title='Click for more info', **{'data-metric': metric})
+
+# --- Metadata Display Order ---
+# System info keys listed first, in this order; any other keys follow in file order
+metadata_preferred_order = [
+    'Signum Version', 'Hostname', 'OS Name', 'OS Version', 'OS Architecture',
+    'Java Version', 'Available Processors', 'Max Memory (MB)', 'Total RAM (MB)',
+    'Database Type', 'Database Version'
+]
 
 def filter_df_for_clearing(df):
     """Keeps header, first row, and every 5000th row."""
@@ -827,70 +1147,175 @@ def filter_df_for_clearing(df):
     # Sort by block height and reset index to maintain order and remove potential duplicates from concat
     return filtered_df.sort_values(by='Block_height').drop_duplicates(subset=['Block_height']).reset_index(drop=True)
 
-def create_combined_summary_table(df_original, df_compare, title_original, title_compare):
-    """Creates a Dash component with a combined summary table of sync metrics."""
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _central_moments_kernel(values):
+        """Mean and the 2nd/3rd central moment sums of an array, without temporary arrays."""
+        total = 0.0
+        for v in values:
+            total += v
+        mean = total / len(values)
+        m2 = 0.0
+        m3 = 0.0
+        for v in values:
+            d = v - mean
+            m2 += d * d
+            m3 += d * d * d
+        return mean, m2, m3
+
+def mean_std_skew(values):
+    """
+    Returns (mean, sample std, skewness) of a NaN-free 1-D float array.
+    Skewness is the adjusted Fisher-Pearson coefficient, the same one pandas' Series.skew() uses.
+    """
+    n = len(values)
+    if n == 0:
+        return np.nan, np.nan, np.nan
+    if NUMBA_AVAILABLE:
+        mean, m2, m3 = _central_moments_kernel(values)
+    else:
+        mean = values.mean()
+        deviations = values - mean
+        squared = deviations * deviations
+        m2 = squared.sum()
+        m3 = (squared * deviations).sum()
+
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    if n < 3:
+        skewness = np.nan
+    elif m2 == 0:
+        skewness = 0.0 # A constant series has no skew (pandas returns 0 as well)
+    else:
+        skewness = np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+    return mean, std, skewness
 
-    # If no data is present at all, return nothing.
-    if df_original.empty and df_compare.empty:
-        return None
+def partition_quartiles(values):
+    """
+    Returns the 25th, 50th and 75th percentiles of a NaN-free 1-D array in O(N).
+    np.partition (introselect) only places the needed order statistics instead of sorting the
+    whole array; linear interpolation between them matches pandas' describe()/quantile().
+    """
+    positions = np.array([.25, .5, .75]) * (len(values) - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    partitioned = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (positions - lower)
 
-    def get_stats_dict(df):
-        """Helper to calculate stats for a single dataframe, returning both display and raw values."""
-        if df.empty or 'Blocks_per_Second' not in df.columns or len(df) < 2:
-            na_result = {'display': 'N/A', 'raw': None}
-            return {
-            'Total Sync in Progress Time [s]': na_result, 'Total Blocks Synced': na_result, 'Overall Average Sync Speed [Blocks/sec]': na_result,
-            'Min Sync Speed [Blocks/sec sample]': na_result,
-            'Q1 Sync Speed [Blocks/sec sample]': na_result,
-            'Mean Sync Speed [Blocks/sec sample]': na_result,
-            'Median Sync Speed [Blocks/sec sample]': na_result,
-            'Q3 Sync Speed [Blocks/sec sample]': na_result,
-            'Max Sync Speed [Blocks/sec sample]': na_result,
-            'Std Dev of Sync Speed [Blocks/sec sample]': na_result,
-            'Skewness of Sync Speed [Blocks/sec sample]': na_result
-            }
+def get_stats_dict(df):
+    """
+    Helper to calculate stats for a single dataframe.
+    Returns two flat dicts keyed by metric name: (raw values, display strings).
+    Metrics that cannot be calculated are simply missing from both dicts.
+    """
+    if df.empty or 'Blocks_per_Second' not in df.columns or len(df) < 2:
+        return {}, {}
+
+    bps_values = df['Blocks_per_Second'].to_numpy(dtype=float)[1:]
+    bps_values = bps_values[~np.isnan(bps_values)]
+    if len(bps_values) == 0:
+        stats = dict.fromkeys(['min', '25%', 'mean', '50%', '75%', 'max', 'std'], 0.0)
+        skewness = 0.0
+    else:
+        quartiles = partition_quartiles(bps_values)
+        mean, std, skewness = mean_std_skew(bps_values)
+        stats = {
+            'min': bps_values.min(), '25%': quartiles[0], 'mean': mean, '50%': quartiles[1],
+            '75%': quartiles[2], 'max': bps_values.max(), 'std': std
+        }
 
-        bps_series = df['Blocks_per_Second'].iloc[1:]
-        if bps_series.empty:
-            stats = pd.Series(index=['min', '25%', 'mean', '50%', '75%', 'max', 'std'], dtype=float).fillna(0)
-            skewness = 0.0
-        else:
-            stats = bps_series.describe(percentiles=[.25, .75])
-            skewness = bps_series.skew()
+    # Correctly calculate duration for a slice of data
+    total_sync_seconds = df['Accumulated_sync_in_progress_time[s]'].iloc[-1] - df['Accumulated_sync_in_progress_time[s]'].iloc[0]
+    total_blocks_synced = df['Block_height'].iloc[-1] - df['Block_height'].iloc[0]
+    overall_avg_bps = total_blocks_synced / total_sync_seconds if total_sync_seconds > 0 else 0.0
+
+    raw = {
+        'Total Sync in Progress Time [s]': total_sync_seconds,
+        'Total Blocks Synced': float(total_blocks_synced),
+        'Overall Average Sync Speed [Blocks/sec]': overall_avg_bps,
+        'Min Sync Speed [Blocks/sec sample]': stats.get('min', 0.0),
+        'Q1 Sync Speed [Blocks/sec sample]': stats.get('25%', 0.0),
+        'Mean Sync Speed [Blocks/sec sample]': stats.get('mean', 0.0),
+        'Median Sync Speed [Blocks/sec sample]': stats.get('50%', 0.0),
+        'Q3 Sync Speed [Blocks/sec sample]': stats.get('75%', 0.0),
+        'Max Sync Speed [Blocks/sec sample]': stats.get('max', 0.0),
+        'Std Dev of Sync Speed [Blocks/sec sample]': stats.get('std', 0.0),
+        'Skewness of Sync Speed [Blocks/sec sample]': skewness if pd.notna(skewness) else 0.0
+    }
+    display = {metric: f"{value:.2f}" for metric, value in raw.items()}
+    display['Total Sync in Progress Time [s]'] = f"{format_seconds(total_sync_seconds)} ({int(total_sync_seconds)}s)"
+    display['Total Blocks Synced'] = f"{total_blocks_synced:,}"
+    display['Skewness of Sync Speed [Blocks/sec sample]'] = f"{skewness:.2f}"
+    return raw, display
 
-        # Correctly calculate duration for a slice of data
-        total_sync_seconds = df['Accumulated_sync_in_progress_time[s]'].iloc[-1] - df['Accumulated_sync_in_progress_time[s]'].iloc[0]
-        total_blocks_synced = df['Block_height'].iloc[-1] - df['Block_height'].iloc[0]
-        overall_avg_bps = total_blocks_synced / total_sync_seconds if total_sync_seconds > 0 else 0.0
+def get_cached_stats_dict(df, stats_key=None):
+    """
+    Returns the (raw, display) stats dicts for a dataframe, memoized in the server-side cache.
+    The key identifies the file (its cache key) and the selected block range, so UI-only
+    interactions like theme or slider changes reuse the previously computed aggregations.
+    """
+    if stats_key is None:
+        return get_stats_dict(df)
+    stats = cache.get(f"stats:{stats_key}")
+    if stats is None:
+        stats = get_stats_dict(df)
+        cache.set(f"stats:{stats_key}", stats)
+    return stats
+
+# --- Summary Metrics ---
+# Fixed order of the metrics in the summary table
+summary_metric_names = (
+    'Total Sync in Progress Time [s]', 'Total Blocks Synced', 'Overall Average Sync Speed [Blocks/sec]',
+    'Min Sync Speed [Blocks/sec sample]', 'Q1 Sync Speed [Blocks/sec sample]',
+    'Mean Sync Speed [Blocks/sec sample]', 'Median Sync Speed [Blocks/sec sample]',
+    'Q3 Sync Speed [Blocks/sec sample]', 'Max Sync Speed [Blocks/sec sample]',
+    'Std Dev of Sync Speed [Blocks/sec sample]', 'Skewness of Sync Speed [Blocks/sec sample]'
+)
 
-        return {
-            'Total Sync in Progress Time [s]': {'display': f"{format_seconds(total_sync_seconds)} ({int(total_sync_seconds)}s)", 'raw': total_sync_seconds},
-            'Total Blocks Synced': {'display': f"{total_blocks_synced:,}", 'raw': float(total_blocks_synced)},
-            'Overall Average Sync Speed [Blocks/sec]': {'display': f"{overall_avg_bps:.2f}", 'raw': overall_avg_bps},
-        'Min Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('min', 0):.2f}", 'raw': stats.get('min', 0.0)},
-        'Q1 Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('25%', 0):.2f}", 'raw': stats.get('25%', 0.0)},
-        'Mean Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('mean', 0):.2f}", 'raw': stats.get('mean', 0.0)},
-        'Median Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('50%', 0):.2f}", 'raw': stats.get('50%', 0.0)},
-        'Q3 Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('75%', 0):.2f}", 'raw': stats.get('75%', 0.0)},
-        'Max Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('max', 0):.2f}", 'raw': stats.get('max', 0.0)},
-        'Std Dev of Sync Speed [Blocks/sec sample]': {'display': f"{stats.get('std', 0):.2f}", 'raw': stats.get('std', 0.0)},
-        'Skewness of Sync Speed [Blocks/sec sample]': {'display': f"{skewness:.2f}", 'raw': skewness if pd.notna(skewness) else 0.0}
-        }
+# Define which metrics are better when higher
+summary_higher_is_better = {
+    'Total Sync in Progress Time [s]': False,
+    'Total Blocks Synced': True,
+    'Overall Average Sync Speed [Blocks/sec]': True,
+    'Min Sync Speed [Blocks/sec sample]': True,
+    'Q1 Sync Speed [Blocks/sec sample]': True,
+    'Mean Sync Speed [Blocks/sec sample]': True,
+    'Median Sync Speed [Blocks/sec sample]': True,
+    'Q3 Sync Speed [Blocks/sec sample]': True,
+    'Max Sync Speed [Blocks/sec sample]': True,
+    'Std Dev of Sync Speed [Blocks/sec sample]': False,
+    'Skewness of Sync Speed [Blocks/sec sample]': 'closer_to_zero',
+}
 
-    has_original = not df_original.empty
-    has_comparison = not df_compare.empty
+# Per-metric 'closer_to_zero' mask, used by the vectorized difference computation
+summary_closer_to_zero = np.array([summary_higher_is_better[m] == 'closer_to_zero' for m in summary_metric_names])
 
-    stats_original = get_stats_dict(df_original) if has_original else {}
-    stats_compare = get_stats_dict(df_compare) if has_comparison else {}
+# --- Summary Difference Colors ---
+# Maps (higher_is_better, sign of the difference) to the color class of a difference annotation.
+# For 'closer_to_zero' metrics the sign is that of the difference of the absolute values.
+diff_color_classes = {
+    (True, 1.0): "text-success", (True, -1.0): "text-danger",
+    (False, 1.0): "text-danger", (False, -1.0): "text-success",
+    ('closer_to_zero', 1.0): "text-danger", ('closer_to_zero', -1.0): "text-success",
+}
 
-    # Use a fixed list of metrics to ensure consistent order and display
-    metric_names = [
-        'Total Sync in Progress Time [s]', 'Total Blocks Synced', 'Overall Average Sync Speed [Blocks/sec]',
-        'Min Sync Speed [Blocks/sec sample]', 'Q1 Sync Speed [Blocks/sec sample]',
-        'Mean Sync Speed [Blocks/sec sample]', 'Median Sync Speed [Blocks/sec sample]',
-        'Q3 Sync Speed [Blocks/sec sample]', 'Max Sync Speed [Blocks/sec sample]',
-        'Std Dev of Sync Speed [Blocks/sec sample]', 'Skewness of Sync Speed [Blocks/sec sample]'
-    ]
+def create_combined_summary_table(df_original, df_compare, title_original, title_compare, stats_keys=(None, None)):
+    """
+    Creates a Dash component with a combined summary table of sync metrics.
+    The finished component is memoized per file/block range (stats_keys) and titles, so UI-only
+    interactions reuse it instead of re-instantiating every row, cell and icon component.
+    """
+    # If no data is present at all, return nothing.
+    if df_original.empty and df_compare.empty:
+        return None
+
+    summary_key = f"summary:{stats_keys[0]}:{stats_keys[1]}:{title_original}:{title_compare}" if any(stats_keys) else None
+    if summary_key:
+        cached_summary = cache.get(summary_key)
+        if cached_summary is not None:
+            return cached_summary
+
+    has_original = not df_original.empty
+    has_comparison = not df_compare.empty
 
     header_cells = [html.Th("Metric")]
     if has_original:
@@ -900,145 +1325,77 @@ def create_combined_summary_table(df_original, df_compare, title_original, title
 
     table_header = [html.Thead(html.Tr(header_cells))]
     
-    # Define which metrics are better when higher
-    higher_is_better = {
-        'Total Sync in Progress Time [s]': False,
-        'Total Blocks Synced': True,
-        'Overall Average Sync Speed [Blocks/sec]': True,
-        'Min Sync Speed [Blocks/sec sample]': True,
-        'Q1 Sync Speed [Blocks/sec sample]': True,
-        'Mean Sync Speed [Blocks/sec sample]': True,
-        'Median Sync Speed [Blocks/sec sample]': True,
-        'Q3 Sync Speed [Blocks/sec sample]': True,
-        'Max Sync Speed [Blocks/sec sample]': True,
-        'Std Dev of Sync Speed [Blocks/sec sample]': False,
-        'Skewness of Sync Speed [Blocks/sec sample]': 'closer_to_zero',
-    }
-
-    table_body_rows = []
-    for metric in metric_names:
+    def metric_cell(metric):
         info = tooltip_texts.get(metric, {})
         title = info.get('title', metric)
-        if metric in tooltip_texts:
-            info_icon = html.Span([
-                "\u00A0",  # Non-breaking space
-                html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-            ],
-                id={'type': 'info-icon', 'metric': metric}, # type: ignore
-                n_clicks=0,
-                style={'cursor': 'pointer'},
-                title='Click for more info'
-            )
-            metric_cell = html.Td([title, info_icon])
-        else:
-            metric_cell = html.Td(title)
-            
-        # Original value cell
-        row_cells = [metric_cell]
-        if has_original:
-            original_val_display = stats_original.get(metric, {}).get('display', 'N/A')
-            original_cell_content = [original_val_display]
-
-            if has_comparison:
-                original_raw = stats_original.get(metric, {}).get('raw')
-                compare_raw = stats_compare.get(metric, {}).get('raw')
-
-                if original_raw is not None and compare_raw is not None:
-                    diff = original_raw - compare_raw
-                    color_class = ""
-                    is_better = None
-                    hib = higher_is_better.get(metric)
-
-                    if diff != 0:
-                        if hib == 'closer_to_zero':
-                            if abs(original_raw) < abs(compare_raw): is_better = True
-                            elif abs(original_raw) > abs(compare_raw): is_better = False
-                        elif hib is True:
-                            if diff > 0: is_better = True
-                            if diff < 0: is_better = False
-                        elif hib is False:
-                            if diff < 0: is_better = True
-                            if diff > 0: is_better = False
-
-                    if is_better is True: color_class = "text-success"
-                    elif is_better is False: color_class = "text-danger"
-
-                    if color_class:
-                        if metric == 'Total Sync in Progress Time [s]':
-                            sign = "+" if diff > 0 else "-"
-                            diff_str = f"{sign}{format_seconds(abs(diff))} [{sign}{int(abs(diff))}s]"
-                        else:
-                            diff_str = f"{diff:+.2f}" if not isinstance(diff, str) else diff
-                        original_cell_content.append(html.Span(f" ({diff_str})", className=f"small {color_class} fw-bold"))
-
-            row_cells.append(html.Td(original_cell_content))
-
-        # Comparison value cell (with difference)
-        if has_comparison:
-            # Calculate and display difference
-            original_raw = stats_original.get(metric, {}).get('raw')
-            compare_raw = stats_compare.get(metric, {}).get('raw')
-            compare_val_display = stats_compare.get(metric, {}).get('display', 'N/A')
-            compare_cell_content = [compare_val_display]
-
-            if original_raw is not None and compare_raw is not None:
-                diff = compare_raw - original_raw
-                
-                # Determine color
-                color_class = ""
-                is_better = None
-                hib = higher_is_better.get(metric)
-
-                if diff != 0:
-                    if hib == 'closer_to_zero':
-                        if abs(compare_raw) < abs(original_raw):
-                            is_better = True
-                        elif abs(compare_raw) > abs(original_raw):
-                            is_better = False
-                    elif hib is True: # Higher is better
-                        if diff > 0: is_better = True
-                        if diff < 0: is_better = False
-                    elif hib is False: # Lower is better
-                        if diff < 0: is_better = True
-                        if diff > 0: is_better = False
-                
-                if is_better is True:
-                    color_class = "text-success" # Green
-                elif is_better is False:
-                    color_class = "text-danger" # Red
-                
-                # Format difference string
-                percent_diff_str = ""
-                if original_raw != 0:
-                    percent_diff = (diff / abs(original_raw)) * 100
-                    percent_diff_str = f", {percent_diff:+.1f}%"
-
-                if metric == 'Total Blocks Synced':
-                    diff_str = f"{diff:+,} ({percent_diff:+.1f}%)"
-                elif metric == 'Total Sync in Progress Time [s]':
-                    sign = "+" if diff > 0 else "-"
-                    diff_str = f"{sign}{format_seconds(abs(diff))} [{sign}{int(abs(diff))}s]"
-                else:
-                    diff_str = f"{diff:+.2f}"
-
-                if color_class:
-                    compare_cell_content.append(html.Span(f" ({diff_str})", className=f"small {color_class} fw-bold"))
-
-            row_cells.append(html.Td(compare_cell_content))
+        if metric not in tooltip_texts:
+            return html.Td(title)
+        return html.Td([title, info_icon(metric)])
+
+    def build_rows_single(display_values):
+        """Rows for a single file: metric name and value, no differences."""
+        return [html.Tr([metric_cell(metric), html.Td(display_values.get(metric, 'N/A'))]) for metric in summary_metric_names]
+
+    def build_rows_pair(raw_stats_o, display_o, raw_stats_c, display_c):
+        """Rows for two files: both values, each annotated with its colored difference to the other."""
+        # --- Compute all differences in one vectorized pass ---
+        # The sign array holds the direction of the comparison relative to the original
+        # (of the absolute values for 'closer_to_zero' metrics); 0/NaN means no difference.
+        raw_original = np.array([raw_stats_o.get(m, np.nan) for m in summary_metric_names], dtype=float)
+        raw_compare = np.array([raw_stats_c.get(m, np.nan) for m in summary_metric_names], dtype=float)
+        with np.errstate(invalid='ignore'):
+            diffs = raw_compare - raw_original
+            diff_signs = np.where(summary_closer_to_zero, np.sign(np.abs(raw_compare) - np.abs(raw_original)), np.sign(diffs))
+
+        def format_diff(metric, diff, reference_raw, with_percent):
+            if metric == 'Total Sync in Progress Time [s]':
+                sign = "+" if diff > 0 else "-"
+                return f"{sign}{format_seconds(abs(diff))} [{sign}{int(abs(diff))}s]"
+            if metric == 'Total Blocks Synced' and with_percent:
+                percent_str = f" ({(diff / abs(reference_raw)) * 100:+.1f}%)" if reference_raw != 0 else ""
+                return f"{diff:+,}{percent_str}"
+            return f"{diff:+.2f}"
+
+        def value_cell(display_values, metric, diff, reference_raw, diff_sign, with_percent):
+            cell_content = [display_values.get(metric, 'N/A')]
+            color_class = diff_color_classes.get((summary_higher_is_better[metric], diff_sign))
+            if color_class:
+                diff_str = format_diff(metric, diff, reference_raw, with_percent)
+                cell_content.append(html.Span(f" ({diff_str})", className=f"small {color_class} fw-bold"))
+            return html.Td(cell_content)
+
+        return [
+            html.Tr([
+                metric_cell(metric),
+                value_cell(display_o, metric, -diffs[i], raw_compare[i], -diff_signs[i], False),
+                value_cell(display_c, metric, diffs[i], raw_original[i], diff_signs[i], True)
+            ])
+            for i, metric in enumerate(summary_metric_names)
+        ]
 
-        table_body_rows.append(html.Tr(row_cells))
+    # --- Dispatch once to the specialised row builder ---
+    if has_original and has_comparison:
+        table_body_rows = build_rows_pair(*get_cached_stats_dict(df_original, stats_keys[0]), *get_cached_stats_dict(df_compare, stats_keys[1]))
+    elif has_original:
+        table_body_rows = build_rows_single(get_cached_stats_dict(df_original, stats_keys[0])[1])
+    else:
+        table_body_rows = build_rows_single(get_cached_stats_dict(df_compare, stats_keys[1])[1])
 
     table_body = [html.Tbody(table_body_rows)]
 
-    return html.Div([
+    summary = html.Div([
         html.H5("Metrics Summary", className="mt-4"),
         dbc.Table(table_header + table_body, striped=True, bordered=True, hover=True, className="mt-2", responsive=True)
     ])
+    if summary_key:
+        cache.set(summary_key, summary)
+    return summary
 
 def process_progress_df(df, filename=""):
     """
     Adds calculated columns to the progress dataframe.
     It dynamically detects the time column and its unit ([s] or [ms]) and normalizes it to seconds.
+    Rows are expected in sync order: both Block_height and the accumulated sync time are non-decreasing.
     """
     if df.empty:
         return df
@@ -1067,12 +1424,199 @@ def process_progress_df(df, filename=""):
     if unit == 'ms':
         df[time_in_seconds_col] = df[time_col] / 1000
 
-    df['SyncTime_Formatted'] = df[time_in_seconds_col].apply(format_seconds)
-    delta_blocks = df['Block_height'].diff()
-    delta_time = df[time_in_seconds_col].diff()
-    df['Blocks_per_Second'] = (delta_blocks / delta_time.replace(0, pd.NA)).fillna(0)
+    # Integer block heights stay int64 so the diff step does not upcast the whole column to float64.
+    # Heights with missing values (float columns) are used as floats.
+    block_heights = df['Block_height'].to_numpy()
+    block_heights = block_heights.astype(np.int64, copy=False) if block_heights.dtype.kind in 'iu' else block_heights.astype(float, copy=False)
+    sync_times = df[time_in_seconds_col].to_numpy(dtype=float)
+    df['Blocks_per_Second'] = compute_blocks_per_second(block_heights, sync_times).astype(np.float32)
+    # Time between consecutive samples, used by the time delta distributions (the first row has no predecessor)
+    df['Time_Delta'] = np.diff(sync_times, prepend=np.nan)
+
+    # The processed frame only feeds graphs, statistics and the table, so heights and speeds are narrowed
+    # to 32 bits. Sync times stay float64 to keep sub-second precision over multi-day syncs.
+    int32_range = np.iinfo(np.int32)
+    if block_heights.dtype.kind == 'i' and len(block_heights) and int32_range.min <= block_heights.min() and block_heights.max() <= int32_range.max:
+        df['Block_height'] = block_heights.astype(np.int32)
     return df
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _blocks_per_second_kernel(block_heights, sync_times, out):
+        """Fused diff/divide kernel: one pass over both arrays without intermediate allocations."""
+        for i in prange(1, len(block_heights)):
+            delta_time = sync_times[i] - sync_times[i - 1]
+            value = (block_heights[i] - block_heights[i - 1]) / delta_time if delta_time != 0 else 0.0
+            out[i] = value if np.isfinite(value) else 0.0
+
+def compute_blocks_per_second(block_heights, sync_times):
+    """
+    Computes the sync speed between consecutive rows.
+    Block heights may be int64 (block deltas are then computed in integer arithmetic) or float.
+    Rows with a zero or missing time delta (including the first row) get a speed of 0.
+    """
+    blocks_per_second = np.zeros(len(block_heights))
+    if len(block_heights) < 2:
+        return blocks_per_second
+    if NUMBA_AVAILABLE:
+        _blocks_per_second_kernel(block_heights, sync_times, blocks_per_second)
+        return blocks_per_second
+    delta_time = np.diff(sync_times)
+    np.divide(np.diff(block_heights), delta_time, out=blocks_per_second[1:], where=delta_time != 0)
+    blocks_per_second[~np.isfinite(blocks_per_second)] = 0
+    return blocks_per_second
+
+def filter_block_range(df, start_block, end_block):
+    """
+    Returns the rows with start_block <= Block_height <= end_block. Sync progress files are sorted by
+    block height, so the range is located with a binary search and taken as a slice; unsorted data
+    falls back to a boolean mask.
+    """
+    block_heights = df['Block_height']
+    if block_heights.is_monotonic_increasing:
+        values = block_heights.to_numpy()
+        lo = np.searchsorted(values, start_block, side='left')
+        hi = np.searchsorted(values, end_block, side='right')
+        return df.iloc[lo:hi]
+    return df[(block_heights >= start_block) & (block_heights <= end_block)]
+
+def displayed_time_deltas(df_display):
+    """Returns the sync time deltas between consecutive displayed rows as a NaN-free array."""
+    if df_display.empty or 'Time_Delta' not in df_display.columns:
+        return np.array([], dtype=float)
+    index = df_display.index
+    if isinstance(index, pd.RangeIndex) and index.step == 1:
+        # Contiguous rows (the sorted slice of filter_block_range): the precomputed deltas apply.
+        # The first displayed row's delta refers to a row outside the displayed range.
+        deltas = df_display['Time_Delta'].to_numpy()[1:]
+    else:
+        # Masked rows are not neighbours in the full frame, so the deltas are taken between displayed rows
+        deltas = np.diff(df_display['Accumulated_sync_in_progress_time[s]'].to_numpy(dtype=float))
+    return deltas[~np.isnan(deltas)]
+
+def get_cached_block_heights(store_data, df):
+    """Returns the sorted unique block heights of a file, memoized per file content (store cache key)."""
+    heights_key = f"heights:{store_data['cache_key']}" if store_data and store_data.get('cache_key') else None
+    heights = cache.get(heights_key) if heights_key else None
+    if heights is None:
+        heights = np.unique(df['Block_height'].to_numpy())
+        if heights.dtype.kind == 'f':
+            heights = heights[~np.isnan(heights)]
+        if heights_key:
+            cache.set(heights_key, heights)
+    return heights
+
+def block_height_options(heights):
+    """Builds the start/end block dropdown options from sorted unique block heights."""
+    return [{'label': f"{int(h):,}", 'value': h} for h in heights.tolist()]
+
+def moving_average(values, window):
+    """Trailing moving average over up to `window` samples (like rolling(window, min_periods=1).mean())."""
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 1 or len(values) == 0:
+        return values
+    window = min(window, len(values))
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_mean(values, window=window, min_count=1)
+    return pd.Series(values).rolling(window=window, min_periods=1).mean().to_numpy()
+
+def load_processed_store_df(store_data, filename=""):
+    """
+    Returns the processed DataFrame (see process_progress_df) for a data store.
+    The result is memoized in the server-side cache under the store's content-based cache key,
+    so interactions that do not change the data (sliders, range, theme) skip the processing step.
+    """
+    if not store_data or not store_data.get('cache_key'):
+        return pd.DataFrame()
+    processed_key = f"processed:{store_data['cache_key']}"
+    payload = cache.get(processed_key)
+    if payload is not None:
+        return dataframe_from_ipc(payload)
+    df = load_store_df(store_data)
+    if df.empty:
+        return df
+    return cache_processed_df(store_data['cache_key'], df, filename)
+
+def cache_processed_df(cache_key, df, filename=""):
+    """Runs process_progress_df on a shallow copy of df and memoizes the result under the store's cache key."""
+    # The copy keeps the derived columns out of the raw DataFrame, which is what gets saved back to disk
+    processed = process_progress_df(df.copy(deep=False), filename)
+    cache.set(f"processed:{cache_key}", dataframe_to_ipc(processed))
+    return processed
+
+def format_table_column(series, column_name):
+    """Formats a raw data table column as cell strings in one pass; missing values become empty strings."""
+    if column_name == 'Block Height':
+        # Integer heights are formatted directly; float ones (e.g. after an outer join) without decimals
+        text = series.map("{:,}".format if pd.api.types.is_integer_dtype(series) else "{:,.0f}".format)
+    elif pd.api.types.is_float_dtype(series):
+        text = series.map("{:.2f}".format)
+    else:
+        text = series.astype(str)
+    return np.where(series.isna().to_numpy(), "", text.to_numpy(dtype=object)).tolist()
+
+def table_diff_spans(diff, baseline, higher_is_better, unit="", as_duration=False):
+    """
+    Returns the colored annotation of each table cell's difference from the other file's value
+    (the baseline of the percentage), or None for cells without a (non-zero) difference.
+    """
+    better = diff > 0 if higher_is_better else diff < 0
+    # Missing or equal values get no annotation; the first matching condition wins
+    classes = np.select([np.isnan(diff) | (diff == 0), better], ["", "text-success"], default="text-danger")
+    spans = [None] * len(diff)
+    annotated = np.flatnonzero(classes != "")
+    if annotated.size == 0:
+        return spans
+    # The annotation strings of all annotated cells are formatted in bulk
+    d = diff[annotated]
+    if as_duration:
+        signs = np.where(d > 0, " (+", " (-")
+        diff_strs = np.char.add(np.char.add(signs, np.array(format_seconds_array(np.abs(d)))), ")")
+    else:
+        base = baseline[annotated]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent = d / np.abs(base) * 100
+        percent_strs = np.where(base != 0, np.char.mod(", %+.1f%%", percent), "")
+        diff_strs = np.char.add(np.char.add(np.char.mod(f" (%+.2f{unit}", d), percent_strs), ")")
+    for i, diff_str, color_class in zip(annotated.tolist(), diff_strs.tolist(), classes[annotated].tolist()):
+        spans[i] = html.Span(diff_str, className=f"small {color_class} fw-bold")
+    return spans
+
+@lru_cache(maxsize=256)
+def table_header_cell(text, left_border=False):
+    """
+    Returns the raw table header cell of a column, with an info icon if the column has a tooltip.
+    Headers only depend on the column name, so the components are built once and reused.
+    """
+    style = {'borderLeft': '1px solid black'} if left_border else None
+    if text in tooltip_texts:
+        return html.Th([text, info_icon(text)], style=style)
+    return html.Th(text, style=style)
+
+@lru_cache(maxsize=8)
+def table_colgroup(widths):
+    """Returns the Colgroup that keeps the separate header and body tables' columns aligned."""
+    return html.Colgroup([html.Col(style={'width': w}) for w in widths])
+
+# Merged raw table columns annotated with their difference from the other file
+raw_table_numeric_metrics = {
+    'Sync Time [s]': {'higher_is_better': False},
+    'Sync Speed [Blocks/sec]': {'higher_is_better': True}
+}
+
+# Column widths shared by the header and body tables (Block Height, then 3 columns per file)
+raw_table_merged_col_widths = ('16%',) + ('12%', '18%', '12%') * 2
+raw_table_single_col_widths = ('25%', '20%', '35%', '20%')
+
+# The header is a separate table kept visible above the scrolling body
+raw_table_header_style = {
+    'tableLayout': 'fixed', 'width': '100%',
+    'position': 'sticky', 'top': 0, 'zIndex': 2,
+    'backgroundColor': 'var(--bs-body-bg, white)'
+}
+raw_table_body_style = {'tableLayout': 'fixed', 'width': '100%', 'marginTop': '-1px'}
+raw_table_scroll_style = {'maxHeight': '500px', 'overflowY': 'auto', 'width': '100%'}
+
 # --- Moving Average Window Values ---
 ma_windows = [10, 100, 200, 300, 400, 500]
 ma_marks = {i: str(v) for i, v in enumerate(ma_windows)}
@@ -1081,6 +1625,93 @@ ma_marks = {i: str(v) for i, v in enumerate(ma_windows)}
 dist_bins_values = [10, 100, 200, 300, 400, 500]
 dist_bins_marks = {i: str(v) for i, v in enumerate(dist_bins_values)}
 
+# --- Raw Data Table Page Size ---
+# The raw data table is paged server-side; only this many rows are rendered at once.
+raw_table_page_size = 500
+
+# --- Line Graph Point Budget ---
+# Line traces are downsampled to this many points before being sent to the browser.
+max_graph_points = 2000
+
+# --- KDE Evaluation ---
+# Up to this many samples the exact gaussian_kde is evaluated; larger samples use the binned FFT estimate.
+kde_exact_max_samples = 1000
+kde_grid_size = 1024
+
+def kde_curve(values, n_points=500):
+    """
+    Returns (x_range, density) of a Gaussian KDE (Scott's bandwidth, like gaussian_kde) over [min, max].
+    For large samples the data is linearly binned onto a regular grid and convolved with the kernel via FFT,
+    which is O(N + G log G) instead of the O(N * n_points) direct evaluation.
+    """
+    data = np.asarray(values, dtype=float)
+    x_range = np.linspace(data.min(), data.max(), n_points)
+    if len(data) <= kde_exact_max_samples:
+        return x_range, gaussian_kde(data)(x_range)
+
+    bandwidth = data.std(ddof=1) * len(data) ** (-1 / 5)
+    if not bandwidth > 0:
+        raise np.linalg.LinAlgError("Data has zero variance; the KDE bandwidth is undefined.")
+
+    # Linear binning onto a grid padded by 4 bandwidths on both sides
+    grid_start = data.min() - 4 * bandwidth
+    grid = np.linspace(grid_start, data.max() + 4 * bandwidth, kde_grid_size)
+    grid_step = grid[1] - grid[0]
+    position = (data - grid_start) / grid_step
+    left = np.floor(position).astype(np.int64)
+    weight_right = position - left
+    grid_counts = np.bincount(left, weights=1 - weight_right, minlength=kde_grid_size)[:kde_grid_size]
+    grid_counts += np.bincount(left + 1, weights=weight_right, minlength=kde_grid_size)[:kde_grid_size]
+
+    # Convolve the binned counts with the Gaussian kernel (truncated at 4 bandwidths)
+    kernel_half = int(np.ceil(4 * bandwidth / grid_step))
+    kernel_x = np.arange(-kernel_half, kernel_half + 1) * grid_step
+    kernel = np.exp(-0.5 * (kernel_x / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    n_fft = kde_grid_size + len(kernel) - 1
+    density = np.fft.irfft(np.fft.rfft(grid_counts, n_fft) * np.fft.rfft(kernel, n_fft), n_fft)
+    density = density[kernel_half:kernel_half + kde_grid_size] / len(data)
+    return x_range, np.interp(x_range, grid, np.maximum(density, 0))
+
+def lttb_indices(x, y, n_out):
+    """
+    Returns the indices of the points selected by the Largest-Triangle-Three-Buckets algorithm.
+    The first and last points are always kept; every bucket in between contributes the point
+    forming the largest triangle with the previously selected point and the next bucket's average.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    bucket_edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = bucket_edges[i], bucket_edges[i + 1]
+        next_end = bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected]) -
+            (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+def lttb_downsample(x, y, customdata=None, n_out=max_graph_points):
+    """
+    Reduces x/y (and customdata) with LTTB when they exceed the point budget. Returns (x, y, customdata).
+    Line traces are downsampled before they are constructed, so Plotly never validates the full arrays.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) > n_out:
+        idx = lttb_indices(x.astype(float, copy=False), np.nan_to_num(y.astype(float, copy=False)), n_out)
+        x, y = x[idx], y[idx]
+        if customdata is not None:
+            customdata = np.asarray(customdata)[idx]
+    return x, y, customdata
 
 # --- Dash App Initialization ---
 app = dash.Dash(
@@ -1092,6 +1723,29 @@ app = dash.Dash(
     title="Sync Progress Reports"
 )
 
+# --- Server-side DataFrame Cache ---
+# Parsed DataFrames are kept on the server; the dcc.Store components only hold the cache key,
+# so callbacks no longer serialize and re-parse the whole file as JSON on every update.
+# The loaded files live in a disk-backed store of their own, so the many derived entries below
+# (processed frames, statistics, figures) can never evict the data a store still refers to.
+data_cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': os.path.join(SCRIPT_DIR, ".cache"),
+    'CACHE_DEFAULT_TIMEOUT': 0,
+    'CACHE_THRESHOLD': 20
+})
+# Derived, recomputable results are memoized in memory
+cache = Cache(app.server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 0, 'CACHE_THRESHOLD': 50})
+
+# --- Prepare initial data for the store if df_progress is loaded ---
+initial_original_data = None
+if not df_progress.empty:
+    initial_original_data = {
+        'filename': initial_csv_path,
+        'cache_key': cache_dataframe(df_progress, initial_cache_key, initial_csv_path),
+        'metadata': initial_metadata
+    }
+
 # --- Common Styles ---
 upload_style = {
     'width': '100%',
@@ -1133,10 +1787,16 @@ app.layout = html.Div([
     dcc.Graph(id='main-callback-output', style={'display': 'none'}),
     dcc.Store(id='original-data-store', data=initial_original_data),
     dcc.Store(id='compare-data-store'), # No initial data for comparison
+    dcc.Store(id='original-metadata-store'), # Edited metadata, kept apart so edits do not rewrite the data stores
+    dcc.Store(id='compare-metadata-store'),
+    dcc.Store(id='delete-request-store'), # {prefix, key, ts} of the last clicked metadata delete button
+    dcc.Store(id='info-request-store'), # {metric, ts} of the last clicked info icon
+    dcc.Store(id='metadata-edit-store'), # {prefix: {key: value}} batch of edited metadata values
+    dcc.Store(id='metadata-display-key-store'), # [original, comparison] filenames the metadata cards were last built for
+    dcc.Store(id='metadata-layout-store', data={'preferred_order': metadata_preferred_order, 'tooltip_keys': list(tooltip_texts)}),
     dcc.Store(id='action-feedback-store'), # For modal feedback
     dcc.Store(id='unsaved-changes-store', data={'Original': False, 'Comparison': False}),
     dcc.Store(id='reset-upload-store'), # To trigger clientside upload reset
-    dcc.Store(id='html-content-store'), # For saving HTML content from clientside callback
     dcc.Store(id='clientside-script-store'), # To confirm clientside script is loaded
         dbc.Row([
         dbc.Col(html.H1("Sync Progress Reports", className="mt-3 mb-4"), width="auto", className="me-auto"),
@@ -1166,15 +1826,7 @@ app.layout = html.Div([
                 ), style={'flexGrow': 1}),
                 dbc.Button(html.I(className="bi bi-arrow-clockwise"), id="reload-original-button", color="primary", outline=True, className="ms-2", style={'display': 'none'}, title="Reload this file"),
                 dbc.Button(html.I(className="bi bi-trash-fill"), id="discard-original-button", color="danger", outline=True, className="ms-2", style={'display': 'none'}, title="Discard this file"),
-                html.Span([ # type: ignore
-                    "\u00A0",  # Non-breaking space
-                    html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                ],
-                    id={'type': 'info-icon', 'metric': 'Original File'}, # type: ignore
-                    style={'cursor': 'pointer', 'marginLeft': '10px'},
-                    title='Click for more info'
-                ,
-                n_clicks=0)
+                info_icon('Original File', margin_left='10px')
             ], style={'display': 'flex', 'alignItems': 'center'}, id='original-upload-container'),
             html.Div(id='original-metadata-display', className="mt-3")
         ]),
@@ -1187,7 +1839,7 @@ app.layout = html.Div([
                 ), style={'flexGrow': 1}),
                 dbc.Button(html.I(className="bi bi-arrow-clockwise"), id="reload-compare-button", color="primary", outline=True, className="ms-2", style={'display': 'none'}, title="Reload this file"),
                 dbc.Button(html.I(className="bi bi-trash-fill"), id="discard-compare-button", color="danger", outline=True, className="ms-2", style={'display': 'none'}, title="Discard this file"),
-                html.Span([ "\u00A0", html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}), ], id={'type': 'info-icon', 'metric': 'Comparison File'}, style={'cursor': 'pointer', 'marginLeft': '10px'}, title='Click for more info', n_clicks=0), # type: ignore
+                info_icon('Comparison File', margin_left='10px'),
             ], style={'display': 'flex', 'alignItems': 'center'}, id='compare-upload-container'),
             html.Div(id='compare-metadata-display', className="mt-3")
         ]),
@@ -1197,42 +1849,42 @@ app.layout = html.Div([
         dcc.Graph(id="progress-graph"),
         html.Div([
             html.Label("Moving Average Window:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Moving Average Window-1'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Moving Average Window-1', spaced=False),
             html.Div(dcc.Slider(id="ma-window-slider-1", min=0, max=len(ma_windows) - 1, value=1, marks=ma_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="blockheight-vs-speed-graph-title", className="mt-4"),
         dcc.Graph(id="blockheight-vs-speed-graph"),
         html.Div([
             html.Label("Moving Average Window:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Moving Average Window-2'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Moving Average Window-2', spaced=False),
             html.Div(dcc.Slider(id="ma-window-slider-2", min=0, max=len(ma_windows) - 1, value=1, marks=ma_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="distribution-graph-speed-title", className="mt-4"),
         dcc.Graph(id="distribution-graph-speed"),
         html.Div([
             html.Label("Distribution Bins:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Distribution Bins-1'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Distribution Bins-1', spaced=False),
             html.Div(dcc.Slider(id="distribution-bins-slider-1", min=0, max=len(dist_bins_values) - 1, value=1, marks=dist_bins_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="distribution-graph-time-delta-title", className="mt-4"),
         dcc.Graph(id="distribution-graph-time-delta"),
         html.Div([
             html.Label("Distribution Bins:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Distribution Bins-2'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Distribution Bins-2', spaced=False),
             html.Div(dcc.Slider(id="distribution-bins-slider-2", min=0, max=len(dist_bins_values) - 1, value=1, marks=dist_bins_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="distribution-graph-speed-count-title", className="mt-4"),
         dcc.Graph(id="distribution-graph-speed-count"),
         html.Div([
             html.Label("Distribution Bins:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Distribution Bins-3'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Distribution Bins-3', spaced=False),
             html.Div(dcc.Slider(id="distribution-bins-slider-3", min=0, max=len(dist_bins_values) - 1, value=1, marks=dist_bins_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="distribution-graph-time-delta-count-title", className="mt-4"),
         dcc.Graph(id="distribution-graph-time-delta-count"),
         html.Div([
             html.Label("Distribution Bins:", className="me-2"),
-            html.Span([html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})], id={'type': 'info-icon', 'metric': 'Distribution Bins-4'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0),
+            info_icon('Distribution Bins-4', spaced=False),
             html.Div(dcc.Slider(id="distribution-bins-slider-4", min=0, max=len(dist_bins_values) - 1, value=1, marks=dist_bins_marks, step=None), style={'width': '250px', 'marginLeft': '10px'})
         ], style={'display': 'flex', 'alignItems': 'center', 'marginTop': '10px', 'justifyContent': 'flex-start'}),
         html.Div(id="total-time-display-container"),
@@ -1244,6 +1896,10 @@ app.layout = html.Div([
                 value=True,
             )], id='show-data-table-switch-container'),
         html.Div(id='data-table-container'),
+        html.Div(
+            dbc.Pagination(id='raw-table-pagination', max_value=1, active_page=1, first_last=True, previous_next=True, fully_expanded=False, size='sm', className='mt-2'),
+            id='raw-table-pagination-container', style={'display': 'none'}
+        ),
     ]),
 
     # Add Modal to layout
@@ -1271,60 +1927,64 @@ app.layout = html.Div([
 ])
 
 
-# --- New Callbacks for handling uploads and storing data ---
-@app.callback(
-    [Output('original-data-store', 'data', allow_duplicate=True),
-     Output('action-feedback-store', 'data', allow_duplicate=True),
-     Output('upload-callback-output', 'figure', allow_duplicate=True),
-     Output('loading-state-store', 'data', allow_duplicate=True),
-     Output('unsaved-changes-store', 'data', allow_duplicate=True)],
-    [Input('upload-original-progress', 'contents'),
-     Input('upload-original-progress', 'filename')],
-    [State('unsaved-changes-store', 'data')],
-    prevent_initial_call=True
-)
-def store_original_data(contents, filename, unsaved_data):
+# --- Upload parsing helpers ---
+def parse_upload(contents, filename):
+    """
+    Decodes and parses an uploaded sync_progress.csv and caches the resulting DataFrame.
+    Returns the data for the store; raises ValueError if essential columns are missing.
+    """
+    decoded = decode_upload_contents(contents)
+    # Parse the raw bytes directly; only the metadata preamble is decoded to str
+    df, metadata = parse_progress_csv(decoded)
+
+    # Check for essential columns
+    required_cols = ['Block_height', 'Accumulated_sync_in_progress_time[s]']
+    if not all(col in df.columns for col in required_cols):
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        raise ValueError(f"The uploaded file is missing essential columns: {', '.join(missing_cols)}. Please check the file format.")
+    # Store absolute path if not already absolute (assume saved folder)
+    if not os.path.isabs(filename):
+        abs_path = os.path.join(SCRIPT_DIR, "measurements", "saved", filename)
+    else:
+        abs_path = filename
+    return {'filename': abs_path, 'cache_key': cache_dataframe(df, hashlib.sha1(decoded).hexdigest(), filename), 'metadata': metadata}
+
+def handle_upload(contents, filename, unsaved_data, prefix):
+    """Shared body of the original/comparison upload callbacks."""
     if not contents:
         return dash.no_update, dash.no_update, dash.no_update, {'loading': False, 'message': ''}, dash.no_update
-    # Set loading overlay ON
-    loading_data = {'loading': True, 'message': 'Processing: sync_progress.csv'}
-    content_type, content_string = contents.split(',')
-    decoded = base64.b64decode(content_string)
     try:
-        decoded_str = decoded.decode('utf-8')
-        lines = decoded_str.splitlines(True) # Keep newlines
-        header_row = find_header_row(lines)
-        metadata = extract_metadata(lines)
-        # Pass only the data part of the file to pandas
-        df = pd.read_csv(io.StringIO("".join(lines[header_row:])), sep=';')
-        df.columns = df.columns.str.strip() # Sanitize column names
-
-        # Check for essential columns
-        required_cols = ['Block_height', 'Accumulated_sync_in_progress_time[s]']
-        if not all(col in df.columns for col in required_cols):
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            raise ValueError(f"The uploaded file is missing essential columns: {', '.join(missing_cols)}. Please check the file format.")
-        # Store absolute path if not already absolute (assume saved folder)
-        if not os.path.isabs(filename):
-            abs_path = os.path.join(SCRIPT_DIR, "measurements", "saved", filename)
-        else:
-            abs_path = filename
-        store_data = {'filename': abs_path, 'data': df.to_json(date_format='iso', orient='split'), 'metadata': metadata}
+        store_data = parse_upload(contents, filename)
         feedback = {'title': 'File Uploaded', 'body': f"Successfully loaded '{filename}'."}
-        
+
         # A newly uploaded file is considered "saved".
         # We must preserve the state of the other file.
         new_unsaved_data = unsaved_data.copy()
-        new_unsaved_data['Original'] = False
+        new_unsaved_data[prefix] = False
 
         # Set loading overlay OFF
         return store_data, feedback, None, {'loading': False, 'message': ''}, new_unsaved_data
     except Exception as e:
-        print(f"Error parsing original uploaded file: {e}")
+        print(f"Error parsing {prefix.lower()} uploaded file: {e}")
         error_message = f"Failed to load '{filename}'.\n\nError: {e}\n\nPlease ensure it is a valid sync_progress.csv file."
         feedback = {'title': 'Upload Failed', 'body': error_message}
         return None, feedback, {}, {'loading': False, 'message': ''}, dash.no_update
 
+# --- New Callbacks for handling uploads and storing data ---
+@app.callback(
+    [Output('original-data-store', 'data', allow_duplicate=True),
+     Output('action-feedback-store', 'data', allow_duplicate=True),
+     Output('upload-callback-output', 'figure', allow_duplicate=True),
+     Output('loading-state-store', 'data', allow_duplicate=True),
+     Output('unsaved-changes-store', 'data', allow_duplicate=True)],
+    [Input('upload-original-progress', 'contents'),
+     Input('upload-original-progress', 'filename')],
+    [State('unsaved-changes-store', 'data')],
+    prevent_initial_call=True
+)
+def store_original_data(contents, filename, unsaved_data):
+    return handle_upload(contents, filename, unsaved_data, 'Original')
+
 @app.callback(
     [Output('compare-data-store', 'data', allow_duplicate=True),
      Output('action-feedback-store', 'data', allow_duplicate=True),
@@ -1337,46 +1997,8 @@ def store_original_data(contents, filename, unsaved_data):
     prevent_initial_call=True
 )
 def store_compare_data(contents, filename, unsaved_data):
-    if not contents:
-        return dash.no_update, dash.no_update, dash.no_update, {'loading': False, 'message': ''}, dash.no_update
-    # Set loading overlay ON
-    loading_data = {'loading': True, 'message': 'Processing: comparison sync_progress.csv'}
-    content_type, content_string = contents.split(',')
-    decoded = base64.b64decode(content_string)
-    try:
-        decoded_str = decoded.decode('utf-8')
-        lines = decoded_str.splitlines(True) # Keep newlines
-        header_row = find_header_row(lines)
-        metadata = extract_metadata(lines)
-        # Pass only the data part of the file to pandas
-        df = pd.read_csv(io.StringIO("".join(lines[header_row:])), sep=';')
-        df.columns = df.columns.str.strip() # Sanitize column names
-
-        # Check for essential columns
-        required_cols = ['Block_height', 'Accumulated_sync_in_progress_time[s]']
-        if not all(col in df.columns for col in required_cols):
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            raise ValueError(f"The uploaded file is missing essential columns: {', '.join(missing_cols)}. Please check the file format.")
-        # Store absolute path if not already absolute (assume saved folder)
-        if not os.path.isabs(filename):
-            abs_path = os.path.join(SCRIPT_DIR, "measurements", "saved", filename)
-        else:
-            abs_path = filename
-        store_data = {'filename': abs_path, 'data': df.to_json(date_format='iso', orient='split'), 'metadata': metadata}
-        feedback = {'title': 'File Uploaded', 'body': f"Successfully loaded '{filename}'."}
-        
-        # A newly uploaded file is considered "saved".
-        # We must preserve the state of the other file.
-        new_unsaved_data = unsaved_data.copy()
-        new_unsaved_data['Comparison'] = False
+    return handle_upload(contents, filename, unsaved_data, 'Comparison')
 
-        # Set loading overlay OFF
-        return store_data, feedback, None, {'loading': False, 'message': ''}, new_unsaved_data
-    except Exception as e:
-        print(f"Error parsing original uploaded file: {e}")
-        error_message = f"Failed to load '{filename}'.\n\nError: {e}\n\nPlease ensure it is a valid sync_progress.csv file."
-        feedback = {'title': 'Upload Failed', 'body': error_message}
-        return None, feedback, {}, {'loading': False, 'message': ''}, dash.no_update
 # --- Loading overlay control callback ---
 @app.callback(
     Output('loading-overlay', 'style', allow_duplicate=True),
@@ -1407,10 +2029,12 @@ def update_loading_overlay(loading_data):
     Input({'type': 'clear-csv-button', 'prefix': dash.dependencies.ALL}, 'n_clicks'),
     [State('original-data-store', 'data'),
      State('compare-data-store', 'data'),
+     State('original-metadata-store', 'data'),
+     State('compare-metadata-store', 'data'),
      State('unsaved-changes-store', 'data')],
     prevent_initial_call=True
 )
-def clear_csv_data(n_clicks_list, original_data, compare_data, unsaved_data):
+def clear_csv_data(n_clicks_list, original_data, compare_data, original_metadata, compare_metadata, unsaved_data):
     ctx = dash.callback_context
     if not ctx.triggered or not any(n_clicks_list):
         raise dash.exceptions.PreventUpdate
@@ -1423,22 +2047,25 @@ def clear_csv_data(n_clicks_list, original_data, compare_data, unsaved_data):
     new_compare_data = dash.no_update
 
     if prefix == 'Original':
-        if original_data and 'data' in original_data:
-            df_orig = pd.read_json(io.StringIO(original_data['data']), orient='split')
+        if original_data and 'cache_key' in original_data:
+            df_orig = load_store_df(original_data)
             rows_before = len(df_orig)
             df_orig_filtered = filter_df_for_clearing(df_orig)
             rows_after = len(df_orig_filtered)
-            original_data['data'] = df_orig_filtered.to_json(date_format='iso', orient='split')
+            original_data['cache_key'] = cache_dataframe(df_orig_filtered, filename=original_data.get('filename', ''))
+            # Carry over the edited metadata, the metadata store is refreshed from the data store
+            original_data['metadata'] = original_metadata or {}
             unsaved_data['Original'] = True
             new_original_data = original_data
             feedback_messages.append(f"'{original_data.get('filename', 'Original file')}' filtered in memory from {rows_before:,} to {rows_after:,} rows.")
     elif prefix == 'Comparison':
-        if compare_data and 'data' in compare_data:
-            df_comp = pd.read_json(io.StringIO(compare_data['data']), orient='split')
+        if compare_data and 'cache_key' in compare_data:
+            df_comp = load_store_df(compare_data)
             rows_before = len(df_comp)
             df_comp_filtered = filter_df_for_clearing(df_comp)
             rows_after = len(df_comp_filtered)
-            compare_data['data'] = df_comp_filtered.to_json(date_format='iso', orient='split')
+            compare_data['cache_key'] = cache_dataframe(df_comp_filtered, filename=compare_data.get('filename', ''))
+            compare_data['metadata'] = compare_metadata or {}
             unsaved_data['Comparison'] = True
             new_compare_data = compare_data
             feedback_messages.append(f"'{compare_data.get('filename', 'Comparison file')}' filtered in memory from {rows_before:,} to {rows_after:,} rows.")
@@ -1507,45 +2134,31 @@ def discard_compare_data(n_clicks, unsaved_data):
     # Setting store to None clears data, setting contents to None resets the Upload component
     return None, None, new_unsaved_data
 
+# --- Metadata stores follow the data stores ---
+# A data store is (re)written when a file is loaded, reloaded, cleared or discarded; metadata edits
+# only go to the metadata stores, so they do not re-trigger the graph and table updates.
 @app.callback(
-    Output('discard-original-button', 'style'),
-    Input('original-data-store', 'data')
-)
-def toggle_discard_original_button(data):
-    """Shows or hides the discard button for the original file."""
-    if data:
-        return {'display': 'inline-block'}
-    return {'display': 'none'}
-
-@app.callback(
-    Output('discard-compare-button', 'style'),
-    Input('compare-data-store', 'data')
-)
-def toggle_discard_compare_button(data):
-    """Shows or hides the discard button for the comparison file."""
-    if data:
-        return {'display': 'inline-block'}
-    return {'display': 'none'}
-
-@app.callback(
-    Output('reload-original-button', 'style'),
+    Output('original-metadata-store', 'data'),
     Input('original-data-store', 'data')
 )
-def toggle_reload_original_button(data):
-    """Shows or hides the reload button for the original file."""
-    if data and data.get('filename'):
-        return {'display': 'inline-block'}
-    return {'display': 'none'}
+def sync_original_metadata(store_data):
+    return dict(store_data.get('metadata', {})) if store_data else None
 
 @app.callback(
-    Output('reload-compare-button', 'style'),
+    Output('compare-metadata-store', 'data'),
     Input('compare-data-store', 'data')
 )
-def toggle_reload_compare_button(data):
-    """Shows or hides the reload button for the comparison file."""
-    if data and data.get('filename'):
-        return {'display': 'inline-block'}
-    return {'display': 'none'}
+def sync_compare_metadata(store_data):
+    return dict(store_data.get('metadata', {})) if store_data else None
+
+# --- Show/hide the Discard and Reload buttons in the browser, without a server roundtrip ---
+for file_key in ('original', 'compare'):
+    app.clientside_callback(
+        ClientsideFunction(namespace='clientside', function_name='toggle_file_buttons'),
+        [Output(f'discard-{file_key}-button', 'style'),
+         Output(f'reload-{file_key}-button', 'style')],
+        Input(f'{file_key}-data-store', 'data')
+    )
 
 @app.callback(
     [Output('original-data-store', 'data', allow_duplicate=True),
@@ -1617,44 +2230,39 @@ def reload_compare_data(n_clicks, store_data, unsaved_data):
         return dash.no_update, feedback, dash.no_update
 
 # --- Callback to Update Progress Graph ---
-@app.callback(
-    [Output("progress-graph", "figure"),
-     Output("blockheight-vs-speed-graph", "figure"),
-     Output("distribution-graph-speed", "figure"), # type: ignore
-     Output("distribution-graph-time-delta", "figure"), # type: ignore
-     Output("distribution-graph-speed-count", "figure"), # type: ignore
-     Output("distribution-graph-time-delta-count", "figure"), # type: ignore
-     Output("progress-graph-title", "children"),
-     Output("blockheight-vs-speed-graph-title", "children"),
-     Output("distribution-graph-speed-title", "children"),
-     Output("distribution-graph-time-delta-title", "children"),
-     Output("distribution-graph-speed-count-title", "children"),
-     Output("distribution-graph-time-delta-count-title", "children"),
-     Output("total-time-display-container", "children"),
-     Output({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, "options"),
-     Output({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, "value"),
-     Output({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, "options"),
-     Output({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, "value"),
-     Output("main-callback-output", "figure"),
-     Output("data-table-container", "children"),
-     Output("data-table-container", "style"),
-    ],
-    [Input("ma-window-slider-1", "value"), # 0
-     Input("distribution-bins-slider-1", "value"),
-     Input('original-data-store', 'data'),
-     Input('compare-data-store', 'data'),
-     Input({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
-     Input({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
-     Input({'type': 'reset-view-button', 'prefix': dash.dependencies.ALL}, 'n_clicks'),
-     Input('show-data-table-switch', 'value'),
-     Input('theme-store', 'data')],
-)
-def update_progress_graph_and_time(window_index, bins_index, original_data, compare_data,
-                                   start_block_vals, end_block_vals, reset_clicks,
-                                   show_data_table, theme):
-    window = ma_windows[window_index]
-    ctx = dash.callback_context
-
+def ma_window_figure_patches(df_original_display, df_compare_display, window):
+    """
+    Returns (fig_patch, fig2_patch): partial updates of the two line figures for a new MA window.
+    Only the MA traces and the titles are replaced. The trace order follows build_progress_figures:
+    three traces per displayed file, the MA trace being the last of the three.
+    """
+    fig_patch, fig2_patch = Patch(), Patch()
+    ma_trace_index = 2
+    for df_display in (df_original_display, df_compare_display):
+        if df_display.empty:
+            continue
+        bps_ma = moving_average(df_display['Blocks_per_Second'].to_numpy(), window)
+        for patch, x_col in ((fig_patch, 'Accumulated_sync_in_progress_time[s]'), (fig2_patch, 'Block_height')):
+            x, y, _ = lttb_downsample(df_display[x_col].to_numpy(), bps_ma)
+            patch['data'][ma_trace_index]['x'] = x
+            patch['data'][ma_trace_index]['y'] = y
+        ma_trace_index += 3
+    fig_patch['layout']['title']['text'] = f'Block Height and Sync Speed vs. Sync Time (MA Window: {window})'
+    fig2_patch['layout']['title']['text'] = f'Sync Time and Sync Speed vs. Block Height (MA Window: {window})'
+    return fig_patch, fig2_patch
+
+@lru_cache(maxsize=64)
+def sync_time_axis_ticks(x_min, x_max, num_ticks=8):
+    """Returns (tick_values, tick_text) for the sync time axis: evenly spaced seconds with a D-H-M-S label."""
+    tick_values = tuple(np.linspace(x_min, x_max, num_ticks).tolist())
+    tick_text = tuple(f"{int(val):,} sec<br>({format_seconds(val)})" for val in tick_values)
+    return tick_values, tick_text
+
+def build_progress_figures(df_original_display, df_compare_display, original_filename, compare_filename, window, bins, theme):
+    """
+    Builds the two line graphs and the four distribution graphs for the displayed data.
+    Returns (fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count).
+    """
     # --- Define colors based on theme ---
     is_dark_theme = theme != 'light'
     original_bps_color = '#b86e1e' if is_dark_theme else '#FF8C00'  # Muted orange for dark theme (was 'darkorange')
@@ -1666,298 +2274,59 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
         hover_label_style = dict(bgcolor="rgba(34, 37, 41, 0.9)", font=dict(color='white'))
         background_style = {'paper_bgcolor': 'rgba(0,0,0,0)', 'plot_bgcolor': 'rgba(0,0,0,0)'}
 
-    # --- Map inputs to prefixes ---
-    # The order of inputs is: ma-slider, original-data, compare-data, start-block-vals, end-block-vals, ...
-    start_block_inputs = {} # start-block-dropdown values
-    if ctx.inputs_list[4]: # Input index for start-block-dropdown
-        start_block_inputs = {item['id']['prefix']: item.get('value') for item in ctx.inputs_list[4]} # type: ignore
-
-    end_block_inputs = {} # end-block-dropdown values
-    if ctx.inputs_list[5]: # Input index for end-block-dropdown
-        end_block_inputs = {item['id']['prefix']: item.get('value') for item in ctx.inputs_list[5]} # type: ignore
-
-    def create_header_with_tooltip(text, metric_id, style=None):
-        if metric_id in tooltip_texts:
-            info_icon = html.Span([ # type: ignore
-                "\u00A0",  # Non-breaking space
-                html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-            ],
-                id={'type': 'info-icon', 'metric': metric_id}, # type: ignore
-                style={'cursor': 'pointer'},
-                title='Click for more info'
-            )
-            return html.Th([text, info_icon], style=style)
-        return html.Th(text, style=style)
+    # --- Define graph template before using it ---
+    graph_template = 'plotly_dark' if theme != 'light' else 'plotly'
 
-    # Create figure with secondary y-axis
+    # Figure 1: Block Height and Sync Speed vs. Sync Time; Figure 2: Sync Time and Sync Speed vs. Block Height
     fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig2 = make_subplots(specs=[[{"secondary_y": True}]])
 
-    def create_chart_title_with_icon(title_text, metric_id):
-        """Creates a title component with an info icon."""
-        if metric_id in tooltip_texts:
-            return html.Div([ # type: ignore
-                html.H5(title_text, style={'display': 'inline-block', 'marginRight': '10px'}),
-                html.Span([html.I(className="bi bi-info-circle-fill text-info")],
-                          id={'type': 'info-icon', 'metric': metric_id}, # type: ignore
-                          style={'cursor': 'pointer', 'fontSize': '1.1em'}, title='Click for more info')
-            ], style={'textAlign': 'center'})
-        return html.H5(title_text, style={'textAlign': 'center'})
-
-
-    # --- Load and process data from stores ---
-    df_progress_local = pd.DataFrame()
-    df_compare = pd.DataFrame()
-    original_filename = "sync_progress.csv" # Default filename
-    compare_filename = None
-
-    # Load original data
-    if original_data and 'data' in original_data:
-        df_progress_local = pd.read_json(io.StringIO(original_data['data']), orient='split')
-        original_filename = original_data.get('filename', original_filename)
-
-    # Load comparison data
-    if compare_data and 'data' in compare_data:
-        df_compare = pd.read_json(io.StringIO(compare_data['data']), orient='split')
-        compare_filename = compare_data.get('filename')
-
-    # --- Handle Empty State ---
-    if df_progress_local.empty and df_compare.empty:
-        graph_template = 'plotly_dark' if theme != 'light' else 'plotly'
-        empty_fig = go.Figure()
-        empty_fig.update_layout( # type: ignore
-            title_text='Upload a sync_progress.csv file to begin',
-            template=graph_template,
-            **background_style
+    def add_series(figure, x, y, name, hovertemplate, secondary_y, line=None, sync_time_axis=None):
+        """
+        Adds one LTTB-downsampled WebGL line trace to a figure with a secondary y-axis.
+        If sync_time_axis ('x' or 'y') is given, the D-H-M-S sync time strings for the hover label are
+        formatted from that axis, only for the points that are actually plotted.
+        """
+        x, y, _ = lttb_downsample(x, y)
+        customdata = format_seconds_array(x if sync_time_axis == 'x' else y) if sync_time_axis else None
+        figure.add_trace(
+            go.Scattergl(x=x, y=y, name=name, line=line, customdata=customdata, hovertemplate=hovertemplate),
+            secondary_y=secondary_y,
         )
-        summary_table = create_combined_summary_table(pd.DataFrame(), pd.DataFrame(), "Original", "Comparison")
-        
-        # Correctly form empty outputs for pattern-matching callbacks by inspecting the full output list spec
-        num_start_dds = len(ctx.outputs_list[13])
-        num_start_vals_dds = len(ctx.outputs_list[14])
-        num_end_dds = len(ctx.outputs_list[15])
-        num_end_vals_dds = len(ctx.outputs_list[16])
-        empty_start_opts = [[] for _ in range(num_start_dds)]
-        empty_start_vals = [None] * num_start_vals_dds
-        empty_end_opts = [[] for _ in range(num_end_dds)]
-        empty_end_vals = [None] * num_end_vals_dds
-        # Return empty titles as well
-        return empty_fig, empty_fig, empty_fig, empty_fig, empty_fig, empty_fig, None, None, None, None, None, None, summary_table, empty_start_opts, empty_start_vals, empty_end_opts, empty_end_vals, {}, None, {'display': 'none'}
-    # --- Process full dataframes first to get Blocks_per_Second ---
-    if not df_progress_local.empty:
-        df_progress_local = process_progress_df(df_progress_local, original_filename)
-    if not df_compare.empty:
-        df_compare = process_progress_df(df_compare, compare_filename)
-
-    # --- Prepare data for each card ---
-    data_map = {
-        'Original': {'df': df_progress_local, 'filename': original_filename, 'start_block': None, 'end_block': None, 'options': [], 'display_df': pd.DataFrame()},
-        'Comparison': {'df': df_compare, 'filename': compare_filename, 'start_block': None, 'end_block': None, 'options': [], 'display_df': pd.DataFrame()}
-    }
 
-    triggered_id = ctx.triggered_id
-    is_upload_or_clear = triggered_id in ['original-data-store', 'compare-data-store']
-    is_reset = isinstance(triggered_id, dict) and triggered_id.get('type') == 'reset-view-button'
-
-    # --- Calculate ranges and options for each file ---
-    for prefix_str, info in data_map.items():
-        df = info['df']
-        if not df.empty:
-            min_block = df['Block_height'].min()
-            max_block = df['Block_height'].max()
-            # Use unique and sorted values for dropdowns
-            unique_heights = sorted(df['Block_height'].unique())
-            info['options'] = [{'label': f"{int(h):,}", 'value': h} for h in unique_heights]
-            
-            current_start = start_block_inputs.get(prefix_str)
-            current_end = end_block_inputs.get(prefix_str)
-
-            # Determine start and end blocks based on context
-            if is_reset and triggered_id.get('prefix') == prefix_str:
-                info['start_block'] = min_block
-                info['end_block'] = max_block
-            elif is_upload_or_clear or current_start is None or current_end is None:
-                info['start_block'] = min_block
-                info['end_block'] = max_block
-            else:
-                info['start_block'] = current_start
-                info['end_block'] = current_end
-
-            # Swap if start > end
-            if info['start_block'] is not None and info['end_block'] is not None and info['start_block'] > info['end_block']:
-                info['start_block'], info['end_block'] = info['end_block'], info['start_block']
-            
-            # Filter data for display
-            start, end = info['start_block'], info['end_block']
-            if start is not None and end is not None:
-                info['display_df'] = df[(df['Block_height'] >= start) & (df['Block_height'] <= end)].copy()
-            else:
-                info['display_df'] = df.copy()
-
-    # --- Filter dataframes for display and metrics ---
-    df_original_display = data_map['Original']['display_df']
-    df_compare_display = data_map['Comparison']['display_df']
-
-    # --- Plot Original Data ---
-    if not df_original_display.empty:
-        df_original_display['BPS_ma'] = df_original_display['Blocks_per_Second'].rolling(window=window, min_periods=1).mean()
-        fig.add_trace(
-            go.Scatter(
-                x=df_original_display['Accumulated_sync_in_progress_time[s]'],
-                y=df_original_display['Block_height'],
-                name='Block Height (Original)',
-                customdata=df_original_display[['SyncTime_Formatted']],
-                hovertemplate=(
-                    f'<b>File</b>: {original_filename}<br>' +
-                    '<b>Block Height</b>: %{y}<br>' +
-                    '<b>Sync Time</b>: %{customdata[0]} [%{x:.0f}s]' +
-                    '<extra></extra>'
-                )
-            ),
-            secondary_y=False,
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=df_original_display['Accumulated_sync_in_progress_time[s]'],
-                y=df_original_display['Blocks_per_Second'],
-                name='Sync Speed (Original)',
-                line=dict(color=original_bps_color, dash='dot', width=1), # type: ignore
-                hovertemplate='<b>Sync Speed</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=df_original_display['Accumulated_sync_in_progress_time[s]'],
-                y=df_original_display['BPS_ma'],
-                name='Sync Speed (MA) (Original)',
-                line=dict(color=original_ma_color, dash='solid'), # type: ignore
-                hovertemplate='<b>Sync Speed (MA)</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
+    def sync_time_hovertemplate(filename, height_axis, time_axis):
+        return (
+            f'<b>File</b>: {filename}<br>' +
+            f'<b>Block Height</b>: %{{{height_axis}}}<br>' +
+            f'<b>Sync Time</b>: %{{customdata}} [%{{{time_axis}:.0f}}s]' +
+            '<extra></extra>'
         )
 
-    # --- Plot Comparison Data if available ---
-    if not df_compare_display.empty:
-        df_compare_display['BPS_ma'] = df_compare_display['Blocks_per_Second'].rolling(window=window, min_periods=1).mean()
-        fig.add_trace(
-                go.Scatter(
-                    x=df_compare_display['Accumulated_sync_in_progress_time[s]'],
-                    y=df_compare_display['Block_height'],
-                    name='Block Height (Comparison)',
-                    line=dict(color='cyan'),
-                    customdata=df_compare_display[['SyncTime_Formatted']],
-                    hovertemplate=(
-                        f'<b>File</b>: {compare_filename}<br>' +
-                        '<b>Block Height</b>: %{y}<br>' +
-                        '<b>Sync Time</b>: %{customdata[0]} [%{x:.0f}s]' +
-                        '<extra></extra>'
-                    )
-                ),
-                secondary_y=False,
-            )
-        fig.add_trace(
-                go.Scatter(
-                    x=df_compare_display['Accumulated_sync_in_progress_time[s]'],
-                    y=df_compare_display['Blocks_per_Second'],
-                    name='Sync Speed (Comparison)',
-                    line=dict(color='fuchsia', dash='dot', width=1),
-                    hovertemplate='<b>Sync Speed</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-                ),
-                secondary_y=True,
-            )
-        fig.add_trace(
-                go.Scatter(
-                    x=df_compare_display['Accumulated_sync_in_progress_time[s]'],
-                    y=df_compare_display['BPS_ma'],
-                    name='Sync Speed (MA) (Comparison)',
-                    line=dict(color='magenta', dash='solid'),
-                    hovertemplate='<b>Sync Speed (MA)</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-                ),
-                secondary_y=True,
-            )
-    # --- Define graph template before using it ---
-    graph_template = 'plotly_dark' if theme != 'light' else 'plotly'
-        
-    # Create the second figure for Block Height vs. Sync Speed/Time
-    fig2 = make_subplots(specs=[[{"secondary_y": True}]])
+    speed_hovertemplate = '<b>Sync Speed</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
+    speed_ma_hovertemplate = '<b>Sync Speed (MA)</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
 
-    # Plot Original Data for fig2
-    if not df_original_display.empty:
-        fig2.add_trace(
-            go.Scatter(
-                x=df_original_display['Block_height'],
-                y=df_original_display['Accumulated_sync_in_progress_time[s]'],
-                name='Sync Time (Original)',
-                line=dict(color='#1f77b4'),
-                customdata=df_original_display[['SyncTime_Formatted']],
-                hovertemplate=(
-                    f'<b>File</b>: {original_filename}<br>' +
-                    '<b>Block Height</b>: %{x}<br>' +
-                    '<b>Sync Time</b>: %{customdata[0]} [%{y:.0f}s]' +
-                    '<extra></extra>'
-                )
-            ),
-            secondary_y=False,
-        )
-        fig2.add_trace(
-            go.Scatter(
-                x=df_original_display['Block_height'],
-                y=df_original_display['Blocks_per_Second'],
-                name='Sync Speed (Original)',
-                line=dict(color=original_bps_color, dash='dot', width=1),
-                hovertemplate='<b>Sync Speed</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
-        )
-        fig2.add_trace(
-            go.Scatter(
-                x=df_original_display['Block_height'],
-                y=df_original_display['BPS_ma'],
-                name='Sync Speed (MA) (Original)',
-                line=dict(color=original_ma_color, dash='solid'),
-                hovertemplate='<b>Sync Speed (MA)</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
-        )
+    # (display df, filename, label, Figure 1 height line, Figure 2 time line, speed color, MA color)
+    series_specs = [
+        (df_original_display, original_filename, 'Original', None, dict(color='#1f77b4'), original_bps_color, original_ma_color),
+        (df_compare_display, compare_filename, 'Comparison', dict(color='cyan'), dict(color='cyan'), 'fuchsia', 'magenta'),
+    ]
+    for df_display, filename, label, height_line, sync_time_line, bps_color, ma_color in series_specs:
+        if df_display.empty:
+            continue
+        sync_times = df_display['Accumulated_sync_in_progress_time[s]'].to_numpy()
+        block_heights = df_display['Block_height'].to_numpy()
+        bps = df_display['Blocks_per_Second'].to_numpy()
+        bps_ma = moving_average(bps, window)
+        bps_line = dict(color=bps_color, dash='dot', width=1)
+        ma_line = dict(color=ma_color, dash='solid')
 
-    # Plot Comparison Data for fig2 if available
-    if not df_compare_display.empty:
-        fig2.add_trace(
-            go.Scatter(
-                x=df_compare_display['Block_height'],
-                y=df_compare_display['Accumulated_sync_in_progress_time[s]'],
-                name='Sync Time (Comparison)',
-                line=dict(color='cyan'),
-                customdata=df_compare_display[['SyncTime_Formatted']],
-                hovertemplate=(
-                    f'<b>File</b>: {compare_filename}<br>' +
-                    '<b>Block Height</b>: %{x}<br>' +
-                    '<b>Sync Time</b>: %{customdata[0]} [%{y:.0f}s]' +
-                    '<extra></extra>'
-                )
-            ),
-            secondary_y=False,
-        )
-        fig2.add_trace(
-            go.Scatter(
-                x=df_compare_display['Block_height'],
-                y=df_compare_display['Blocks_per_Second'],
-                name='Sync Speed (Comparison)',
-                line=dict(color='fuchsia', dash='dot', width=1),
-                hovertemplate='<b>Sync Speed</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
-        )
-        fig2.add_trace(
-            go.Scatter(
-                x=df_compare_display['Block_height'],
-                y=df_compare_display['BPS_ma'],
-                name='Sync Speed (MA) (Comparison)',
-                line=dict(color='magenta', dash='solid'),
-                hovertemplate='<b>Sync Speed (MA)</b>: %{y:.2f} [Blocks/sec]<extra></extra>'
-            ),
-            secondary_y=True,
-        )
+        add_series(fig, sync_times, block_heights, f'Block Height ({label})', sync_time_hovertemplate(filename, 'y', 'x'), False, height_line, sync_time_axis='x')
+        add_series(fig, sync_times, bps, f'Sync Speed ({label})', speed_hovertemplate, True, bps_line)
+        add_series(fig, sync_times, bps_ma, f'Sync Speed (MA) ({label})', speed_ma_hovertemplate, True, ma_line)
+
+        add_series(fig2, block_heights, sync_times, f'Sync Time ({label})', sync_time_hovertemplate(filename, 'x', 'y'), False, sync_time_line, sync_time_axis='y')
+        add_series(fig2, block_heights, bps, f'Sync Speed ({label})', speed_hovertemplate, True, bps_line)
+        add_series(fig2, block_heights, bps_ma, f'Sync Speed (MA) ({label})', speed_ma_hovertemplate, True, ma_line)
 
     # Update layout for fig2
     fig2.update_layout(
@@ -1974,79 +2343,77 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
     )
 
     # --- Distribution Graph ---
-    bins = dist_bins_values[bins_index]
     fig_dist_speed = go.Figure()
     fig_dist_time = go.Figure()
     fig_dist_speed_count = go.Figure()
     fig_dist_time_count = go.Figure()
 
 
-    def add_distribution_trace(fig, df, col, name, color, histnorm='probability density', custom_hovertemplate=None, xbins=None):
-        if not df.empty and col in df.columns:
-            data = df[col].dropna()
-            if len(data) > 1:
-                # Histogram
-                trace_args = {
-                    'x': data,
-                    'name': f'{name}',
-                    'marker_color': color,
-                    'opacity': 0.6,
-                    'histnorm': histnorm,
-                    'hovertemplate': custom_hovertemplate or '<b>Range</b>: %{x}<br><b>Density</b>: %{y}<extra></extra>',
-                    'showlegend': True
-                }
+    def add_distribution_trace(fig, data, name, color, histnorm='probability density', custom_hovertemplate=None, xbins=None):
+        """Adds a histogram and its KDE curve for a 1-D array of values (NaNs are ignored)."""
+        data = np.asarray(data, dtype=float)
+        data = data[~np.isnan(data)]
+        if len(data) > 1:
+            # Histogram
+            trace_args = {
+                'x': data,
+                'name': f'{name}',
+                'marker_color': color,
+                'opacity': 0.6,
+                'histnorm': histnorm,
+                'hovertemplate': custom_hovertemplate or '<b>Range</b>: %{x}<br><b>Density</b>: %{y}<extra></extra>',
+                'showlegend': True
+            }
 
-                # Use explicit binning if provided, otherwise let Plotly decide (nbinsx)
-                if xbins:
-                    trace_args['xbins'] = xbins
-                    # When using xbins, legend entries for histograms can be duplicated if KDE is also present.
-                    # We can handle this by naming them differently or controlling showlegend.
-                    # For simplicity, we will ensure the name is consistent.
-                else:
-                    trace_args['nbinsx'] = bins
-
-                fig.add_trace(go.Histogram(**trace_args))
-
-                # KDE Curve
-                if len(data) > 1:
-                    try:
-                        kde = gaussian_kde(data)
-                        x_range = np.linspace(data.min(), data.max(), 500)
-                        kde_values = kde(x_range)
-
-                        if histnorm == 'probability density':
-                            # Plot standard KDE for density
-                            fig.add_trace(go.Scatter(
-                                x=x_range, y=kde_values, mode='lines', name=f'{name} (KDE)',
-                                hovertemplate='<b>Value</b>: %{x:.2f}<br><b>Density</b>: %{y:.4f}<extra></extra>',
-                                line=dict(color=color, width=2), showlegend=True
-                            ))
-                        elif histnorm == '':
-                            # --- Visual Scaling for Count Plot to match its own histogram's peak ---
-                            hist_range = None
-                            if xbins:
-                                hist_range = (xbins['start'], xbins['end'])
-
-                            # 1. Generate histogram data for the *current* series to find its max bar height
-                            counts, _ = np.histogram(data, bins=bins, range=hist_range)
-                            max_hist_count = np.max(counts) if len(counts) > 0 else 1
-                            
-                            # 2. Find the peak of the raw KDE curve
-                            max_kde_density = kde_values.max()
-
-                            # 3. Calculate a scaling factor to match the histogram's peak
-                            scaling_factor = max_hist_count / max_kde_density if max_kde_density > 0 else 1
-                            scaled_kde_values = kde_values * scaling_factor if scaling_factor > 0 else kde_values
-
-                            fig.add_trace(go.Scatter(
-                                x=x_range, y=scaled_kde_values, mode='lines', name=f'{name} (Fit)',
-                                hovertemplate=f'<b>Value</b>: %{{x:.2f}}<br><b>Estimated Count Fit ({name})</b>: %{{y:.2f}}<extra></extra>',
-                                line=dict(color=color, width=2, dash='dash'), showlegend=True
-                            ))
-
-                    except Exception as e:
-                        # Catch potential errors during KDE calculation (e.g., singular matrix)
-                        print(f"Could not generate KDE for {name} - {col}: {e}")
+            # Use explicit binning if provided, otherwise let Plotly decide (nbinsx)
+            if xbins:
+                trace_args['xbins'] = xbins
+                # When using xbins, legend entries for histograms can be duplicated if KDE is also present.
+                # We can handle this by naming them differently or controlling showlegend.
+                # For simplicity, we will ensure the name is consistent.
+            else:
+                trace_args['nbinsx'] = bins
+
+            fig.add_trace(go.Histogram(**trace_args))
+
+            # KDE Curve
+            if len(data) > 1:
+                try:
+                    x_range, kde_values = kde_curve(data)
+
+                    if histnorm == 'probability density':
+                        # Plot standard KDE for density
+                        fig.add_trace(go.Scatter(
+                            x=x_range, y=kde_values, mode='lines', name=f'{name} (KDE)',
+                            hovertemplate='<b>Value</b>: %{x:.2f}<br><b>Density</b>: %{y:.4f}<extra></extra>',
+                            line=dict(color=color, width=2), showlegend=True
+                        ))
+                    elif histnorm == '':
+                        # --- Visual Scaling for Count Plot to match its own histogram's peak ---
+                        hist_range = None
+                        if xbins:
+                            hist_range = (xbins['start'], xbins['end'])
+
+                        # 1. Generate histogram data for the *current* series to find its max bar height
+                        counts, _ = np.histogram(data, bins=bins, range=hist_range)
+                        max_hist_count = np.max(counts) if len(counts) > 0 else 1
+                        
+                        # 2. Find the peak of the raw KDE curve
+                        max_kde_density = kde_values.max()
+
+                        # 3. Calculate a scaling factor to match the histogram's peak
+                        scaling_factor = max_hist_count / max_kde_density if max_kde_density > 0 else 1
+                        scaled_kde_values = kde_values * scaling_factor if scaling_factor > 0 else kde_values
+
+                        fig.add_trace(go.Scatter(
+                            x=x_range, y=scaled_kde_values, mode='lines', name=f'{name} (Fit)',
+                            hovertemplate=f'<b>Value</b>: %{{x:.2f}}<br><b>Estimated Count Fit ({name})</b>: %{{y:.2f}}<extra></extra>',
+                            line=dict(color=color, width=2, dash='dash'), showlegend=True
+                        ))
+
+                except Exception as e:
+                    # Catch potential errors during KDE calculation (e.g., singular matrix)
+                    print(f"Could not generate KDE for {name}: {e}")
 
 
     # --- Define explicit bins for consistent histograms ---
@@ -2062,33 +2429,24 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
     if not all_speed_data.empty:
         speed_bins = dict(start=all_speed_data.min(), end=all_speed_data.max(), size=(all_speed_data.max() - all_speed_data.min()) / bins)
 
-    # For Time Delta
-    time_delta_data_to_concat = []
-    if not df_original_display.empty and 'Accumulated_sync_in_progress_time[s]' in df_original_display.columns:
-        time_delta_data_to_concat.append(df_original_display['Accumulated_sync_in_progress_time[s]'].diff())
-    if not df_compare_display.empty and 'Accumulated_sync_in_progress_time[s]' in df_compare_display.columns:
-        time_delta_data_to_concat.append(df_compare_display['Accumulated_sync_in_progress_time[s]'].diff())
-    all_time_delta_data = pd.concat(time_delta_data_to_concat).dropna() if time_delta_data_to_concat else pd.Series(dtype=float)
+    # For Time Delta (computed once per file and reused by both time delta graphs)
+    time_delta_orig = displayed_time_deltas(df_original_display)
+    time_delta_comp = displayed_time_deltas(df_compare_display)
+    all_time_delta_data = np.concatenate([time_delta_orig, time_delta_comp])
 
     time_delta_bins = None
-    if not all_time_delta_data.empty:
+    if len(all_time_delta_data) > 0:
         time_delta_bins = dict(start=all_time_delta_data.min(), end=all_time_delta_data.max(), size=(all_time_delta_data.max() - all_time_delta_data.min()) / bins)
 
     # Sync Speed Distribution
-    add_distribution_trace(fig_dist_speed, df_original_display, 'Blocks_per_Second', 'Original', original_ma_color, xbins=speed_bins)
-    if not df_compare_display.empty:
-        add_distribution_trace(fig_dist_speed, df_compare_display, 'Blocks_per_Second', 'Comparison', 'magenta', xbins=speed_bins)
+    if not df_original_display.empty and 'Blocks_per_Second' in df_original_display.columns:
+        add_distribution_trace(fig_dist_speed, df_original_display['Blocks_per_Second'].to_numpy(), 'Original', original_ma_color, xbins=speed_bins)
+    if not df_compare_display.empty and 'Blocks_per_Second' in df_compare_display.columns:
+        add_distribution_trace(fig_dist_speed, df_compare_display['Blocks_per_Second'].to_numpy(), 'Comparison', 'magenta', xbins=speed_bins)
 
     # Sync Time Delta Distribution
-    if not df_original_display.empty:
-        time_delta_orig = df_original_display['Accumulated_sync_in_progress_time[s]'].diff().dropna()
-        if len(time_delta_orig) > 1:
-            add_distribution_trace(fig_dist_time, pd.DataFrame({'TimeDelta': time_delta_orig}), 'TimeDelta', 'Original', original_ma_color, xbins=time_delta_bins)
-
-    if not df_compare_display.empty:
-        time_delta_comp = df_compare_display['Accumulated_sync_in_progress_time[s]'].diff().dropna()
-        if len(time_delta_comp) > 1:
-            add_distribution_trace(fig_dist_time, pd.DataFrame({'TimeDelta': time_delta_comp}), 'TimeDelta', 'Comparison', 'magenta', xbins=time_delta_bins)
+    add_distribution_trace(fig_dist_time, time_delta_orig, 'Original', original_ma_color, xbins=time_delta_bins)
+    add_distribution_trace(fig_dist_time, time_delta_comp, 'Comparison', 'magenta', xbins=time_delta_bins)
 
 
     # --- Layout Updates for Distribution plots ---
@@ -2190,9 +2548,7 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
             # Fit curve
             try:
                 if len(speed_data_orig) > 1:
-                    kde = gaussian_kde(speed_data_orig)
-                    x_range = np.linspace(speed_data_orig.min(), speed_data_orig.max(), 500)
-                    kde_values = kde(x_range)
+                    x_range, kde_values = kde_curve(speed_data_orig)
                     max_hist_count = np.max(counts)
                     scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
                     fig_dist_speed_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Original (Fit)', line=dict(color=original_ma_color, width=2, dash='dash'), hovertemplate='<b>Speed</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
@@ -2213,9 +2569,7 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
             # Fit curve
             try:
                 if len(speed_data_comp) > 1:
-                    kde = gaussian_kde(speed_data_comp)
-                    x_range = np.linspace(speed_data_comp.min(), speed_data_comp.max(), 500)
-                    kde_values = kde(x_range)
+                    x_range, kde_values = kde_curve(speed_data_comp)
                     max_hist_count = np.max(counts)
                     scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
                     fig_dist_speed_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Comparison (Fit)', line=dict(color='magenta', width=2, dash='dash'), hovertemplate='<b>Speed</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
@@ -2227,50 +2581,42 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
 
     # --- TIME DELTA DISTRIBUTION ---
     # --- Original Data ---
-    if not df_original_display.empty and 'Accumulated_sync_in_progress_time[s]' in df_original_display.columns:
-        time_delta_orig = df_original_display['Accumulated_sync_in_progress_time[s]'].diff().dropna()
-        if not time_delta_orig.empty:
-            # Bar chart (Count)
-            counts, bin_edges = np.histogram(time_delta_orig, bins=bins, range=(time_delta_bins['start'], time_delta_bins['end']) if time_delta_bins else None)
-            bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
-            fig_dist_time_count.add_trace(go.Bar(x=bin_centers, y=counts, name='Original', marker_color=original_ma_color, opacity=0.6, hovertemplate='<b>Time Range</b>: %{x:.2f}s<br><b>Count</b>: %{y}<extra></extra>'))
-            # Fit curve
-            try:
-                if len(time_delta_orig) > 1:
-                    kde = gaussian_kde(time_delta_orig)
-                    x_range = np.linspace(time_delta_orig.min(), time_delta_orig.max(), 500)
-                    kde_values = kde(x_range)
-                    max_hist_count = np.max(counts)
-                    scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
-                    fig_dist_time_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Original (Fit)', line=dict(color=original_ma_color, width=2, dash='dash'), hovertemplate='<b>Time Delta</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
-            except Exception as e:
-                print(f"Could not generate KDE fit for Original Time Delta: {e}")
-            # Percentage curve
-            percentages = (counts / counts.sum() * 100) if counts.sum() > 0 else counts
-            fig_dist_time_count.add_trace(go.Scatter(x=bin_centers, y=percentages, yaxis='y2', mode='lines+markers', name='Original (%)', line=dict(color='orange', width=2), hovertemplate='<b>ΔTime Range</b>: %{x:.2f}s<br><b>Percentage</b>: %{y:.2f}%<extra></extra>'))
+    if len(time_delta_orig) > 0:
+        # Bar chart (Count)
+        counts, bin_edges = np.histogram(time_delta_orig, bins=bins, range=(time_delta_bins['start'], time_delta_bins['end']) if time_delta_bins else None)
+        bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+        fig_dist_time_count.add_trace(go.Bar(x=bin_centers, y=counts, name='Original', marker_color=original_ma_color, opacity=0.6, hovertemplate='<b>Time Range</b>: %{x:.2f}s<br><b>Count</b>: %{y}<extra></extra>'))
+        # Fit curve
+        try:
+            if len(time_delta_orig) > 1:
+                x_range, kde_values = kde_curve(time_delta_orig)
+                max_hist_count = np.max(counts)
+                scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
+                fig_dist_time_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Original (Fit)', line=dict(color=original_ma_color, width=2, dash='dash'), hovertemplate='<b>Time Delta</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
+        except Exception as e:
+            print(f"Could not generate KDE fit for Original Time Delta: {e}")
+        # Percentage curve
+        percentages = (counts / counts.sum() * 100) if counts.sum() > 0 else counts
+        fig_dist_time_count.add_trace(go.Scatter(x=bin_centers, y=percentages, yaxis='y2', mode='lines+markers', name='Original (%)', line=dict(color='orange', width=2), hovertemplate='<b>ΔTime Range</b>: %{x:.2f}s<br><b>Percentage</b>: %{y:.2f}%<extra></extra>'))
 
     # --- Comparison Data ---
-    if not df_compare_display.empty and 'Accumulated_sync_in_progress_time[s]' in df_compare_display.columns:
-        time_delta_comp = df_compare_display['Accumulated_sync_in_progress_time[s]'].diff().dropna()
-        if not time_delta_comp.empty:
-            # Bar chart (Count)
-            counts, bin_edges = np.histogram(time_delta_comp, bins=bins, range=(time_delta_bins['start'], time_delta_bins['end']) if time_delta_bins else None)
-            bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
-            fig_dist_time_count.add_trace(go.Bar(x=bin_centers, y=counts, name='Comparison', marker_color='magenta', opacity=0.6, hovertemplate='<b>Time Range</b>: %{x:.2f}s<br><b>Count</b>: %{y}<extra></extra>'))
-            # Fit curve
-            try:
-                if len(time_delta_comp) > 1:
-                    kde = gaussian_kde(time_delta_comp)
-                    x_range = np.linspace(time_delta_comp.min(), time_delta_comp.max(), 500)
-                    kde_values = kde(x_range)
-                    max_hist_count = np.max(counts)
-                    scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
-                    fig_dist_time_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Comparison (Fit)', line=dict(color='magenta', width=2, dash='dash'), hovertemplate='<b>Time Delta</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
-            except Exception as e:
-                print(f"Could not generate KDE fit for Comparison Time Delta: {e}")
-            # Percentage curve
-            percentages = (counts / counts.sum() * 100) if counts.sum() > 0 else counts
-            fig_dist_time_count.add_trace(go.Scatter(x=bin_centers, y=percentages, yaxis='y2', mode='lines+markers', name='Comparison (%)', line=dict(color='cyan', width=2), hovertemplate='<b>ΔTime Range</b>: %{x:.2f}s<br><b>Percentage</b>: %{y:.2f}%<extra></extra>'))
+    if len(time_delta_comp) > 0:
+        # Bar chart (Count)
+        counts, bin_edges = np.histogram(time_delta_comp, bins=bins, range=(time_delta_bins['start'], time_delta_bins['end']) if time_delta_bins else None)
+        bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+        fig_dist_time_count.add_trace(go.Bar(x=bin_centers, y=counts, name='Comparison', marker_color='magenta', opacity=0.6, hovertemplate='<b>Time Range</b>: %{x:.2f}s<br><b>Count</b>: %{y}<extra></extra>'))
+        # Fit curve
+        try:
+            if len(time_delta_comp) > 1:
+                x_range, kde_values = kde_curve(time_delta_comp)
+                max_hist_count = np.max(counts)
+                scaled_kde_values = kde_values * (max_hist_count / kde_values.max())
+                fig_dist_time_count.add_trace(go.Scatter(x=x_range, y=scaled_kde_values, mode='lines', name='Comparison (Fit)', line=dict(color='magenta', width=2, dash='dash'), hovertemplate='<b>Time Delta</b>: %{x:.2f}<br><b>Fit</b>: %{y:.2f}<extra></extra>'))
+        except Exception as e:
+            print(f"Could not generate KDE fit for Comparison Time Delta: {e}")
+        # Percentage curve
+        percentages = (counts / counts.sum() * 100) if counts.sum() > 0 else counts
+        fig_dist_time_count.add_trace(go.Scatter(x=bin_centers, y=percentages, yaxis='y2', mode='lines+markers', name='Comparison (%)', line=dict(color='cyan', width=2), hovertemplate='<b>ΔTime Range</b>: %{x:.2f}s<br><b>Percentage</b>: %{y:.2f}%<extra></extra>'))
 
     # --- Final layout update for count plots to fix yaxis2 range ---
     # This ensures the percentage axis doesn't rescale when traces are hidden.
@@ -2360,23 +2706,237 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
     )
 
     # --- Custom X-axis tick labels ---
-    # Determine the range of the x-axis from all plotted data
+    # Determine the range of the x-axis from all plotted data.
+    # Files whose sync time is not monotonic are still plotted, so the bounds come from the whole column.
     x_min, x_max = float('inf'), float('-inf')
-    if not df_original_display.empty:
-        x_min = min(x_min, df_original_display['Accumulated_sync_in_progress_time[s]'].min())
-        x_max = max(x_max, df_original_display['Accumulated_sync_in_progress_time[s]'].max())
-    if not df_compare_display.empty:
-        x_min = min(x_min, df_compare_display['Accumulated_sync_in_progress_time[s]'].min())
-        x_max = max(x_max, df_compare_display['Accumulated_sync_in_progress_time[s]'].max())
+    for df_display in (df_original_display, df_compare_display):
+        if not df_display.empty:
+            sync_times = df_display['Accumulated_sync_in_progress_time[s]'].to_numpy(dtype=float)
+            if np.isfinite(sync_times).any():
+                x_min = min(x_min, np.nanmin(sync_times))
+                x_max = max(x_max, np.nanmax(sync_times))
 
     if x_min != float('inf') and x_max != float('-inf'):
         # Generate about 5-10 tick values
-        tick_values = pd.to_numeric(pd.Series(pd.date_range(start=pd.to_datetime(x_min, unit='s'), end=pd.to_datetime(x_max, unit='s'), periods=8)).astype(int) / 10**9)
-        tick_text = [f"{int(val):,} sec<br>({format_seconds(val)})" for val in tick_values]
+        tick_values, tick_text = sync_time_axis_ticks(float(x_min), float(x_max))
         fig.update_xaxes(tickvals=tick_values, ticktext=tick_text)
 
     fig.update_xaxes(title_text="Sync in Progress Time [s]")
 
+    return fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count
+
+def get_cached_progress_figures(figures_key, *figure_args):
+    """
+    Returns the progress figures as Plotly JSON dicts, memoized in the server-side cache.
+    Going back to a previously used slider position or theme for the same file and block range
+    skips the rolling mean, histogram and KDE computations entirely.
+    """
+    figures = cache.get(figures_key)
+    if figures is None:
+        figures = [figure.to_plotly_json() for figure in build_progress_figures(*figure_args)]
+        cache.set(figures_key, figures)
+    return figures
+
+@app.callback(
+    [Output("progress-graph", "figure"),
+     Output("blockheight-vs-speed-graph", "figure"),
+     Output("distribution-graph-speed", "figure"), # type: ignore
+     Output("distribution-graph-time-delta", "figure"), # type: ignore
+     Output("distribution-graph-speed-count", "figure"), # type: ignore
+     Output("distribution-graph-time-delta-count", "figure"), # type: ignore
+     Output("progress-graph-title", "children"),
+     Output("blockheight-vs-speed-graph-title", "children"),
+     Output("distribution-graph-speed-title", "children"),
+     Output("distribution-graph-time-delta-title", "children"),
+     Output("distribution-graph-speed-count-title", "children"),
+     Output("distribution-graph-time-delta-count-title", "children"),
+     Output("total-time-display-container", "children"),
+     Output({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, "options"),
+     Output({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, "value"),
+     Output({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, "options"),
+     Output({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, "value"),
+     Output("main-callback-output", "figure"),
+     Output("data-table-container", "children"),
+     Output("data-table-container", "style"),
+     Output('raw-table-pagination', 'max_value'),
+     Output('raw-table-pagination-container', 'style'),
+    ],
+    [Input("ma-window-slider-1", "value"), # 0
+     Input("distribution-bins-slider-1", "value"),
+     Input('original-data-store', 'data'),
+     Input('compare-data-store', 'data'),
+     Input({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
+     Input({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
+     Input({'type': 'reset-view-button', 'prefix': dash.dependencies.ALL}, 'n_clicks'),
+     Input('show-data-table-switch', 'value'),
+     Input('theme-store', 'data'),
+     Input('raw-table-pagination', 'active_page')],
+)
+def update_progress_graph_and_time(window_index, bins_index, original_data, compare_data,
+                                   start_block_vals, end_block_vals, reset_clicks,
+                                   show_data_table, theme, active_page):
+    window = ma_windows[window_index]
+    ctx = dash.callback_context
+
+    # --- Define background based on theme ---
+    background_style = {'paper_bgcolor': 'rgba(0,0,0,0)', 'plot_bgcolor': 'rgba(0,0,0,0)'} if theme != 'light' else {}
+
+    # --- Map inputs to prefixes ---
+    # The order of inputs is: ma-slider, original-data, compare-data, start-block-vals, end-block-vals, ...
+    start_block_inputs = {} # start-block-dropdown values
+    if ctx.inputs_list[4]: # Input index for start-block-dropdown
+        start_block_inputs = {item['id']['prefix']: item.get('value') for item in ctx.inputs_list[4]} # type: ignore
+
+    end_block_inputs = {} # end-block-dropdown values
+    if ctx.inputs_list[5]: # Input index for end-block-dropdown
+        end_block_inputs = {item['id']['prefix']: item.get('value') for item in ctx.inputs_list[5]} # type: ignore
+
+    def create_chart_title_with_icon(title_text, metric_id):
+        """Creates a title component with an info icon."""
+        if metric_id in tooltip_texts:
+            return html.Div([ # type: ignore
+                html.H5(title_text, style={'display': 'inline-block', 'marginRight': '10px'}),
+                info_icon(metric_id, spaced=False)
+            ], style={'textAlign': 'center'})
+        return html.H5(title_text, style={'textAlign': 'center'})
+
+
+    # --- Load and process data from stores ---
+    df_progress_local = pd.DataFrame()
+    df_compare = pd.DataFrame()
+    original_filename = "sync_progress.csv" # Default filename
+    compare_filename = None
+
+    # Load original data (processed once per file content, see load_processed_store_df)
+    if original_data and 'cache_key' in original_data:
+        original_filename = original_data.get('filename', original_filename)
+        df_progress_local = load_processed_store_df(original_data, original_filename)
+
+    # Load comparison data
+    if compare_data and 'cache_key' in compare_data:
+        compare_filename = compare_data.get('filename')
+        df_compare = load_processed_store_df(compare_data, compare_filename)
+
+    # --- Handle Empty State ---
+    if df_progress_local.empty and df_compare.empty:
+        graph_template = 'plotly_dark' if theme != 'light' else 'plotly'
+        empty_fig = go.Figure()
+        empty_fig.update_layout( # type: ignore
+            title_text='Upload a sync_progress.csv file to begin',
+            template=graph_template,
+            **background_style
+        )
+        summary_table = create_combined_summary_table(pd.DataFrame(), pd.DataFrame(), "Original", "Comparison")
+        
+        # Correctly form empty outputs for pattern-matching callbacks by inspecting the full output list spec
+        num_start_dds = len(ctx.outputs_list[13])
+        num_start_vals_dds = len(ctx.outputs_list[14])
+        num_end_dds = len(ctx.outputs_list[15])
+        num_end_vals_dds = len(ctx.outputs_list[16])
+        empty_start_opts = [[] for _ in range(num_start_dds)]
+        empty_start_vals = [None] * num_start_vals_dds
+        empty_end_opts = [[] for _ in range(num_end_dds)]
+        empty_end_vals = [None] * num_end_vals_dds
+        # Return empty titles as well
+        return empty_fig, empty_fig, empty_fig, empty_fig, empty_fig, empty_fig, None, None, None, None, None, None, summary_table, empty_start_opts, empty_start_vals, empty_end_opts, empty_end_vals, {}, None, {'display': 'none'}, 1, {'display': 'none'}
+    # --- Prepare data for each card ---
+    data_map = {
+        'Original': {'df': df_progress_local, 'filename': original_filename, 'start_block': None, 'end_block': None, 'options': [], 'display_df': pd.DataFrame()},
+        'Comparison': {'df': df_compare, 'filename': compare_filename, 'start_block': None, 'end_block': None, 'options': [], 'display_df': pd.DataFrame()}
+    }
+
+    triggered_id = ctx.triggered_id
+    is_upload_or_clear = triggered_id in ['original-data-store', 'compare-data-store']
+    is_reset = isinstance(triggered_id, dict) and triggered_id.get('type') == 'reset-view-button'
+    # The dropdowns are re-rendered with the file cards whenever a store changes, so their options
+    # only need to be resent for triggers other than these view-only inputs
+    view_only_inputs = {'ma-window-slider-1.value', 'distribution-bins-slider-1.value',
+                        'show-data-table-switch.value', 'raw-table-pagination.active_page'}
+    options_unchanged = bool(ctx.triggered) and all(t['prop_id'] in view_only_inputs for t in ctx.triggered)
+    stores = {'Original': original_data, 'Comparison': compare_data}
+
+    # --- Calculate ranges and options for each file ---
+    for prefix_str, info in data_map.items():
+        df = info['df']
+        if not df.empty:
+            # Sorted unique heights are memoized per file
+            unique_heights = get_cached_block_heights(stores[prefix_str], df)
+            min_block, max_block = unique_heights[0], unique_heights[-1]
+            info['options'] = dash.no_update if options_unchanged else block_height_options(unique_heights)
+            
+            current_start = start_block_inputs.get(prefix_str)
+            current_end = end_block_inputs.get(prefix_str)
+
+            # Determine start and end blocks based on context
+            if is_reset and triggered_id.get('prefix') == prefix_str:
+                info['start_block'] = min_block
+                info['end_block'] = max_block
+            elif is_upload_or_clear or current_start is None or current_end is None:
+                info['start_block'] = min_block
+                info['end_block'] = max_block
+            else:
+                info['start_block'] = current_start
+                info['end_block'] = current_end
+
+            # Swap if start > end
+            if info['start_block'] is not None and info['end_block'] is not None and info['start_block'] > info['end_block']:
+                info['start_block'], info['end_block'] = info['end_block'], info['start_block']
+            
+            # Filter data for display.
+            # The shallow copy lets display-only columns be added without copying the data.
+            start, end = info['start_block'], info['end_block']
+            if start is None or end is None:
+                info['display_df'] = df.copy(deep=False)
+            else:
+                info['display_df'] = filter_block_range(df, start, end).copy(deep=False)
+
+    # --- Filter dataframes for display and metrics ---
+    df_original_display = data_map['Original']['display_df']
+    df_compare_display = data_map['Comparison']['display_df']
+
+    # Stats and figures are memoized per file (cache key) and selected block range
+    stats_keys = tuple(
+        f"{store['cache_key']}:{data_map[prefix]['start_block']}:{data_map[prefix]['end_block']}"
+        if store and store.get('cache_key') else None
+        for prefix, store in (('Original', original_data), ('Comparison', compare_data))
+    )
+
+    bins = dist_bins_values[bins_index]
+    # Create titles with icons
+    title1 = create_chart_title_with_icon(f'Block Height and Sync Speed vs. Sync Time (MA Window: {window})', 'progress-graph-title')
+    title2 = create_chart_title_with_icon(f'Sync Time and Sync Speed vs. Block Height (MA Window: {window})', 'blockheight-vs-speed-graph-title')
+    title3 = create_chart_title_with_icon(f'Sync Speed Distribution (Bins: {bins})', 'distribution-graph-speed-title')
+    title4 = create_chart_title_with_icon(f'Sync Time Delta Distribution (Bins: {bins})', 'distribution-graph-time-delta-title')
+    title5 = create_chart_title_with_icon(f'Sync Speed Distribution (Counts, Bins: {bins})', 'distribution-graph-speed-count-title')
+    title6 = create_chart_title_with_icon(f'Sync Time Delta Distribution (Counts, Bins: {bins})', 'distribution-graph-time-delta-count-title')
+
+    # --- Partial updates for triggers that only affect some of the figures ---
+    triggered_props = {t['prop_id'] for t in ctx.triggered} if ctx.triggered else set()
+    # Wildcard (ALL) outputs need one no_update per matched component
+    partial_outputs = [[dash.no_update] * len(spec) if isinstance(spec, list) else dash.no_update
+                       for spec in ctx.outputs_list]
+    if triggered_props == {'ma-window-slider-1.value'}:
+        # The MA window only changes the MA traces of the two line graphs
+        partial_outputs[0], partial_outputs[1] = ma_window_figure_patches(df_original_display, df_compare_display, window)
+        partial_outputs[6], partial_outputs[7] = title1, title2
+        return partial_outputs
+
+    # --- Build figures (memoized per file, block range, slider values and theme) ---
+    figures_key = f"figures:{stats_keys[0]}:{stats_keys[1]}:{original_filename}:{compare_filename}:{window}:{bins}:{theme}"
+    fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count = get_cached_progress_figures(
+        figures_key, df_original_display, df_compare_display, original_filename, compare_filename, window, bins, theme
+    )
+
+    if triggered_props == {'distribution-bins-slider-1.value'}:
+        # The bin count only changes the four distribution graphs
+        partial_outputs[2:6] = [fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count]
+        partial_outputs[8:12] = [title3, title4, title5, title6]
+        return partial_outputs
+    if triggered_id == 'theme-store':
+        # Only the figures depend on the theme; the block range outputs keep their per-component no_update lists
+        partial_outputs[0:6] = [fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count]
+        return partial_outputs
+
     # --- Prepare outputs for dropdowns ---
     # The order of outputs is determined by Dash. We get it from ctx.outputs_grouping.
     # Use ctx.outputs_list which is more reliable for pattern-matching callbacks.
@@ -2392,20 +2952,52 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
         df_original_display,
         df_compare_display,
         table_title_original,
-        table_title_compare
+        table_title_compare,
+        stats_keys
     )
 
     # --- Generate Raw Data Table ---
+    # The table only depends on the data, the block ranges and the active page. When it is hidden and
+    # stays hidden, or only figure inputs changed, its outputs are left as they are.
+    figure_only_inputs = {'ma-window-slider-1.value', 'distribution-bins-slider-1.value', 'theme-store.data'}
+    table_toggled = not ctx.triggered or 'show-data-table-switch.value' in triggered_props
+    table_needs_update = table_toggled or (show_data_table and not triggered_props <= figure_only_inputs)
+    if not table_needs_update:
+        return (fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count, title1, title2, title3, title4, title5, title6, summary_table, output_start_opts, output_start_vals, output_end_opts, output_end_vals, {},
+                dash.no_update, dash.no_update, dash.no_update, dash.no_update)
+
     table_children = []
     table_style = {'display': 'none'}
-    if show_data_table:
+    table_num_pages = 1
+
+    def current_page(df_table):
+        """Returns only the rows of the active page; the full table is never rendered at once."""
+        nonlocal table_num_pages
+        table_num_pages = max(1, -(-len(df_table) // raw_table_page_size))
+        page = min(max(active_page or 1, 1), table_num_pages)
+        return df_table.iloc[(page - 1) * raw_table_page_size:page * raw_table_page_size]
+
+    # Rendered pages are memoized per file, block range and page, like the figures
+    table_key = f"table:{stats_keys[0]}:{stats_keys[1]}:{original_filename}:{compare_filename}:{active_page}"
+    cached_table = cache.get(table_key) if show_data_table else None
+    if cached_table is not None:
+        table_style = {'display': 'block'}
+        table_children, table_num_pages = cached_table
+    elif show_data_table:
         table_style = {'display': 'block'}
         data_col_names = {
             'Accumulated_sync_in_progress_time[s]': 'Sync Time [s]',
-            'SyncTime_Formatted': 'Sync Time [Formatted]',
             'Blocks_per_Second': 'Sync Speed [Blocks/sec]'
         }
         cols_to_show = ['Block_height'] + list(data_col_names.keys())
+        # The formatted sync time is derived from the rows of the active page only, after paging
+        display_names = ('Sync Time [s]', 'Sync Time [Formatted]', 'Sync Speed [Blocks/sec]')
+
+        def single_file_page(df_display):
+            """Returns the active page of a single-file table, with its sync times formatted."""
+            df_table = current_page(df_display[cols_to_show].rename(columns={'Block_height': 'Block Height', **data_col_names})).copy()
+            df_table.insert(2, 'Sync Time [Formatted]', format_seconds_array(df_table['Sync Time [s]'].to_numpy()))
+            return df_table
 
         # Check if dataframes have been processed and have the necessary columns
         original_valid = not df_original_display.empty and all(c in df_original_display.columns for c in cols_to_show)
@@ -2413,245 +3005,149 @@ def update_progress_graph_and_time(window_index, bins_index, original_data, comp
         
         if original_valid and compare_valid:
             # --- Merged Table Logic for Fixed Header ---
-            df_orig_subset = df_original_display[cols_to_show].rename(columns=data_col_names)
-            df_comp_subset = df_compare_display[cols_to_show].rename(columns=data_col_names)
-            df_merged = pd.merge(
-                df_orig_subset,
-                df_comp_subset,
-                on='Block_height',
-                how='outer',
-                suffixes=('_orig', '_comp')
-            ).sort_values(by='Block_height').reset_index(drop=True)
-            df_merged.rename(columns={'Block_height': 'Block Height'}, inplace=True)
+            df_orig_subset = df_original_display[cols_to_show].rename(columns=data_col_names).set_index('Block_height')
+            df_comp_subset = df_compare_display[cols_to_show].rename(columns=data_col_names).set_index('Block_height')
+            if df_orig_subset.index.is_unique and df_comp_subset.index.is_unique:
+                # Align both files on block height in a single outer join of their indices
+                df_merged = pd.concat(
+                    [df_orig_subset.add_suffix('_orig'), df_comp_subset.add_suffix('_comp')], axis=1
+                ).sort_index()
+            else:
+                # Repeated block heights need the row-by-row pairing of a merge
+                df_merged = pd.merge(
+                    df_orig_subset,
+                    df_comp_subset,
+                    left_index=True,
+                    right_index=True,
+                    how='outer',
+                    suffixes=('_orig', '_comp')
+                ).sort_index()
+            df_merged = df_merged.rename_axis('Block Height').reset_index()
+            df_merged = current_page(df_merged).copy()
+            for suffix in ('_orig', '_comp'):
+                # Rows missing from one file after the join stay empty rather than 'N/A'
+                sync_times = df_merged[f"Sync Time [s]{suffix}"]
+                df_merged[f"Sync Time [Formatted]{suffix}"] = np.where(
+                    sync_times.isna().to_numpy(), None, format_seconds_array(sync_times.to_numpy())
+                )
 
             # --- Build Header Table ---
             left_border_style = {'borderLeft': '1px solid black'}
             # Define column widths for synchronization. This ensures header and body columns align.
-            col_widths = ['16%'] + ['12%', '18%', '12%'] * 2
-            col_group = html.Colgroup([html.Col(style={'width': w}) for w in col_widths])
+            col_group = table_colgroup(raw_table_merged_col_widths)
 
             # --- Build Combined Header Table ---
             file_name_header_row = html.Tr([
                 html.Th(""),  # Spacer for Block Height
-                html.Th(f"Original: {original_filename}", colSpan=len(data_col_names), className="text-center", style={'fontWeight': 'normal', 'wordBreak': 'break-all'}),
-                html.Th(f"Comparison: {compare_filename}", colSpan=len(data_col_names), className="text-center", style={'fontWeight': 'normal', 'wordBreak': 'break-all', **left_border_style})
+                html.Th(f"Original: {original_filename}", colSpan=len(display_names), className="text-center", style={'fontWeight': 'normal', 'wordBreak': 'break-all'}),
+                html.Th(f"Comparison: {compare_filename}", colSpan=len(display_names), className="text-center", style={'fontWeight': 'normal', 'wordBreak': 'break-all', **left_border_style})
             ])
 
             comparison_headers = [
-                create_header_with_tooltip(col, col, style=left_border_style if i == 0 else None)
-                for i, col in enumerate(data_col_names.values())
+                table_header_cell(col, left_border=i == 0)
+                for i, col in enumerate(display_names)
             ]
             column_name_header_row = html.Tr(
-                [create_header_with_tooltip("Block Height", "Block Height")] +
-                [create_header_with_tooltip(col, col) for col in data_col_names.values()] +
+                [table_header_cell("Block Height")] +
+                [table_header_cell(col) for col in display_names] +
                 comparison_headers
             )
 
             header_table_children = [html.Thead([file_name_header_row, column_name_header_row])]
-            header_table_style = {
-                'tableLayout': 'fixed', 'width': '100%',
-                'position': 'sticky', 'top': 0, 'zIndex': 2, # type: ignore
-                'backgroundColor': 'var(--bs-body-bg, white)'
-            }
-            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=header_table_style)
+            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=raw_table_header_style)
             # --- Build Body Table ---
-            body_rows = []
-            for _, row in df_merged.iterrows():
-                row_data = [html.Td(f"{int(row['Block Height']):,}" if pd.notna(row['Block Height']) else "")]
-                
-                numeric_metrics_info = {
-                    'Sync Time [s]': {'higher_is_better': False},
-                    'Sync Speed [Blocks/sec]': {'higher_is_better': True}
-                }
+            # Cell strings and difference annotations are built column by column, then zipped into rows
+            # Each difference is computed once; the comparison side shows it negated
+            metric_values = {
+                (display_name, suffix): df_merged[f"{display_name}{suffix}"].to_numpy(dtype=float)
+                for display_name in raw_table_numeric_metrics for suffix in ('_orig', '_comp')
+            }
+            metric_diffs = {
+                display_name: metric_values[(display_name, '_orig')] - metric_values[(display_name, '_comp')]
+                for display_name in raw_table_numeric_metrics
+            }
 
-                # Add original columns' cells
-                for display_name in data_col_names.values():
-                    orig_val = row.get(f"{display_name}_orig")
-
-                    # Format the main value
-                    if pd.isna(orig_val):
-                        cell_content = [""]
-                    elif isinstance(orig_val, float):
-                        cell_content = [f"{orig_val:.2f}"]
-                    else:
-                        cell_content = [str(orig_val)]
-
-                    # Calculate and add the difference if it's a numeric metric
-                    if display_name in numeric_metrics_info:
-                        comp_val = row.get(f"{display_name}_comp")
-                        if pd.notna(orig_val) and pd.notna(comp_val):
-                            diff = orig_val - comp_val
-                            is_better = (diff > 0) if numeric_metrics_info[display_name]['higher_is_better'] else (diff < 0)
-                            color_class = "text-success" if is_better else "text-danger" if diff != 0 else ""
-                            if color_class:
-                                percent_diff_str = ""
-                                if comp_val != 0:
-                                    percent_diff = (diff / abs(comp_val)) * 100
-                                    percent_diff_str = f", {percent_diff:+.1f}%"
-
-                                if display_name == 'Sync Time [s]':
-                                    diff_str = f" ({diff:+.2f}s{percent_diff_str})"
-                                else:
-                                    diff_str = f" ({diff:+.2f}{percent_diff_str})"
-                                cell_content.append(html.Span(diff_str, className=f"small {color_class} fw-bold"))
-                    elif display_name == 'Sync Time [Formatted]':
-                        orig_s_val = row.get('Sync Time [s]_orig')
-                        comp_s_val = row.get('Sync Time [s]_comp')
-                        if pd.notna(orig_s_val) and pd.notna(comp_s_val):
-                            diff = orig_s_val - comp_s_val
-                            color_class = "text-success" if diff < 0 else "text-danger" if diff != 0 else ""
-                            if color_class:
-                                sign = "+" if diff > 0 else "-"
-                                diff_str = f" ({sign}{format_seconds(abs(diff))})"
-                                cell_content.append(html.Span(diff_str, className=f"small {color_class} fw-bold"))
-                    row_data.append(html.Td(cell_content))
-
-                # Add comparison columns' cells
-                for i, display_name in enumerate(data_col_names.values()):
-                    cell_style = {'borderLeft': '1px solid black'} if i == 0 else {}
-                    
-                    comp_val = row.get(f"{display_name}_comp")
-                    
-                    # Format the main value
-                    if pd.isna(comp_val):
-                        cell_content = [""]
-                    elif isinstance(comp_val, float):
-                        cell_content = [f"{comp_val:.2f}"]
-                    else:
-                        cell_content = [str(comp_val)]
-
-                    # Calculate and add the difference if it's a numeric metric
-                    if display_name in numeric_metrics_info:
-                        orig_val = row.get(f"{display_name}_orig")
-                        if pd.notna(orig_val) and pd.notna(comp_val):
-                            diff = comp_val - orig_val
-                            is_better = (diff > 0) if numeric_metrics_info[display_name]['higher_is_better'] else (diff < 0)
-                            color_class = "text-success" if is_better else "text-danger" if diff != 0 else ""
-                            if color_class:
-                                percent_diff_str = ""
-                                if orig_val != 0:
-                                    percent_diff = (diff / abs(orig_val)) * 100
-                                    percent_diff_str = f", {percent_diff:+.1f}%"
-
-                                if display_name == 'Sync Time [s]':
-                                    diff_str = f" ({diff:+.2f}s{percent_diff_str})"
-                                else:
-                                    diff_str = f" ({diff:+.2f}{percent_diff_str})"
-                                cell_content.append(html.Span(diff_str, className=f"small {color_class} fw-bold"))
-                    elif display_name == 'Sync Time [Formatted]':
-                        orig_s_val = row.get('Sync Time [s]_orig')
-                        comp_s_val = row.get('Sync Time [s]_comp')
-                        if pd.notna(orig_s_val) and pd.notna(comp_s_val):
-                            diff = comp_s_val - orig_s_val
-                            color_class = "text-success" if diff < 0 else "text-danger" if diff != 0 else ""
-                            if color_class:
-                                sign = "+" if diff > 0 else "-"
-                                diff_str = f" ({sign}{format_seconds(abs(diff))})"
-                                cell_content.append(html.Span(diff_str, className=f"small {color_class} fw-bold"))
-
-                    row_data.append(html.Td(cell_content, style=cell_style))
-
-                body_rows.append(html.Tr(row_data))
-
-            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style={'tableLayout': 'fixed', 'width': '100%', 'marginTop': '-1px'})
+            def column_cells(display_name, suffix, other_suffix, style=None):
+                texts = format_table_column(df_merged[f"{display_name}{suffix}"], display_name)
+                metric = 'Sync Time [s]' if display_name == 'Sync Time [Formatted]' else display_name
+                if metric in raw_table_numeric_metrics:
+                    diff = metric_diffs[metric] if suffix == '_orig' else -metric_diffs[metric]
+                    spans = table_diff_spans(
+                        diff, metric_values[(metric, other_suffix)],
+                        raw_table_numeric_metrics[metric]['higher_is_better'],
+                        unit='s' if display_name == 'Sync Time [s]' else '',
+                        as_duration=display_name == 'Sync Time [Formatted]'
+                    )
+                else:
+                    spans = [None] * len(texts)
+                cell_props = {'style': style} if style else {}
+                return [html.Td([text] if span is None else [text, span], **cell_props) for text, span in zip(texts, spans)]
+
+            block_height_cells = [html.Td(text) for text in format_table_column(df_merged['Block Height'], 'Block Height')]
+            original_columns = [column_cells(display_name, '_orig', '_comp') for display_name in display_names]
+            comparison_columns = [
+                column_cells(display_name, '_comp', '_orig', style=left_border_style if i == 0 else None)
+                for i, display_name in enumerate(display_names)
+            ]
+            body_rows = [html.Tr(list(cells)) for cells in zip(block_height_cells, *original_columns, *comparison_columns)]
+
+            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style=raw_table_body_style)
             
             # --- Combine into a single container ---
             scrollable_div = html.Div(
                 [header_table, body_table],
-                style={'maxHeight': '500px', 'overflowY': 'auto', 'width': '100%'}
+                style=raw_table_scroll_style
             )
             table_children.append(scrollable_div)
 
         elif original_valid:
             # Single table
-            col_names = {'Block_height': 'Block Height', **data_col_names}
-            df_orig_table = df_original_display[cols_to_show].rename(columns=col_names)
+            df_orig_table = single_file_page(df_original_display)
 
             # --- Title (Non-scrollable) ---
             table_children.append(html.H6(f"Original: {original_filename}", style={'wordBreak': 'break-all'}))
 
             # --- Define column widths and create Colgroup ---
-            col_widths = ['25%', '20%', '35%', '20%']
-            col_group = html.Colgroup([html.Col(style={'width': w}) for w in col_widths])
+            col_group = table_colgroup(raw_table_single_col_widths)
 
             # --- Header Table ---
-            header_table_children = [html.Thead(html.Tr([create_header_with_tooltip(col, col) for col in df_orig_table.columns]))]
-            header_table_style = {
-                'tableLayout': 'fixed', 'width': '100%',
-                'position': 'sticky', 'top': 0, 'zIndex': 2, # type: ignore
-                'backgroundColor': 'var(--bs-body-bg, white)'
-            }
-            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=header_table_style)
+            header_table_children = [html.Thead(html.Tr([table_header_cell(col) for col in df_orig_table.columns]))]
+            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=raw_table_header_style)
 
             # --- Body Table ---
-            body_rows = []
-            for _, row in df_orig_table.iterrows():
-                row_data = []
-                for col in df_orig_table.columns:
-                    val = row.get(col)
-                    if pd.isna(val):
-                        row_data.append(html.Td(""))
-                    elif col == 'Block Height' and pd.notna(val):
-                        row_data.append(html.Td(f"{int(val):,}"))
-                    elif isinstance(val, float):
-                        row_data.append(html.Td(f"{val:.2f}"))
-                    else:
-                        row_data.append(html.Td(val))
-                body_rows.append(html.Tr(row_data))
+            column_texts = [format_table_column(df_orig_table[col], col) for col in df_orig_table.columns]
+            body_rows = [html.Tr([html.Td(text) for text in row]) for row in zip(*column_texts)]
             
-            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style={'tableLayout': 'fixed', 'width': '100%', 'marginTop': '-1px'})
+            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style=raw_table_body_style)
             
             # --- Combine into a single container ---
             scrollable_div = html.Div(
                 [header_table, body_table],
-                style={'maxHeight': '500px', 'overflowY': 'auto', 'width': '100%'}
+                style=raw_table_scroll_style
             )
             table_children.append(scrollable_div)
         elif compare_valid:
             # Single table for comparison data
-            col_names = {'Block_height': 'Block Height', **data_col_names}
-            df_comp_table = df_compare_display[cols_to_show].rename(columns=col_names)
+            df_comp_table = single_file_page(df_compare_display)
 
             table_children.append(html.H6(f"Comparison: {compare_filename}", style={'wordBreak': 'break-all'}))
-            col_widths = ['25%', '20%', '35%', '20%']
-            col_group = html.Colgroup([html.Col(style={'width': w}) for w in col_widths])
-            header_table_children = [html.Thead(html.Tr([create_header_with_tooltip(col, col) for col in df_comp_table.columns]))]
-            header_table_style = {
-                'tableLayout': 'fixed', 'width': '100%',
-                'position': 'sticky', 'top': 0, 'zIndex': 2,
-                'backgroundColor': 'var(--bs-body-bg, white)'
-            }
-            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=header_table_style)
-            body_rows = []
-            for _, row in df_comp_table.iterrows():
-                row_data = []
-                for col in df_comp_table.columns:
-                    val = row.get(col)
-                    if pd.isna(val):
-                        row_data.append(html.Td(""))
-                    elif col == 'Block Height' and pd.notna(val):
-                        row_data.append(html.Td(f"{int(val):,}"))
-                    elif isinstance(val, float):
-                        row_data.append(html.Td(f"{val:.2f}"))
-                    else:
-                        row_data.append(html.Td(val))
-                body_rows.append(html.Tr(row_data))
-            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style={'tableLayout': 'fixed', 'width': '100%', 'marginTop': '-1px'}) # type: ignore
-            scrollable_div = html.Div([header_table, body_table], style={'maxHeight': '500px', 'overflowY': 'auto', 'width': '100%'})
+            col_group = table_colgroup(raw_table_single_col_widths)
+            header_table_children = [html.Thead(html.Tr([table_header_cell(col) for col in df_comp_table.columns]))]
+            header_table = dbc.Table([col_group] + header_table_children, bordered=True, className="mb-0", style=raw_table_header_style)
+            column_texts = [format_table_column(df_comp_table[col], col) for col in df_comp_table.columns]
+            body_rows = [html.Tr([html.Td(text) for text in row]) for row in zip(*column_texts)]
+            body_table = dbc.Table([col_group, html.Tbody(body_rows)], striped=True, bordered=True, hover=True, style=raw_table_body_style) # type: ignore
+            scrollable_div = html.Div([header_table, body_table], style=raw_table_scroll_style)
             table_children.append(scrollable_div)
         else:
             table_children = [html.P("No data to display in table.")]
+        cache.set(table_key, (table_children, table_num_pages))
+
+    pagination_style = {'display': 'block'} if show_data_table and table_num_pages > 1 else {'display': 'none'}
 
-    # Create titles with icons
-    title1 = create_chart_title_with_icon(f'Block Height and Sync Speed vs. Sync Time (MA Window: {window})', 'progress-graph-title')
-    title2 = create_chart_title_with_icon(f'Sync Time and Sync Speed vs. Block Height (MA Window: {window})', 'blockheight-vs-speed-graph-title')
-    title3 = create_chart_title_with_icon(f'Sync Speed Distribution (Bins: {bins})', 'distribution-graph-speed-title')
-    title4 = create_chart_title_with_icon(f'Sync Time Delta Distribution (Bins: {bins})', 'distribution-graph-time-delta-title')
-    title5 = create_chart_title_with_icon(f'Sync Speed Distribution (Counts, Bins: {bins})', 'distribution-graph-speed-count-title')
-    title6 = create_chart_title_with_icon(f'Sync Time Delta Distribution (Counts, Bins: {bins})', 'distribution-graph-time-delta-count-title')
 
 
-    return fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count, title1, title2, title3, title4, title5, title6, summary_table, output_start_opts, output_start_vals, output_end_opts, output_end_vals, {}, table_children, table_style
+    return fig, fig2, fig_dist_speed, fig_dist_time, fig_dist_speed_count, fig_dist_time_count, title1, title2, title3, title4, title5, title6, summary_table, output_start_opts, output_start_vals, output_end_opts, output_end_vals, {}, table_children, table_style, table_num_pages, pagination_style
 
 @app.callback(
     Output('action-feedback-store', 'data', allow_duplicate=True),
@@ -2682,21 +3178,15 @@ def hide_no_file_alert(original_data):
     [Output("tooltip-modal", "is_open"),
      Output("tooltip-modal-title", "children"),
      Output("tooltip-modal-body", "children")],
-    [Input({'type': 'info-icon', 'metric': dash.dependencies.ALL}, 'n_clicks')],
+    [Input('info-request-store', 'data')],
     prevent_initial_call=True
 )
-def show_tooltip_modal(n_clicks):
-    ctx = dash.callback_context
-    # This is the most robust way to check for a real user click.
-    # It verifies that the callback was triggered and that the trigger value is a positive integer (not None or 0).
-    # This prevents the modal from appearing when its inputs are re-rendered by another callback (e.g., by the slider).
-    if not ctx.triggered or not ctx.triggered[0]['value']:
-        raise dash.exceptions.PreventUpdate
-    triggered_id_dict = ctx.triggered_id
-    # A final safety check in case the triggered_id is None
-    if not triggered_id_dict:
+def show_tooltip_modal(info_request):
+    # Info icons carry their metric in a data-metric attribute; a delegated clientside
+    # listener writes the clicked one into info-request-store.
+    if not info_request:
         raise dash.exceptions.PreventUpdate
-    metric_id = triggered_id_dict['metric']
+    metric_id = info_request['metric']
     # Handle prefixed metric IDs from metadata cards (e.g., "Original-Hostname")
     # and non-prefixed IDs from other parts of the app.
     if '-' in metric_id and any(metric_id.startswith(p) for p in ['Original-', 'Comparison-']):
@@ -2768,129 +3258,122 @@ def update_unsaved_changes_badge(unsaved_data, ids):
     return styles
 
 @app.callback(
-    [Output('original-data-store', 'data', allow_duplicate=True),
+    [Output('original-metadata-store', 'data', allow_duplicate=True),
      Output('unsaved-changes-store', 'data', allow_duplicate=True)],
     Input({'type': 'add-metadata-button', 'prefix': 'Original'}, 'n_clicks'),
     [
         State({'type': 'metadata-key-input', 'prefix': 'Original'}, 'value'),
         State({'type': 'metadata-value-input', 'prefix': 'Original'}, 'value'),
-        State('original-data-store', 'data'),
+        State('original-metadata-store', 'data'),
         State('unsaved-changes-store', 'data')
     ],
     prevent_initial_call=True
 )
-def add_original_metadata(n_clicks, key, value, store_data, unsaved_data):
+def add_original_metadata(n_clicks, key, value, metadata, unsaved_data):
     if not n_clicks or not key or value is None:
         raise dash.exceptions.PreventUpdate
 
-    if store_data and 'metadata' in store_data:
-        store_data['metadata'][key.strip()] = value.strip()
+    if metadata is not None:
+        metadata[key.strip()] = value.strip()
         unsaved_data['Original'] = True
-        return store_data, unsaved_data
+        return metadata, unsaved_data
     
     raise dash.exceptions.PreventUpdate
 
 @app.callback(
-    [Output('original-data-store', 'data', allow_duplicate=True),
+    [Output('original-metadata-store', 'data', allow_duplicate=True),
+     Output('compare-metadata-store', 'data', allow_duplicate=True),
      Output('unsaved-changes-store', 'data', allow_duplicate=True)],
-    Input({'type': 'metadata-input', 'prefix': 'Original', 'key': dash.dependencies.ALL}, 'value'),
-    [State('original-data-store', 'data'),
+    Input('metadata-edit-store', 'data'),
+    [State('original-metadata-store', 'data'),
+     State('compare-metadata-store', 'data'),
      State('unsaved-changes-store', 'data')],
     prevent_initial_call=True
 )
-def update_original_metadata(values, store_data, unsaved_data):
-    ctx = dash.callback_context
-    if not ctx.triggered_id:
+def update_metadata_values(edits, original_metadata, compare_metadata, unsaved_data):
+    # Edited values arrive batched per prefix from the delegated clientside change listener
+    if not edits:
         raise dash.exceptions.PreventUpdate
-    
-    key = ctx.triggered_id['key']
-    value = ctx.triggered[0]['value']
-
-    if store_data and 'metadata' in store_data and store_data['metadata'].get(key) != value:
-        store_data['metadata'][key] = value
-        unsaved_data['Original'] = True
-        return store_data, unsaved_data
-    
-    raise dash.exceptions.PreventUpdate
 
-@app.callback(
-    [Output('compare-data-store', 'data', allow_duplicate=True),
-     Output('unsaved-changes-store', 'data', allow_duplicate=True)],
-    Input({'type': 'metadata-input', 'prefix': 'Comparison', 'key': dash.dependencies.ALL}, 'value'),
-    [State('compare-data-store', 'data'),
-     State('unsaved-changes-store', 'data')],
-    prevent_initial_call=True
-)
-def update_compare_metadata(values, store_data, unsaved_data):
-    ctx = dash.callback_context
-    if not ctx.triggered_id:
+    outputs = [dash.no_update, dash.no_update]
+    changed = False
+    for i, (prefix, metadata) in enumerate((('Original', original_metadata), ('Comparison', compare_metadata))):
+        changes = edits.get(prefix)
+        if metadata is None or not changes:
+            continue
+        changes = {key: value for key, value in changes.items() if metadata.get(key) != value}
+        if changes:
+            metadata.update(changes)
+            unsaved_data[prefix] = True
+            outputs[i] = metadata
+            changed = True
+
+    if not changed:
         raise dash.exceptions.PreventUpdate
-    
-    key = ctx.triggered_id['key']
-    value = ctx.triggered[0]['value']
-
-    if store_data and 'metadata' in store_data and store_data['metadata'].get(key) != value:
-        store_data['metadata'][key] = value
-        unsaved_data['Comparison'] = True
-        return store_data, unsaved_data
-    
-    raise dash.exceptions.PreventUpdate
+    return outputs[0], outputs[1], unsaved_data
 
 @app.callback(
-    [Output('compare-data-store', 'data', allow_duplicate=True),
+    [Output('compare-metadata-store', 'data', allow_duplicate=True),
      Output('unsaved-changes-store', 'data', allow_duplicate=True)],
     Input({'type': 'add-metadata-button', 'prefix': 'Comparison'}, 'n_clicks'),
     [
         State({'type': 'metadata-key-input', 'prefix': 'Comparison'}, 'value'),
         State({'type': 'metadata-value-input', 'prefix': 'Comparison'}, 'value'),
-        State('compare-data-store', 'data'),
+        State('compare-metadata-store', 'data'),
         State('unsaved-changes-store', 'data')
     ],
     prevent_initial_call=True
 )
-def add_compare_metadata(n_clicks, key, value, store_data, unsaved_data):
+def add_compare_metadata(n_clicks, key, value, metadata, unsaved_data):
     if not n_clicks or not key or value is None:
         raise dash.exceptions.PreventUpdate
 
-    if store_data and 'metadata' in store_data:
-        store_data['metadata'][key.strip()] = value.strip()
+    if metadata is not None:
+        metadata[key.strip()] = value.strip()
         unsaved_data['Comparison'] = True
-        return store_data, unsaved_data
+        return metadata, unsaved_data
     
     raise dash.exceptions.PreventUpdate
 
+# Suffixes added to saved filenames, stripped in this order (from the end) before new ones are added
+saved_filename_suffix_patterns = (
+    re.compile(r'_\d+$'),  # sequence number (_1)
+    re.compile(r'_\d{8}_\d{6}$'),  # timestamp
+    re.compile(r'_hostname_[\w\.\-]+$'), # hostname
+    re.compile(r'_range_\d+-\d+$'), # range suffix
+)
+hostname_unsafe_chars = re.compile(r'[^\w\.\-]')
+
+# Rows formatted per to_csv chunk when saving
+csv_write_chunksize = 50_000
+
+def write_csv_file(filepath, df, metadata):
+    """Writes the metadata block followed by the data rows straight to the file, without an in-memory copy."""
+    with open(filepath, "w", encoding="utf-8") as f:
+        # Write metadata as a single block, ended by the separator line
+        if metadata:
+            f.write("Property;Value\n" + "".join(f"{key};{value}\n" for key, value in metadata.items()) + ";;\n")
+
+        # Write dataframe, formatted in chunks to bound the intermediate buffer of very large frames
+        df.to_csv(f, sep=';', index=False, lineterminator='\n', chunksize=csv_write_chunksize)
+
 def write_csv_new(store_data, filter_range, start_block, end_block):
     if not store_data:
         return "No data in store to save."
 
     filename = store_data.get('filename', 'unknown_file.csv')
     metadata = store_data.get('metadata', {})
-    df_json = store_data.get('data')
+    df = load_store_df(store_data)
 
-    if not df_json:
+    if df.empty:
         return f"No data content found for '{filename}'."
 
-    df = pd.read_json(io.StringIO(df_json), orient='split')
-
     # Apply filters based on options
     suffix = ""
     if filter_range and start_block is not None and end_block is not None:
-        df = df[(df['Block_height'] >= start_block) & (df['Block_height'] <= end_block)]
+        df = filter_block_range(df, start_block, end_block)
         suffix += f"_range_{int(start_block)}-{int(end_block)}"
 
-    # Create the new file content as a string
-    output = io.StringIO()
-    
-    # Write metadata
-    if metadata:
-        output.write("Property;Value\n")
-        for key, value in metadata.items():
-            output.write(f"{key};{value}\n")
-        output.write(";;\n") # Separator
-
-    # Write dataframe
-    df.to_csv(output, sep=';', index=False)
-    
     # Save to a new file
     try:
         saved_dir = os.path.join(SCRIPT_DIR, "measurements", "saved")
@@ -2904,27 +3387,28 @@ def write_csv_new(store_data, filter_range, start_block, end_block):
         hostname = metadata.get('Hostname')
         if hostname:
             # Sanitize hostname for use in a filename
-            sanitized_hostname = re.sub(r'[^\w\.\-]', '_', hostname)
+            sanitized_hostname = hostname_unsafe_chars.sub('_', hostname)
             hostname_part = f"_hostname_{sanitized_hostname}"
 
         # Sequentially remove known suffixes from the end to get the clean base name
-        base = re.sub(r'_\d+$', '', base)  # sequence number (_1)
-        base = re.sub(r'_\d{8}_\d{6}$', '', base)  # timestamp
-        base = re.sub(r'_hostname_[\w\.\-]+$', '', base) # hostname
-        base = re.sub(r'_range_\d+-\d+$', '', base) # range suffix
+        for pattern in saved_filename_suffix_patterns:
+            base = pattern.sub('', base)
 
         # Construct the new filename
         new_base_filename = f"{base}{suffix}{hostname_part}_{timestamp}"
         
-        # Find a unique filename by appending a counter if necessary
-        filepath = os.path.join(saved_dir, f"{new_base_filename}.csv")
+        # Find a unique filename by appending a counter if necessary.
+        # The directory is listed once instead of probing each candidate with a stat call.
+        with os.scandir(saved_dir) as entries:
+            existing_names = {entry.name for entry in entries}
+        candidate = f"{new_base_filename}.csv"
         counter = 1
-        while os.path.exists(filepath):
-            filepath = os.path.join(saved_dir, f"{new_base_filename}_{counter}.csv")
+        while candidate in existing_names:
+            candidate = f"{new_base_filename}_{counter}.csv"
             counter += 1
+        filepath = os.path.join(saved_dir, candidate)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(output.getvalue())
+        write_csv_file(filepath, df, metadata)
         
         return f"File with updated data saved to: {filepath}"
     except Exception as e:
@@ -2936,29 +3420,18 @@ def write_csv_overwrite(store_data, filter_range, start_block, end_block):
 
     filename = store_data.get('filename', 'unknown_file.csv')
     metadata = store_data.get('metadata', {})
-    df_json = store_data.get('data')
+    df = load_store_df(store_data)
 
-    if not df_json:
+    if df.empty:
         return f"No data content found for '{filename}'."
 
-    df = pd.read_json(io.StringIO(df_json), orient='split')
-
     timestamp_part = ""
     suffix = ""
     if filter_range and start_block is not None and end_block is not None:
-        df = df[(df['Block_height'] >= start_block) & (df['Block_height'] <= end_block)]
+        df = filter_block_range(df, start_block, end_block)
         suffix += f"_range_{int(start_block)}-{int(end_block)}"
         timestamp_part = f"_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    output = io.StringIO()
-    if metadata:
-        output.write("Property;Value\n")
-        for key, value in metadata.items():
-            output.write(f"{key};{value}\n")
-        output.write(";;\n")
-
-    df.to_csv(output, sep=';', index=False)
-
     try:
         saved_dir = os.path.join(SCRIPT_DIR, "measurements", "saved")
         os.makedirs(saved_dir, exist_ok=True)
@@ -2966,22 +3439,19 @@ def write_csv_overwrite(store_data, filter_range, start_block, end_block):
         base, ext = os.path.splitext(base_filename)
 
         # Clean up old suffixes
-        base = re.sub(r'_\d+$', '', base)
-        base = re.sub(r'_\d{8}_\d{6}$', '', base)
-        base = re.sub(r'_hostname_[\w\.\-]+$', '', base)
-        base = re.sub(r'_range_\d+-\d+$', '', base)
+        for pattern in saved_filename_suffix_patterns:
+            base = pattern.sub('', base)
 
         hostname_part = ""
         hostname = metadata.get('Hostname')
         if hostname:
-            sanitized_hostname = re.sub(r'[^\w\.\-]', '_', hostname)
+            sanitized_hostname = hostname_unsafe_chars.sub('_', hostname)
             hostname_part = f"_hostname_{sanitized_hostname}"
 
         new_filename = f"{base}{suffix}{hostname_part}{timestamp_part}.csv"
         filepath = os.path.join(saved_dir, new_filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(output.getvalue())
+        write_csv_file(filepath, df, metadata)
         
         return f"File saved to: {filepath}"
     except Exception as e:
@@ -2995,13 +3465,15 @@ def write_csv_overwrite(store_data, filter_range, start_block, end_block):
      Input({'type': 'save-overwrite-button', 'prefix': dash.dependencies.ALL}, 'n_clicks')],
     [State('original-data-store', 'data'),
      State('compare-data-store', 'data'),
+     State('original-metadata-store', 'data'),
+     State('compare-metadata-store', 'data'),
      State({'type': 'save-filter-range-check', 'prefix': dash.dependencies.ALL}, 'value'),
      State({'type': 'start-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
      State({'type': 'end-block-dropdown', 'prefix': dash.dependencies.ALL}, 'value'),
      State('unsaved-changes-store', 'data')],
     prevent_initial_call=True
 )
-def save_csv(n_clicks_as, n_clicks_overwrite, original_data, compare_data, filter_range_values, start_block_vals, end_block_vals, unsaved_data): # type: ignore
+def save_csv(n_clicks_as, n_clicks_overwrite, original_data, compare_data, original_metadata, compare_metadata, filter_range_values, start_block_vals, end_block_vals, unsaved_data): # type: ignore
     triggered_id = dash.callback_context.triggered_id
     if not triggered_id or not (any(n_clicks_as) or any(n_clicks_overwrite)):
         raise dash.exceptions.PreventUpdate
@@ -3010,7 +3482,7 @@ def save_csv(n_clicks_as, n_clicks_overwrite, original_data, compare_data, filte
     save_as = triggered_id['type'] == 'save-as-button'
 
     filter_range = False
-    for i, comp_id in enumerate(dash.callback_context.states_list[2]): # type: ignore
+    for i, comp_id in enumerate(dash.callback_context.states_list[4]): # type: ignore
         if comp_id['id']['prefix'] == prefix:
             filter_range = bool(filter_range_values[i])
             break
@@ -3019,13 +3491,13 @@ def save_csv(n_clicks_as, n_clicks_overwrite, original_data, compare_data, filte
     end_block = None
 
     # Find the correct start and end block values from the lists based on the triggered prefix
-    start_block_states = dash.callback_context.states_list[3]
+    start_block_states = dash.callback_context.states_list[5]
     for i, state in enumerate(start_block_states):
         if state['id']['prefix'] == prefix:
             start_block = start_block_vals[i]
             break
 
-    end_block_states = dash.callback_context.states_list[4]
+    end_block_states = dash.callback_context.states_list[6]
     for i, state in enumerate(end_block_states):
         if state['id']['prefix'] == prefix:
             end_block = end_block_vals[i]
@@ -3033,6 +3505,9 @@ def save_csv(n_clicks_as, n_clicks_overwrite, original_data, compare_data, filte
 
     message = "An unknown error occurred."
     data_to_save = original_data if prefix == 'Original' else compare_data
+    if data_to_save:
+        # The file is written with the edited metadata
+        data_to_save = {**data_to_save, 'metadata': (original_metadata if prefix == 'Original' else compare_metadata) or {}}
 
     upload_id_to_reset = None
 
@@ -3072,18 +3547,114 @@ def switch_theme(is_dark):
         return 'dark', dbc.themes.DARKLY
     return 'light', dbc.themes.BOOTSTRAP
 
+# --- Controls Card Buttons ---
+# (label, pattern-id type, color, className); the label doubles as the info-icon metric name
+view_button_specs = (
+    ("Reset View", 'reset-view-button', "secondary", "me-2"),
+    ("Clear CSV", 'clear-csv-button', "warning", "me-2"),
+)
+save_button_specs = (
+    ("Save", 'save-overwrite-button', "primary", "me-1"),
+    ("Save As...", 'save-as-button', "success", "me-1"),
+)
+
+@lru_cache(maxsize=None)
+def create_controls_card(title_prefix):
+    """Builds the block range, add-metadata and save controls card of one side.
+
+    The card depends only on its prefix, so each side's card is built once and reused.
+    """
+    list_group_items = []
+    # Add block selectors
+    start_block_selector = dbc.ListGroupItem(
+        [
+            html.Div([
+                html.B("Start Block Height:"),
+                info_icon(f'{title_prefix}-Start Block Height', margin_left='5px')
+            ], style={'display': 'flex', 'alignItems': 'center'}),
+            html.Div(dcc.Dropdown(id={'type': 'start-block-dropdown', 'prefix': title_prefix}, clearable=False, placeholder="Select start block"), style={'width': '50%'})
+        ],
+        className="d-flex justify-content-between align-items-center p-2"
+    )
+    list_group_items.append(start_block_selector)
+
+    end_block_selector = dbc.ListGroupItem(
+        [
+            html.Div([
+                html.B("End Block Height:"),
+                info_icon(f'{title_prefix}-End Block Height', margin_left='5px')
+            ], style={'display': 'flex', 'alignItems': 'center'}),
+            html.Div(dcc.Dropdown(id={'type': 'end-block-dropdown', 'prefix': title_prefix}, clearable=False, placeholder="Select end block"), style={'width': '50%'})
+        ],
+        className="d-flex justify-content-between align-items-center p-2"
+    )
+    list_group_items.append(end_block_selector)
+    # --- New UI elements for adding metadata ---
+    add_metadata_form = dbc.ListGroupItem([
+        dbc.Row([
+            dbc.Col(dbc.Input(id={'type': 'metadata-key-input', 'prefix': title_prefix}, placeholder='New Property', type='text', size='sm'), width=4),
+            dbc.Col(dbc.Input(id={'type': 'metadata-value-input', 'prefix': title_prefix}, placeholder='Value', type='text', size='sm'), width=4),
+            dbc.Col(
+                html.Div([
+                    dbc.Button("Add", id={'type': 'add-metadata-button', 'prefix': title_prefix}, color="primary", size="sm", className="w-100"),
+                    info_icon(f'{title_prefix}-Add Metadata', margin_left='5px')
+                ], className="d-flex align-items-center"), width=4)
+        ], align="center", className="g-2") # g-2 for gutter
+    ], className="p-2")
+
+    list_group_items.append(add_metadata_form)
+    def toolbar_buttons(specs):
+        # Each button is followed by its info icon, with a divider between the buttons
+        items = []
+        for label, button_type, color, class_name in specs:
+            if items:
+                items.append(html.Div("|", className="text-muted mx-2"))
+            items.append(dbc.Button(label, id={'type': button_type, 'prefix': title_prefix}, color=color, size="sm", className=class_name))
+            items.append(info_icon(f'{title_prefix}-{label}'))
+        return items
+
+    controls_bar = dbc.ListGroupItem([
+        dbc.Row([
+            # Left side: View and Clear controls
+            dbc.Col(toolbar_buttons(view_button_specs), width="auto", className="d-flex align-items-center"),
+            # Right side: Save controls
+            dbc.Col([
+                dcc.Checklist(
+                    options=[{'label': ' Filter range', 'value': 'filter'}],
+                    value=[],
+                    id={'type': 'save-filter-range-check', 'prefix': title_prefix},
+                    inline=True,
+                    className="me-1 custom-checklist"
+                ),
+                info_icon(f'{title_prefix}-Save Filtered Range'),
+                html.Div("|", className="text-muted mx-2"),
+                *toolbar_buttons(save_button_specs),
+            ], width="auto", className="d-flex align-items-center justify-content-end")
+        ], align="center", justify="between")
+    ], className="p-2")
+    list_group_items.append(controls_bar)
+
+    card_body = dbc.ListGroup(list_group_items, flush=True)
+    return dbc.Card(card_body, className="mt-3")
+
 @app.callback( # type: ignore
     [Output('original-metadata-display', 'children'),
-     Output('original-metadata-display', 'style'),
      Output('compare-metadata-display', 'children'),
-     Output('compare-metadata-display', 'style')],
+     Output('metadata-display-key-store', 'data')],
     [Input('original-data-store', 'data'),
-     Input('compare-data-store', 'data')])
-def update_metadata_display(original_data, compare_data):
+     Input('compare-data-store', 'data')],
+    State('metadata-display-key-store', 'data'))
+def update_metadata_display(original_data, compare_data, displayed_key):
+    # The cards only depend on which files are loaded; the metadata rows are rendered clientside.
+    # Skip re-rendering them when the filenames did not change, e.g. when a CSV is cleared.
+    # The last rendered filenames live in a per-page store, so every tab tracks its own cards.
+    display_key = [data.get('filename') if data else None for data in (original_data, compare_data)]
+    if dash.callback_context.triggered_id is not None and display_key == displayed_key:
+        return [dash.no_update] * 3
+
     def create_system_info_card(data, title_prefix):
         if not data:
             return None
-        metadata = data.get('metadata', {})
         filename = data.get('filename', 'data file')
 
         card_header = dbc.CardHeader(
@@ -3095,212 +3666,61 @@ def update_metadata_display(original_data, compare_data):
             ], align="center", justify="between")
         )
 
-        def create_metadata_item(key, value):
-            """Creates a single metadata item with label, value, and delete button."""
-            key_with_icon = [html.B(f"{key}:")]
-            if key in tooltip_texts:
-                # Make the ID unique by prefixing it with the card type (Original/Comparison)
-                unique_metric_id = f"{title_prefix}-{key}"
-                info_icon = html.Span(
-                    [html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'})],
-                    id={'type': 'info-icon', 'metric': unique_metric_id},
-                    style={'cursor': 'pointer', 'marginLeft': '5px'},
-                    title='Click for more info',
-                    n_clicks=0
-                )
-                key_with_icon.append(info_icon)
-
-            delete_button = html.Span([
-                html.I(className="bi bi-dash-circle-fill text-danger align-middle", style={'fontSize': '1.1em'}),
-            ],
-                id={'type': 'delete-metadata-button', 'prefix': title_prefix, 'key': key},
-                n_clicks=0,
-                style={'cursor': 'pointer'},
-                title='Delete item',
-                className="ms-2"
-            )
-
-            return dbc.ListGroupItem(
-                className="d-flex justify-content-between align-items-center p-2",
-                children=[
-                    # Key (label) part, prevent wrapping
-                    html.Div(key_with_icon, className="d-flex align-items-center", style={'whiteSpace': 'nowrap', 'marginRight': '10px'}),
-                    # Value (input) part, allow it to grow
-                    html.Div(
-                        className="d-flex align-items-center w-100",
-                        style={'flex-grow': 1, 'min-width': 0},
-                        children=[
-                            dbc.Input(
-                                id={'type': 'metadata-input', 'prefix': title_prefix, 'key': key},
-                                value=str(value), type='text', className="text-end text-muted", size="sm",
-                                style={'border': 'none', 'backgroundColor': 'transparent', 'boxShadow': 'none', 'padding': '0', 'margin': '0', 'height': 'auto', 'width': '100%'},
-                                debounce=True
-                            ),
-                            delete_button
-                        ]
-                    )
-                ]
-            )
-
-        # Define preferred order for display to ensure consistency
-        preferred_order = [
-            'Signum Version', 'Hostname', 'OS Name', 'OS Version', 'OS Architecture',
-            'Java Version', 'Available Processors', 'Max Memory (MB)', 'Total RAM (MB)',
-            'Database Type', 'Database Version'
-        ]
-
-        list_group_items = []
-        # Add preferred keys first, in the specified order
-        for key in preferred_order:
-            if key in metadata:
-                list_group_items.append(create_metadata_item(key, metadata[key]))
-
-        # Add any other keys that were not in the preferred list
-        for key, value in metadata.items():
-            if key not in preferred_order:
-                list_group_items.append(create_metadata_item(key, value))
-
-        card_body = dbc.ListGroup(list_group_items, flush=True) # Reverted to ListGroup
+        # The metadata rows are rendered in the browser from the metadata store (see render_metadata_rows)
+        card_body = dbc.ListGroup(id={'type': 'metadata-list', 'prefix': title_prefix}, flush=True)
         return dbc.Card([card_header, card_body])
 
-    def create_controls_card(data, title_prefix):
-        list_group_items = []
-        # Add block selectors
-        start_block_selector = dbc.ListGroupItem(
-            [
-                html.Div([
-                    html.B("Start Block Height:"),
-                    html.Span([ # type: ignore
-                        "\u00A0", html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Start Block Height'}, style={'cursor': 'pointer', 'marginLeft': '5px'}, title='Click for more info', n_clicks=0)
-                ], style={'display': 'flex', 'alignItems': 'center'}),
-                html.Div(dcc.Dropdown(id={'type': 'start-block-dropdown', 'prefix': title_prefix}, clearable=False, placeholder="Select start block"), style={'width': '50%'})
-            ],
-            className="d-flex justify-content-between align-items-center p-2"
-        )
-        list_group_items.append(start_block_selector)
-
-        end_block_selector = dbc.ListGroupItem(
-            [
-                html.Div([
-                    html.B("End Block Height:"),
-                    html.Span([ # type: ignore
-                        "\u00A0", html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-End Block Height'}, style={'cursor': 'pointer', 'marginLeft': '5px'}, title='Click for more info', n_clicks=0)
-                ], style={'display': 'flex', 'alignItems': 'center'}),
-                html.Div(dcc.Dropdown(id={'type': 'end-block-dropdown', 'prefix': title_prefix}, clearable=False, placeholder="Select end block"), style={'width': '50%'})
-            ],
-            className="d-flex justify-content-between align-items-center p-2"
-        )
-        list_group_items.append(end_block_selector)
-        # --- New UI elements for adding metadata ---
-        add_metadata_form = dbc.ListGroupItem([
-            dbc.Row([
-                dbc.Col(dbc.Input(id={'type': 'metadata-key-input', 'prefix': title_prefix}, placeholder='New Property', type='text', size='sm'), width=4),
-                dbc.Col(dbc.Input(id={'type': 'metadata-value-input', 'prefix': title_prefix}, placeholder='Value', type='text', size='sm'), width=4),
-                dbc.Col(
-                    html.Div([
-                        dbc.Button("Add", id={'type': 'add-metadata-button', 'prefix': title_prefix}, color="primary", size="sm", className="w-100"),
-                        html.Span([ # type: ignore
-                            "\u00A0", html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                        ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Add Metadata'}, style={'cursor': 'pointer', 'marginLeft': '5px'}, title='Click for more info', n_clicks=0)
-                    ], className="d-flex align-items-center"), width=4)
-            ], align="center", className="g-2") # g-2 for gutter
-        ], className="p-2")
-
-        list_group_items.append(add_metadata_form)
-        controls_bar = dbc.ListGroupItem([
-            dbc.Row([
-                # Left side: View and Clear controls
-                dbc.Col([
-                    dbc.Button("Reset View", id={'type': 'reset-view-button', 'prefix': title_prefix}, color="secondary", size="sm", className="me-2"),
-                    html.Span([ # type: ignore
-                        "\u00A0",
-                        html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Reset View'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0), # type: ignore
-                    html.Div("|", className="text-muted mx-2"),
-                    dbc.Button("Clear CSV", id={'type': 'clear-csv-button', 'prefix': title_prefix}, color="warning", size="sm", className="me-2"),
-                    html.Span([ # type: ignore
-                        "\u00A0",
-                        html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Clear CSV'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0), # type: ignore
-                ], width="auto", className="d-flex align-items-center"),
-                # Right side: Save controls
-                dbc.Col([
-                    dcc.Checklist(
-                        options=[{'label': ' Filter range', 'value': 'filter'}],
-                        value=[],
-                        id={'type': 'save-filter-range-check', 'prefix': title_prefix},
-                        inline=True,
-                        className="me-1 custom-checklist"
-                    ),
-                    html.Span([ # type: ignore
-                        "\u00A0",
-                        html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Save Filtered Range'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0), # type: ignore
-                    html.Div("|", className="text-muted mx-2"),
-                    dbc.Button("Save", id={'type': 'save-overwrite-button', 'prefix': title_prefix}, size="sm", color="primary", className="me-1"),
-                    html.Span([ # type: ignore
-                        "\u00A0",
-                        html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Save'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0), # type: ignore
-                    html.Div("|", className="text-muted mx-2"),
-                    dbc.Button("Save As...", id={'type': 'save-as-button', 'prefix': title_prefix}, size="sm", color="success", className="me-1"), # type: ignore
-                    html.Span([
-                        "\u00A0",  # Non-breaking space
-                        html.I(className="bi bi-info-circle-fill text-info align-middle", style={'fontSize': '1.1em'}),
-                    ], id={'type': 'info-icon', 'metric': f'{title_prefix}-Save As...'}, style={'cursor': 'pointer'}, title='Click for more info', n_clicks=0), # type: ignore
-                ], width="auto", className="d-flex align-items-center justify-content-end")
-            ], align="center", justify="between")
-        ], className="p-2")
-        list_group_items.append(controls_bar)
-
-        card_body = dbc.ListGroup(list_group_items, flush=True)
-        return dbc.Card(card_body, className="mt-3")
-
+    # Only mount the cards of loaded files instead of building and hiding them
     original_display = html.Div([
         create_system_info_card(original_data, "Original"),
-        create_controls_card(original_data, "Original")
-    ])
-    original_style = {'display': 'block'} if original_data else {'display': 'none'}
+        create_controls_card("Original")
+    ]) if original_data else html.Div()
 
     compare_display = html.Div([
         create_system_info_card(compare_data, "Comparison"),
-        create_controls_card(compare_data, "Comparison")
-    ])
-    compare_style = {'display': 'block'} if compare_data else {'display': 'none'}
+        create_controls_card("Comparison")
+    ]) if compare_data else html.Div()
 
-    return original_display, original_style, compare_display, compare_style
+    return original_display, compare_display, display_key
+
+# Metadata rows are built in the browser from the metadata stores, so the server only ships the
+# metadata dict instead of a serialized component tree per row
+app.clientside_callback( # type: ignore
+    ClientsideFunction(namespace='clientside', function_name='render_metadata_rows'),
+    Output({'type': 'metadata-list', 'prefix': dash.dependencies.ALL}, 'children'),
+    [Input('original-metadata-store', 'data'),
+     Input('compare-metadata-store', 'data')],
+    State('metadata-layout-store', 'data')
+)
 
 @app.callback(
-    [Output('original-data-store', 'data', allow_duplicate=True),
-     Output('compare-data-store', 'data', allow_duplicate=True),
+    [Output('original-metadata-store', 'data', allow_duplicate=True),
+     Output('compare-metadata-store', 'data', allow_duplicate=True),
      Output('unsaved-changes-store', 'data', allow_duplicate=True)],
-    [Input({'type': 'delete-metadata-button', 'prefix': dash.dependencies.ALL, 'key': dash.dependencies.ALL}, 'n_clicks')],
-    [State('original-data-store', 'data'),
-     State('compare-data-store', 'data'),
+    Input('delete-request-store', 'data'),
+    [State('original-metadata-store', 'data'),
+     State('compare-metadata-store', 'data'),
      State('unsaved-changes-store', 'data')],
     prevent_initial_call=True
 )
-def delete_metadata_item(n_clicks, original_data, compare_data, unsaved_data):
-    ctx = dash.callback_context
-    if not ctx.triggered or not any(n['value'] for n in ctx.triggered if n['value'] is not None):
+def delete_metadata_item(delete_request, original_metadata, compare_metadata, unsaved_data):
+    # Delete clicks are picked up by one delegated listener in the browser, which writes the request here
+    if not delete_request:
         raise dash.exceptions.PreventUpdate
 
-    triggered_id = ctx.triggered_id
-    prefix = triggered_id['prefix']
-    key_to_delete = triggered_id['key']
+    prefix = delete_request.get('prefix')
+    key_to_delete = delete_request.get('key')
 
-    if prefix == 'Original' and original_data and 'metadata' in original_data:
-        if key_to_delete in original_data['metadata']:
-            del original_data['metadata'][key_to_delete]
+    if prefix == 'Original' and original_metadata:
+        if key_to_delete in original_metadata:
+            del original_metadata[key_to_delete]
             unsaved_data['Original'] = True
-            return original_data, dash.no_update, unsaved_data
-    elif prefix == 'Comparison' and compare_data and 'metadata' in compare_data:
-        if key_to_delete in compare_data['metadata']:
-            del compare_data['metadata'][key_to_delete]
+            return original_metadata, dash.no_update, unsaved_data
+    elif prefix == 'Comparison' and compare_metadata:
+        if key_to_delete in compare_metadata:
+            del compare_metadata[key_to_delete]
             unsaved_data['Comparison'] = True
-            return dash.no_update, compare_data, unsaved_data
+            return dash.no_update, compare_metadata, unsaved_data
 
     raise dash.exceptions.PreventUpdate
 
@@ -3315,7 +3735,8 @@ app.clientside_callback( # type: ignore
 # --- Callback for saving HTML report ---
 app.clientside_callback( # type: ignore
     dash.ClientsideFunction(namespace='clientside', function_name='report_generator'),
-    Output('html-content-store', 'data', allow_duplicate=True),
+    [Output('action-feedback-store', 'data', allow_duplicate=True),
+     Output('reports-filepath-store', 'data', allow_duplicate=True)],
     Input('save-button', 'n_clicks'),
     [State('ma-window-slider-1', 'value'),
      State('distribution-bins-slider-1', 'value'),
@@ -3328,34 +3749,52 @@ app.clientside_callback( # type: ignore
     prevent_initial_call=True
 )
 
-@app.callback(
-    [Output('action-feedback-store', 'data', allow_duplicate=True),
-     Output('reports-filepath-store', 'data', allow_duplicate=True)], # type: ignore
-    [Input('html-content-store', 'data'),
-     Input('clientside-script-store', 'data')],
-    prevent_initial_call=True
-)
-def save_report_on_server(data, script_loaded):
-    if not data or not script_loaded:
-        if data and 'CLIENTSIDE_ERROR' in data.get('content', ''):
-            return {'title': 'Error Saving Reports', 'body': "A client-side error occurred during report generation."}, None
-        raise dash.exceptions.PreventUpdate
-    html_content = data
-    # --- Replace MA slider placeholder in the generated HTML ---
-    # The clientside callback no longer does this, so we do it here on the server.
-    # Generate a dynamic filename with timestamp
+# Reports embed their CSS and PNG graphs and are typically a few MB; anything far larger is rejected
+max_report_bytes = 200 * 1024 * 1024
+
+# Report files still being written in the background, and writes that failed (error message), by path
+pending_report_writes = {}
+failed_report_writes = {}
+
+def write_report_file(filepath, content):
+    try:
+        with open(filepath, "wb") as f:
+            f.write(content)
+    except Exception as e:
+        print(f"Error writing report file {filepath}: {e}")
+        traceback.print_exc()
+        failed_report_writes[filepath] = str(e)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+    finally:
+        pending_report_writes.pop(filepath, None)
+
+@app.server.route('/_save_report', methods=['POST'])
+def save_report_on_server():
+    """Stores the HTML report posted by the report generator in the reports folder.
+
+    The path is returned right away; the file itself is written on a background thread.
+    """
+    # Only the app's own pages may post reports (browsers always send Origin on cross-site POSTs)
+    origin = request.headers.get('Origin')
+    if origin and origin.rstrip('/') != request.host_url.rstrip('/'):
+        return jsonify(error="Reports can only be saved from the analyzer page."), 403
+    if request.content_length is None:
+        return jsonify(error="The report size is unknown (missing Content-Length)."), 411
+    if request.content_length > max_report_bytes:
+        return jsonify(error=f"The report is larger than {max_report_bytes // (1024 * 1024)} MB."), 413
+    # Generate a dynamic filename with timestamp; the random suffix keeps saves within the same second apart
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    html_content = data.get('content')
-    filename = f"sync_progress_reports_{timestamp}.html"
+    filepath = os.path.join(REPORTS_DIR, f"sync_progress_reports_{timestamp}_{uuid.uuid4().hex[:8]}.html")
     try:
-        reports_dir = os.path.join(SCRIPT_DIR, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
-        filepath = os.path.join(reports_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html_content)
-            return {'title': 'Reports Saved', 'body': f"Reports successfully saved to: {filepath}"}, filepath
+        writer = threading.Thread(target=write_report_file, args=(filepath, request.get_data()), daemon=True)
+        pending_report_writes[filepath] = writer
+        writer.start()
+        return jsonify(filepath=filepath)
     except Exception as e:
-            return {'title': 'Error Saving Reports', 'body': f"An error occurred while saving the file on the server: {e}"}, None
+        pending_report_writes.pop(filepath, None)
+        traceback.print_exc()
+        return jsonify(error=str(e)), 500
 
 app.clientside_callback(
     dash.ClientsideFunction(namespace='clientside', function_name='clientside_script_loaded'), # type: ignore
@@ -3363,21 +3802,25 @@ app.clientside_callback(
     Input('main-container', 'children') # Triggered once the layout is loaded
 )
 
-@app.callback(
+@app.server.route('/_reports/<path:filename>')
+def serve_report(filename):
+    """Serves a saved HTML report so the browser can open it in a new tab."""
+    # The report may still be being written if it was opened right after saving
+    filepath = os.path.join(REPORTS_DIR, filename)
+    writer = pending_report_writes.get(filepath)
+    if writer is not None:
+        writer.join()
+    if filepath in failed_report_writes:
+        return f"The report could not be written: {failed_report_writes[filepath]}", 500
+    return send_from_directory(REPORTS_DIR, filename)
+
+app.clientside_callback( # type: ignore
+    ClientsideFunction(namespace='clientside', function_name='open_report'),
     Output('reports-filepath-store', 'data', allow_duplicate=True),
     Input('open-report-button', 'n_clicks'),
     State('reports-filepath-store', 'data'),
     prevent_initial_call=True
 )
-def open_report_in_browser(n_clicks, filepath):
-    if not n_clicks or not filepath:
-        raise dash.exceptions.PreventUpdate
-    try:
-        webbrowser.open(f'file://{os.path.realpath(filepath)}')
-    except Exception as e:
-        print(f"Could not open report file: {e}")
-        traceback.print_exc()
-    return dash.no_update
 
 app.clientside_callback(
     ClientsideFunction(namespace='clientside', function_name='sync_sliders'),
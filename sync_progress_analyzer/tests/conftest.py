@@ -0,0 +1,38 @@
+"""Shared fixtures: the app module imported once, without its startup pip upgrade."""
+import base64
+import importlib
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_CSV = (
+    "Property;Value\n"
+    "Hostname;test-node\n"
+    ";;\n"
+    "Block_height;Block_timestamp;Accumulated_sync_in_progress_time[s]\n"
+    + "".join(f"{h};{1_600_000_000 + h};{h * 0.5 + (h % 7)}\n" for h in range(1, 401))
+)
+
+
+@pytest.fixture(scope="session")
+def spa(monkeypatch_session):
+    # The module upgrades its dependencies with pip on import; skip that in tests
+    monkeypatch_session.setattr(subprocess, "run", lambda *args, **kwargs: types.SimpleNamespace(returncode=0, stdout="", stderr=""))
+    return importlib.import_module("sync_progress_analyzer")
+
+
+@pytest.fixture(scope="session")
+def monkeypatch_session():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+@pytest.fixture(scope="session")
+def original_store(spa):
+    contents = "data:text/csv;base64," + base64.b64encode(SAMPLE_CSV.encode("utf-8")).decode("ascii")
+    return spa.parse_upload(contents, "sync_progress.csv")
@@ -0,0 +1,113 @@
+"""Drives the main graph callback through Dash's HTTP endpoint, as the browser does."""
+import json
+
+import pytest
+
+
+def graph_callback_key(app):
+    return next(key for key in app.callback_map if key.startswith("..progress-graph.figure..."))
+
+
+def post_graph_update(spa, original_store, changed_prop, theme="dark", compare_store=None, show_table=False, active_page=1):
+    """Posts one update of the main graph callback with the Original card mounted."""
+    app = spa.app
+    key = graph_callback_key(app)
+    callback = app.callback_map[key]
+
+    def wildcard(component_type, prop, value=None, with_value=True):
+        item = {"id": {"type": component_type, "prefix": "Original"}, "property": prop}
+        if with_value:
+            item["value"] = value
+        return [item]
+
+    values = {
+        "ma-window-slider-1.value": 1,
+        "distribution-bins-slider-1.value": 1,
+        "original-data-store.data": original_store,
+        "compare-data-store.data": compare_store,
+        "show-data-table-switch.value": show_table,
+        "theme-store.data": theme,
+        "raw-table-pagination.active_page": active_page,
+    }
+    inputs = []
+    for spec in callback["inputs"]:
+        if spec["id"].startswith("{"):
+            component_type = json.loads(spec["id"])["type"]
+            value = {"start-block-dropdown": 1, "end-block-dropdown": 400}.get(component_type)
+            inputs.append(wildcard(component_type, spec["property"], value))
+        else:
+            inputs.append({**spec, "value": values[f"{spec['id']}.{spec['property']}"]})
+
+    outputs = []
+    for output in key[2:-2].split("..."):
+        component_id, prop = output.rsplit(".", 1)
+        if component_id.startswith("{"):
+            outputs.append(wildcard(json.loads(component_id)["type"], prop, with_value=False))
+        else:
+            outputs.append({"id": component_id, "property": prop})
+
+    payload = {"output": key, "outputs": outputs, "inputs": inputs, "state": [], "changedPropIds": [changed_prop]}
+    return app.server.test_client().post("/_dash-update-component", json=payload)
+
+
+@pytest.mark.parametrize("changed_prop", ["ma-window-slider-1.value", "distribution-bins-slider-1.value"])
+def test_slider_updates_return_partial_outputs(spa, original_store, changed_prop):
+    response = post_graph_update(spa, original_store, changed_prop)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    updated = response.get_json()["response"]
+    # The block range dropdowns are left untouched
+    assert not any("dropdown" in component_id for component_id in updated)
+
+
+def test_theme_change_only_updates_figures(spa, original_store):
+    response = post_graph_update(spa, original_store, "theme-store.data", theme="light")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    updated = response.get_json()["response"]
+    assert updated["progress-graph"]["figure"]["layout"]["template"]["layout"]["paper_bgcolor"] == "white"
+    assert not any("dropdown" in component_id for component_id in updated)
+
+
+def table_body_rows(table_children):
+    """Returns the cell texts of each body row of the rendered raw data table."""
+    scroll_div = table_children[-1]
+    body_table = scroll_div["props"]["children"][1]
+    tbody = body_table["props"]["children"][1]
+    return [
+        [cell["props"]["children"][0] if isinstance(cell["props"]["children"], list) else cell["props"]["children"]
+         for cell in row["props"]["children"]]
+        for row in tbody["props"]["children"]
+    ]
+
+
+@pytest.mark.parametrize("compare", [False, True])
+def test_table_formats_sync_time_of_the_active_page(spa, original_store, monkeypatch, compare):
+    monkeypatch.setattr(spa, "raw_table_page_size", 100)
+    spa.cache.clear()
+    response = post_graph_update(spa, original_store, "raw-table-pagination.active_page",
+                                 compare_store=original_store if compare else None, show_table=True, active_page=2)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    rows = table_body_rows(response.get_json()["response"]["data-table-container"]["children"])
+    assert len(rows) == 100
+    # Page 2 starts at block 101; its sync time and the formatted one sit side by side on each file's side
+    sync_time = 101 * 0.5 + (101 % 7)
+    assert rows[0][:3] == ["101", f"{sync_time:.2f}", spa.format_seconds(sync_time)]
+    if compare:
+        assert rows[0][4:6] == [f"{sync_time:.2f}", spa.format_seconds(sync_time)]
+
+
+def test_time_deltas_follow_the_displayed_rows(spa):
+    sync_times = [0.0, 1.0, 3.0, 6.0, 10.0]
+    unsorted = spa.process_progress_df(spa.pd.DataFrame({
+        "Block_height": [1, 5, 2, 3, 4],
+        "Accumulated_sync_in_progress_time[s]": sync_times,
+    }))
+    # Unsorted heights take the mask path; the displayed rows 0 and 2 are not neighbours in the full frame
+    masked = spa.filter_block_range(unsorted, 1, 2)
+    assert spa.displayed_time_deltas(masked).tolist() == [3.0]
+
+    ordered = spa.process_progress_df(spa.pd.DataFrame({
+        "Block_height": [1, 2, 3, 4, 5],
+        "Accumulated_sync_in_progress_time[s]": sync_times,
+    }))
+    contiguous = spa.filter_block_range(ordered, 2, 4)
+    assert spa.displayed_time_deltas(contiguous).tolist() == [2.0, 3.0]
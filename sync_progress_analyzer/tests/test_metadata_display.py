@@ -0,0 +1,37 @@
+"""The metadata cards are rebuilt per page, based on the filenames that page last rendered."""
+
+OUTPUT_KEY = "..original-metadata-display.children...compare-metadata-display.children...metadata-display-key-store.data.."
+
+
+def post_metadata_display(spa, original_store, displayed_key):
+    payload = {
+        "output": OUTPUT_KEY,
+        "outputs": [
+            {"id": "original-metadata-display", "property": "children"},
+            {"id": "compare-metadata-display", "property": "children"},
+            {"id": "metadata-display-key-store", "property": "data"},
+        ],
+        "inputs": [
+            {"id": "original-data-store", "property": "data", "value": original_store},
+            {"id": "compare-data-store", "property": "data", "value": None},
+        ],
+        "state": [{"id": "metadata-display-key-store", "property": "data", "value": displayed_key}],
+        "changedPropIds": ["original-data-store.data"],
+    }
+    return spa.app.server.test_client().post("/_dash-update-component", json=payload)
+
+
+def test_each_page_mounts_its_own_cards(spa, original_store):
+    first_tab = post_metadata_display(spa, original_store, None)
+    assert first_tab.status_code == 200
+    rendered_key = first_tab.get_json()["response"]["metadata-display-key-store"]["data"]
+    assert rendered_key == [original_store["filename"], None]
+
+    # A second tab with the same file has not rendered anything yet, so it still gets its cards
+    second_tab = post_metadata_display(spa, original_store, None)
+    assert "original-metadata-display" in second_tab.get_json()["response"]
+
+    # The same page with unchanged filenames keeps its cards
+    unchanged = post_metadata_display(spa, original_store, rendered_key)
+    assert unchanged.status_code in (200, 204)
+    assert not (unchanged.get_json(silent=True) or {}).get("response")
@@ -0,0 +1,46 @@
+"""Saving and serving HTML reports through the Flask routes."""
+import os
+
+
+def save_report(client, body=b"<html></html>"):
+    return client.post("/_save_report", data=body, headers={"Content-Type": "text/html; charset=utf-8"})
+
+
+def test_saves_in_the_same_second_get_distinct_files(spa, tmp_path, monkeypatch):
+    monkeypatch.setattr(spa, "REPORTS_DIR", str(tmp_path))
+    client = spa.app.server.test_client()
+    first, second = save_report(client, b"first"), save_report(client, b"second")
+    assert first.status_code == second.status_code == 200
+    paths = [first.get_json()["filepath"], second.get_json()["filepath"]]
+    assert paths[0] != paths[1]
+    for path, body in zip(paths, (b"first", b"second")):
+        assert client.get(f"/_reports/{os.path.basename(path)}").get_data() == body
+
+
+def test_failed_write_is_reported_when_opening(spa, tmp_path, monkeypatch):
+    monkeypatch.setattr(spa, "REPORTS_DIR", str(tmp_path / "missing"))
+    client = spa.app.server.test_client()
+    filepath = save_report(client).get_json()["filepath"]
+    response = client.get(f"/_reports/{os.path.basename(filepath)}")
+    assert response.status_code == 500
+    assert "could not be written" in response.get_data(as_text=True)
+
+
+def test_cross_origin_posts_are_rejected(spa, tmp_path, monkeypatch):
+    monkeypatch.setattr(spa, "REPORTS_DIR", str(tmp_path))
+    client = spa.app.server.test_client()
+    response = client.post("/_save_report", data=b"<html></html>", headers={"Origin": "http://evil.example"})
+    assert response.status_code == 403
+    same_origin = client.post("/_save_report", data=b"<html></html>", headers={"Origin": "http://localhost"})
+    assert same_origin.status_code == 200
+    saved = os.path.basename(same_origin.get_json()["filepath"])
+    assert client.get(f"/_reports/{saved}").status_code == 200
+    assert os.listdir(tmp_path) == [saved]
+
+
+def test_oversized_reports_are_rejected(spa, tmp_path, monkeypatch):
+    monkeypatch.setattr(spa, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(spa, "max_report_bytes", 8)
+    response = save_report(spa.app.server.test_client(), b"0123456789")
+    assert response.status_code == 413
+    assert os.listdir(tmp_path) == []